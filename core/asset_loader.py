@@ -0,0 +1,227 @@
+# core/asset_loader.py
+# Carga asíncrona de assets: pool de hilos + lista de trabajos con dependencias.
+#
+# Cada trabajo tiene dos fases:
+#   - work:     corre en el pool (lectura de disco + decodificación)
+#   - finalize: corre en el hilo principal dentro de poll() (todo lo que
+#               necesita el display o no es seguro fuera del hilo principal,
+#               p.ej. convert_alpha o pygame.mixer.init)
+# Un trabajo solo se lanza cuando todas sus dependencias terminaron.
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class LoadJob:
+    name: str
+    work: Optional[Callable[[], Any]] = None
+    deps: Tuple[str, ...] = ()
+    group: str = "game"
+    finalize: Optional[Callable[[Any], Any]] = None
+
+
+def validate_jobs(jobs: Iterable[LoadJob]) -> Dict[str, LoadJob]:
+    """Funcion pura: indexa trabajos y rechaza nombres repetidos, deps inexistentes o ciclos."""
+    table = {}
+    for job in jobs:
+        if job.name in table:
+            raise ValueError(f"Trabajo de carga repetido: '{job.name}'")
+        table[job.name] = job
+
+    for job in table.values():
+        for dep in job.deps:
+            if dep not in table:
+                raise ValueError(f"'{job.name}' depende de '{dep}', que no existe")
+
+    # Detección de ciclos (DFS con colores)
+    visiting, visited = set(), set()
+
+    def visit(name):
+        if name in visited:
+            return
+        if name in visiting:
+            raise ValueError(f"Ciclo de dependencias en '{name}'")
+        visiting.add(name)
+        for dep in table[name].deps:
+            visit(dep)
+        visiting.discard(name)
+        visited.add(name)
+
+    for name in table:
+        visit(name)
+
+    return table
+
+
+class AssetLoader:
+    """
+    Ejecuta una lista de LoadJob en un ThreadPoolExecutor respetando dependencias.
+    El hilo principal debe llamar poll() cada frame para recoger resultados.
+    """
+
+    def __init__(self, jobs, max_workers=4):
+        self.jobs = validate_jobs(jobs)
+        self.results = {}
+        self.errors = {}
+        # name -> {"work": s, "finalize": s} (para el perfil de arranque)
+        self.timings = {}
+
+        self._waiting = dict(self.jobs)   # sin lanzar todavía
+        self._running = {}                # name -> Future
+        self._done = set()
+        self._executor = None
+        self._max_workers = max_workers
+
+        self.started_at = None
+        self.finished_at = None
+
+    # ----------------------------------------------------------
+    # CICLO DE VIDA
+    # ----------------------------------------------------------
+    def start(self):
+        if self.is_done():
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="assets"
+            )
+            self.started_at = time.perf_counter()
+        self._submit_ready()
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def poll(self, budget=0.004):
+        """
+        Recoge trabajos terminados y corre su finalize en el hilo actual.
+        budget (segundos) limita el trabajo por frame para no congelar la ventana.
+        Devuelve cuántos trabajos se completaron en esta llamada.
+        """
+        if self._executor is None:
+            self.start()
+        if self._executor is None:
+            return 0
+
+        deadline = time.perf_counter() + budget
+        completed = 0
+
+        while True:
+            finished = [name for name, fut in self._running.items() if fut.done()]
+            if not finished:
+                break
+
+            for name in finished:
+                future = self._running.pop(name)
+                self._complete(name, future)
+                completed += 1
+                if time.perf_counter() >= deadline:
+                    break
+
+            self._submit_ready()
+            if time.perf_counter() >= deadline:
+                break
+
+        if self.is_done() and self.finished_at is None:
+            self.finished_at = time.perf_counter()
+            self.shutdown()
+
+        return completed
+
+    def wait(self, timeout=None):
+        """Bloquea hasta que todo termine (modo headless / tests)."""
+        limit = None if timeout is None else time.perf_counter() + timeout
+        self.start()
+        while not self.is_done():
+            self.poll(budget=1.0)
+            if limit is not None and time.perf_counter() > limit:
+                raise TimeoutError("La carga de assets no terminó a tiempo")
+            time.sleep(0.001)
+
+    # ----------------------------------------------------------
+    # CONSULTAS
+    # ----------------------------------------------------------
+    def is_done(self):
+        return len(self._done) == len(self.jobs)
+
+    def group_ready(self, group):
+        return all(name in self._done for name, job in self.jobs.items() if job.group == group)
+
+    def progress(self, group=None):
+        names = [n for n, j in self.jobs.items() if group is None or j.group == group]
+        if not names:
+            return 1.0
+        return sum(1 for n in names if n in self._done) / len(names)
+
+    def result(self, name):
+        """Resultado de un trabajo terminado; relanza su excepción si falló."""
+        if name in self.errors:
+            raise self.errors[name]
+        return self.results[name]
+
+    def time_by_prefix(self, prefix):
+        """Suma de tiempos (work + finalize) de los trabajos cuyo nombre empieza por prefix."""
+        return sum(
+            sum(t.values()) for name, t in self.timings.items() if name.startswith(prefix)
+        )
+
+    @property
+    def elapsed(self):
+        if self.started_at is None:
+            return 0.0
+        end = self.finished_at or time.perf_counter()
+        return end - self.started_at
+
+    # ----------------------------------------------------------
+    # INTERNOS
+    # ----------------------------------------------------------
+    def _submit_ready(self):
+        ready = [
+            name for name, job in self._waiting.items()
+            if all(dep in self._done for dep in job.deps)
+        ]
+        for name in ready:
+            job = self._waiting.pop(name)
+            if job.work is None:
+                # Trabajo solo de hilo principal: se resuelve en el próximo poll
+                self._running[name] = _ResolvedFuture(None)
+            else:
+                self._running[name] = self._executor.submit(self._timed_work, name, job.work)
+
+    def _timed_work(self, name, work):
+        start = time.perf_counter()
+        try:
+            return work()
+        finally:
+            self.timings.setdefault(name, {})["work"] = time.perf_counter() - start
+
+    def _complete(self, name, future):
+        job = self.jobs[name]
+        try:
+            value = future.result()
+            if job.finalize is not None:
+                start = time.perf_counter()
+                value = job.finalize(value)
+                self.timings.setdefault(name, {})["finalize"] = time.perf_counter() - start
+            self.results[name] = value
+        except Exception as e:
+            print(f"[AssetLoader] Error en '{name}': {e}")
+            self.errors[name] = e
+            self.results[name] = None
+        self._done.add(name)
+
+
+class _ResolvedFuture:
+    """Future mínimo ya resuelto (para trabajos sin fase de pool)."""
+
+    def __init__(self, value):
+        self._value = value
+
+    def done(self):
+        return True
+
+    def result(self):
+        return self._value
@@ -0,0 +1,161 @@
+# core/bots.py
+# Controladores automáticos de Pac-Man (soak tests, benchmarks, sesiones headless).
+# Entran por el MISMO camino que el teclado: Pacman.request_turn(dx, dy, name, stamp).
+# Deciden solo al cambiar de celda y usan consultas cacheadas del MazeGraph,
+# así su costo queda muy por debajo del paso de simulación.
+import time
+from abc import ABC, abstractmethod
+
+from core.renderer import TILE_SIZE
+from entities.store import FRIGHTENED_STATES, GhostState
+from levels.maze_graph import MazeGraph
+
+DIRECTION_NAMES = {(-1, 0): "left", (1, 0): "right", (0, -1): "up", (0, 1): "down"}
+
+
+class BotController(ABC):
+    name = "base"
+
+    def __init__(self):
+        self.graph = None
+        self._graph_tiles = None
+        self._last_cell = None
+        self._targets = (None, frozenset())
+        # Métricas: costo propio del bot (para no sesgar benchmarks)
+        self.decisions = 0
+        self.decision_time = 0.0
+
+    # ----------------------------------------------------------
+    # SHELL: mismo camino de entrada que el teclado
+    # ----------------------------------------------------------
+    def drive(self, game, stamp):
+        pacman = game.pacman
+        cell = (int(pacman.x // TILE_SIZE), int(pacman.y // TILE_SIZE))
+        stopped = pacman.dir_x == 0 and pacman.dir_y == 0
+        if cell == self._last_cell and not stopped:
+            return
+
+        start = time.perf_counter()
+        if self._graph_tiles is not game.level.tiles:
+            self.graph = MazeGraph.for_tiles(game.level.tiles)
+            self._graph_tiles = game.level.tiles
+
+        move = self.decide(game, cell)
+        self.decision_time += time.perf_counter() - start
+        self.decisions += 1
+        self._last_cell = cell
+
+        if move is not None:
+            dx, dy = move
+            pacman.request_turn(dx, dy, DIRECTION_NAMES[move], stamp)
+
+    def reset(self):
+        self._last_cell = None
+
+    @property
+    def mean_decision_ms(self):
+        return self.decision_time / self.decisions * 1000 if self.decisions else 0.0
+
+    # ----------------------------------------------------------
+    # NÚCLEO: cada bot decide (dx, dy) o None
+    # ----------------------------------------------------------
+    @abstractmethod
+    def decide(self, game, cell):
+        """Giro pedido en `cell`: (dx, dy), o None para seguir como va."""
+
+    def targets(self, game):
+        """(version, celdas con pellet/power-up); se reconstruye solo si algo se comió."""
+        level = game.level
+        version = level.item_revision
+        if self._targets[0] != version:
+            self._targets = (version, frozenset(level.pellets) | frozenset(level.powerups))
+        return self._targets
+
+    def nearest_item(self, game, cell):
+        version, targets = self.targets(game)
+        return self.graph.nearest(cell, targets, version)
+
+
+class GreedyPelletBot(BotController):
+    """Va siempre al pellet/power-up más cercano (BFS cacheado)."""
+
+    name = "greedy"
+
+    def decide(self, game, cell):
+        step, _ = self.nearest_item(game, cell)
+        if step is None:
+            exits = self.graph.exits(cell)
+            return (exits[0][0], exits[0][1]) if exits else None
+        return step
+
+
+class GhostAvoidBot(BotController):
+    """
+    Evalúa cada salida recorriendo el pasillo `depth` celdas por delante:
+    descarta las que acercan a un fantasma peligroso y, entre las seguras,
+    prefiere comer y acercarse al pellet más cercano.
+    """
+
+    name = "avoid"
+
+    def __init__(self, depth=8, margin=2):
+        super().__init__()
+        self.depth = depth
+        self.margin = margin
+
+    def decide(self, game, cell):
+        danger = [
+            (int(g.x // TILE_SIZE), int(g.y // TILE_SIZE))
+            for g in game.ghosts
+            if g.state not in FRIGHTENED_STATES and g.state != GhostState.EYES
+        ]
+        ghost_maps = [self.graph.distances_from(c) for c in danger]
+        greedy_step, _ = self.nearest_item(game, cell)
+        _, pellets = self.targets(game)
+
+        best, best_score = None, None
+        for dx, dy, nxt in self.graph.exits(cell):
+            score = self.score_corridor(cell, (dx, dy), ghost_maps, pellets)
+            if (dx, dy) == greedy_step:
+                score += 5
+            if best_score is None or score > best_score:
+                best, best_score = (dx, dy), score
+        return best
+
+    def score_corridor(self, cell, direction, ghost_maps, pellets):
+        """Simula avanzar por el pasillo (sigue recto; en curvas toma la única salida)."""
+        dx, dy = direction
+        score = 0
+        cur = cell
+        for step in range(1, self.depth + 1):
+            nxt = (cur[0] + dx, cur[1] + dy)
+            if not self.graph.walkable(nxt):
+                break
+            cur = nxt
+            for dist in ghost_maps:
+                d = dist.get(cur)
+                if d is not None and d <= step + self.margin:
+                    # Más cerca del fantasma que nosotros del punto: peligro
+                    return -1000 + step
+            if cur in pellets:
+                score += 10
+
+            exits = [(ex, ey) for ex, ey, _ in self.graph.exits(cur) if (ex, ey) != (-dx, -dy)]
+            if len(exits) != 1:
+                # Cruce o callejón: se corta la simulación aquí
+                break
+            dx, dy = exits[0]
+        return score
+
+
+BOTS = {
+    GreedyPelletBot.name: GreedyPelletBot,
+    GhostAvoidBot.name: GhostAvoidBot,
+}
+
+
+def make_bot(name):
+    try:
+        return BOTS[name]()
+    except KeyError:
+        raise ValueError(f"Bot desconocido '{name}' (opciones: {', '.join(BOTS)})") from None
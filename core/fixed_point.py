@@ -0,0 +1,51 @@
+# core/fixed_point.py
+# Modelo de movimiento en punto fijo: las posiciones son enteros en
+# sub-píxeles y la simulación avanza en ticks de duración fija, así que el
+# mismo input produce exactamente las mismas posiciones en cualquier proceso o
+# máquina (replays, simulación distribuida, regresiones bit a bit).
+# Funciones puras: sin pygame ni estado.
+from config import TILE_SIZE
+
+# Sub-píxeles por píxel (potencia de 2: x / SUBPIXEL es exacto en float).
+# Un mapa de 28 tiles ocupa 14336 unidades: entra en un uint16 de la red.
+SUBPIXEL = 16
+TILE = TILE_SIZE * SUBPIXEL
+
+# Tick fijo de simulación
+TICK_RATE = 60
+TICK_DT = 1.0 / TICK_RATE
+# Como mucho se simulan estos ticks por frame (si el frame tardó más, se pierde
+# tiempo de juego en vez de entrar en espiral)
+MAX_TICKS_PER_FRAME = 5
+
+
+def to_fixed(pixels):
+    return int(round(pixels * SUBPIXEL))
+
+
+def step_units(speed, dt):
+    """Velocidad en px/s -> sub-píxeles por paso (entero; dt es fijo por tick)."""
+    return int(round(speed * dt * SUBPIXEL))
+
+
+def cell_of(value):
+    return value // TILE
+
+
+def center_of(cell):
+    return cell * TILE + TILE // 2
+
+
+def next_center(value, direction):
+    """Coordenada del próximo centro de tile en `direction` (+1/-1); sobre un centro, el siguiente."""
+    center = center_of(cell_of(value))
+    if direction > 0:
+        return center if value < center else center + TILE
+    return center if value > center else center - TILE
+
+
+def approach(value, target, step):
+    """Avanza hacia target como mucho `step` unidades, sin pasarse."""
+    if value < target:
+        return min(value + step, target)
+    return max(value - step, target)
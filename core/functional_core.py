@@ -1,6 +1,7 @@
 # core/functional_core.py
 # Nucleo funcional (puro): helpers independientes de Pygame/IO
-from typing import Dict
+import math
+from typing import Dict, Tuple
 
 
 def resolve_difficulty(presets: Dict[str, Dict[str, float]], name: str, default: str = "NORMAL") -> Dict[str, float]:
@@ -14,3 +15,23 @@ def ghost_speed_for_level(difficulty: Dict[str, float], level: int) -> float:
     base = difficulty["ghost_speed"]
     growth = difficulty["ghost_speed_growth"]
     return base * (growth ** (level - 1))
+
+def swept_min_distance(a0: Tuple[float, float], a1: Tuple[float, float],
+                       b0: Tuple[float, float], b1: Tuple[float, float]) -> float:
+    """
+    Funcion pura: distancia mínima entre dos puntos que se mueven en línea
+    recta (a0 -> a1 y b0 -> b1) durante el mismo intervalo de tiempo.
+    """
+    rx, ry = a0[0] - b0[0], a0[1] - b0[1]
+    vx = (a1[0] - a0[0]) - (b1[0] - b0[0])
+    vy = (a1[1] - a0[1]) - (b1[1] - b0[1])
+    vv = vx * vx + vy * vy
+    t = 0.0 if vv == 0 else min(1.0, max(0.0, -(rx * vx + ry * vy) / vv))
+    return math.hypot(rx + vx * t, ry + vy * t)
+
+
+def substep_count(distance: float, max_step: float, limit: int = 16) -> int:
+    """Funcion pura: sub-pasos para que ningún movimiento supere max_step."""
+    if max_step <= 0:
+        return 1
+    return max(1, min(limit, math.ceil(distance / max_step)))
@@ -3,23 +3,33 @@ import os
 import pygame
 import time
 import random
+from functools import partial
 
 from difficulty import DIFFICULTY_PRESETS
 
-from powerups.speed_boost import SpeedBoost
-from powerups.time_freeze import TimeFreeze
-from powerups.score_multiplier import ScoreMultiplier
-from powerups.fright_mode import FrightMode
-
 import config
 from config import FPS, DARK_BLUE
-from core.renderer import Renderer, TILE_SIZE
-from levels.level import Level
-from entities.pacman import Pacman
-from entities.ghost import Ghost
-from ui.menu import Menu
-from ui.hud import HUD
-from core.functional_core import ghost_speed_for_level, resolve_difficulty
+from core.renderer import TILE_SIZE
+from core.render_backends import make_renderer
+from core.asset_loader import AssetLoader, LoadJob
+from core.sprite_loader import read_folder, prepare_frames, cache_folder
+from core.functional_core import ghost_speed_for_level, resolve_difficulty, substep_count
+from core.startup_profile import PROFILER
+from core.telemetry import TELEMETRY
+from core.quality import QualityGovernor, TIERS
+from core.fixed_point import MAX_TICKS_PER_FRAME, TICK_DT, TICK_RATE
+from core.replay import SessionRecorder
+from core.sampling_profiler import PROFILE_FILE, SamplingProfiler
+from entities.store import EntityStore, GhostState, FRIGHTENED_STATES, KIND_GHOST
+from core.scheduler import Scheduler
+from core.input import (
+    MENU_KEYMAP, MENU_CONFIRM_KEYS, OVERLAY_CLOSE_KEYS, DIRECTION_KEYMAP,
+    PAUSE_KEYS, RESUME_KEYS, BACK_TO_MENU_KEYS, QUIT_KEYS, QUICKSAVE_KEYS, QUICKLOAD_KEYS,
+    PROFILE_KEYS, install_event_filter, now as input_clock,
+)
+
+# Los módulos de gameplay (Level, Pacman, Ghost, power-ups, HUD) y el menú se
+# importan de forma diferida: ver import_menu_modules / import_gameplay_modules.
 
 
 class SoundManager:
@@ -30,16 +40,7 @@ class SoundManager:
 
     DEFAULT_VOLUME = 0.6
 
-    def __init__(self, base_path="assets/sounds"):
-        # Pre-initialize mixer para reducir latencia (opcional)
-        try:
-            pygame.mixer.pre_init(44100, -16, 1, 512)
-        except Exception:
-            pass
-
-        if not pygame.mixer.get_init():
-            pygame.mixer.init()
-
+    def __init__(self, base_path="assets/sounds", autoload=True):
         self.base_path = base_path
         self.sounds = {}
         # nombres esperados (agrega 'step' para caminar)
@@ -55,7 +56,20 @@ class SoundManager:
             "intro",
             "step",
         ]
-        self.load_all()
+        # Con autoload=False la carga la hace el AssetLoader (init_mixer + load por sonido)
+        if autoload:
+            self.init_mixer()
+            self.load_all()
+
+    def init_mixer(self):
+        # Pre-initialize mixer para reducir latencia (opcional)
+        try:
+            pygame.mixer.pre_init(44100, -16, 1, 512)
+        except Exception:
+            pass
+
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
 
     def _path_variants(self, name):
         # Trata de buscar .wav primero, luego .mp3
@@ -78,9 +92,11 @@ class SoundManager:
                     break
                 except Exception as e:
                     print(f"[SoundManager] Error cargando {p}: {e}")
+                    TELEMETRY.emit("sound_error", name, str(e))
         if not loaded:
             # fallback -> None (no rompe si no existe)
             print(f"[SoundManager] No se encontró sonido para '{name}' (buscado: {paths})")
+            TELEMETRY.emit("sound_error", name, "not found")
             self.sounds[name] = None
 
     def load_all(self):
@@ -96,6 +112,7 @@ class SoundManager:
                     snd.play(loops=loops)
             except Exception as e:
                 print(f"[SoundManager] Error reproducir {name}: {e}")
+                TELEMETRY.emit("sound_error", name, str(e))
 
 
     def stop(self, name):
@@ -141,99 +158,379 @@ class SoundManager:
         self.play("step")
 
 
-class Game:
-    def __init__(self):
-        # Inicialización principal
-        pygame.init()
-        # SoundManager inicializa o asegura mixer
-        self.sfx = SoundManager(base_path="assets/sounds")
+def import_menu_modules():
+    with PROFILER.measure("menu", "import"):
+        from ui.menu import Menu
+    return Menu
+
+
+def import_gameplay_modules():
+    """Primer import de todo lo que necesita una partida (medido en el perfil de arranque)."""
+    with PROFILER.measure("gameplay", "import"):
+        import levels.level
+        import levels.level_loader
+        import entities.pacman
+        import entities.ghost
+        import powerups.speed_boost
+        import powerups.time_freeze
+        import powerups.score_multiplier
+        import powerups.fright_mode
+        import ui.hud
 
-        # Ventana en modo ventana (no fullscreen) para ver controles y boton de cierre
-        self.window_size = (640, 720)
-        self.screen = pygame.display.set_mode(self.window_size, pygame.RESIZABLE)
-        pygame.display.set_caption("Pac-Man")
+
+class Game:
+    LEVEL_FILE = "levels/maps/level1.json"
+    # Máximo recorrido por sub-paso (fracción de tile): con fantasmas muy
+    # rápidos, frames lentos o ticks fijos bajos el paso se divide
+    MAX_STEP_FRACTION = 0.25
+    # Duración de la secuencia de muerte (estado DYING), en ticks de simulación
+    DEATH_TICKS = round(0.7 * TICK_RATE)
+    # Tamaño provisional de la surface interna mientras el mapa aún no se parsea
+    LOADING_SURFACE_SIZE = (28 * TILE_SIZE, 29 * TILE_SIZE)
+
+    def __init__(self, startup_profile=False, bot=None, pipelined=False, high_scores=None, quality="auto",
+                 level_file=None, profile=None, renderer="pygame", swarm=0, pixel_tile=TILE_SIZE,
+                 difficulty="NORMAL"):
+        # Solo el subsistema de video: fuentes, audio y gameplay se inicializan
+        # cuando el menú o la partida los necesitan por primera vez.
+        with PROFILER.measure("display", "init"):
+            pygame.display.init()
+
+            # Ventana en modo ventana (no fullscreen) para ver controles y boton de cierre.
+            # Se abre ANTES de cargar assets para mostrar la pantalla de carga de inmediato.
+            self.window_size = (640, 720)
+            self.screen = pygame.display.set_mode(self.window_size, pygame.RESIZABLE)
+            pygame.display.set_caption("Pac-Man")
+            install_event_filter()
+
+        self.startup_profile = startup_profile
+        # Backend de dibujo (core.render_backends): pygame, null, ascii, recording
+        self.renderer_name = renderer
+        # Tamaño de tile al que se dibuja (--pixel-tile): menor a TILE_SIZE =
+        # surface interna más chica, ampliada a la ventana por un entero
+        # (None = resolución completa)
+        self.pixel_tile = pixel_tile or TILE_SIZE
+        # Mapa de la partida (--level); en modo --dev se recarga al editarlo
+        self.level_file = level_file or self.LEVEL_FILE
+        self.level_watcher = None
+        # Perfilador por muestreo: corre toda la sesión con --profile o entre
+        # dos pulsaciones de F8; cada captura se escribe en profile_path
+        self.profiler = SamplingProfiler()
+        self.profile_path = profile or PROFILE_FILE
+        self.profile_on_start = profile is not None
+        # Controlador automático opcional (core.bots); entra por request_turn como el teclado
+        self.bot = bot
 
         self.clock = pygame.time.Clock()
         self._running = False
 
         self.dt = 0.0
         self.last_time = time.perf_counter()
+        # Tiempo de frame aún no simulado (la simulación corre en ticks fijos)
+        self._sim_time = 0.0
+        # Ticks simulados en la partida actual y semilla del RNG de la partida
+        self.sim_tick = 0
+        self.session_seed = 0
+        # Grabador/reproductor de partidas (core.replay); None = nada
+        self.session = None
+        # Ticks transcurridos de la secuencia de muerte (estado DYING)
+        self.dying_ticks = 0
 
         # Estado
-        self.state = "MENU"   # MENU, GAME, PAUSE, GAME_OVER, VICTORY
+        self.state = "LOADING"   # LOADING, MENU, GAME, PAUSE, GAME_OVER, VICTORY
+        # Dificultad elegida en el menú mientras el juego aún cargaba
+        self.pending_difficulty = None
 
         # Dificultad default
         self.difficulty = DIFFICULTY_PRESETS["NORMAL"]
+        self.difficulty_name = "NORMAL"
+        # Dificultad con la que arranca la próxima partida (--difficulty o la
+        # opción "Dificultad" del menú)
+        self.start_difficulty = difficulty
+        # Récords persistentes (core.highscores.HighScoreStore); None = no se guardan
+        self.high_scores = high_scores
         self.current_level = 1
 
-        self.menu = Menu()
-        self.hud = HUD()
+        self.menu = None
+        self.hud = None
         self.menu_overlay = None
 
         self.ghost_combo = 0
+        # Último quick-save (core.savestate.SaveState)
+        self.saved_state = None
+
+        # Mundo (se construye cuando terminan los assets de juego).
+        # Estado de entidades en arrays tipados compartidos (struct-of-arrays)
+        self.entity_store = EntityStore()
+        # Reloj de simulación: expiración de power-ups y timers de fantasmas
+        self.scheduler = Scheduler()
+        self.level = None
+        self.pacman = None
+        self.ghosts = []
+        # Modo enjambre (--swarm N): N fantasmas en entities.swarm.Swarm en vez
+        # de los Ghost de los spawns del mapa
+        self.swarm_size = swarm
+        self.swarm = None
+        self.ghost_colors = ["red", "pink", "blue", "orange"]
+        # IA compartida por los fantasmas (solo si la dificultad la pide)
+        self._ghost_ais = {}
+
+        # Surface interna provisional (pantalla de carga y menú)
+        self.game_surface = self.new_game_surface(self.LOADING_SURFACE_SIZE)
+        self.renderer = make_renderer(self.renderer_name, self.game_surface, self.pixel_tile)
+        self.loading_font = None
+
+        # Calidad de dibujo: "auto" = la ajusta el gobernador según el tiempo
+        # de frame; un nombre de TIERS la deja fija
+        self.quality = QualityGovernor()
+        if quality != "auto":
+            self.quality.index = [tier.name for tier in TIERS].index(quality)
+            self.quality.adaptive = False
+
+        # Modo pipeline: un hilo escala el frame N mientras aquí se simula el
+        # N+1 (doble buffer: game_surface <-> _back_surface). Blit y flip
+        # quedan en este hilo
+        self.presenter = None
+        self._back_surface = None
+        if pipelined:
+            from core.render_pipeline import FramePresenter
+
+            self.presenter = FramePresenter(self.scale_frame)
+
+        # SoundManager: el mixer y cada sonido se cargan como trabajos del pool
+        self.sfx = SoundManager(base_path="assets/sounds", autoload=False)
+
+        # Dos fases de carga: primero lo del menú; lo de la partida se pide
+        # después del primer frame del menú (o al iniciar partida).
+        self.menu_loader = AssetLoader(self.build_menu_jobs())
+        self.menu_loader.start()
+        self.game_loader = None
+
+        # Variables para sonido de pasos
+        # lleva la posición previa de pacman para detectar movimiento
+        self._prev_pacman_pos = (0.0, 0.0)
+        # temporizador para espaciar pasos (segundos). Ajusta para ritmo.
+        self.step_interval = 0.12
+        self._step_timer = 0.0
+
+    # ================================================================
+    # CARGA ASÍNCRONA DE ASSETS
+    # ================================================================
+    def build_menu_jobs(self):
+        """menu: fuentes (init en hilo principal + escaneo del sistema en el pool) y el menú."""
+        jobs = [
+            LoadJob("font", finalize=lambda _: self._init_fonts(), group="menu"),
+            # Escanear fuentes del sistema es lento (fc-list); se hace en el pool
+            LoadJob("fonts", work=pygame.font.get_fonts, group="menu"),
+            LoadJob("menu", work=import_menu_modules, finalize=lambda menu_cls: menu_cls(),
+                    deps=("font",), group="menu"),
+        ]
+        if self.high_scores is not None:
+            # Lectura de SQLite en el pool: el menú después solo lee el cache
+            jobs.append(LoadJob("highscores", work=self.high_scores.load, group="menu"))
+        return jobs
+
+    def build_game_jobs(self):
+        """game: mixer -> sonidos, carpetas de sprites, nivel."""
+        from levels.level_loader import load_level_file
+        from entities.pacman import sprite_folders as pacman_sprite_folders
+        from entities.ghost import sprite_folders as ghost_sprite_folders
+
+        jobs = [
+            LoadJob("mixer", finalize=lambda _: self.sfx.init_mixer()),
+            LoadJob("level", work=partial(load_level_file, self.level_file)),
+        ]
+
+        for name in self.sfx.expected:
+            jobs.append(LoadJob(f"sound:{name}", work=partial(self.sfx.load, name), deps=("mixer",)))
+
+        folders = list(pacman_sprite_folders())
+        for color in self.ghost_colors:
+            folders.extend(f for f in ghost_sprite_folders(color) if f not in folders)
+
+        for folder in folders:
+            jobs.append(LoadJob(
+                f"sprites:{folder}",
+                work=partial(read_folder, folder),
+                finalize=partial(self._finalize_sprites, folder),
+            ))
+
+        return jobs
 
-        # Cargar nivel
-        self.level = Level("levels/maps/level1.json", game=self)
+    def _init_fonts(self):
+        pygame.font.init()
+        self.loading_font = pygame.font.Font(None, 36)
+
+    def _finalize_sprites(self, folder, images):
+        return cache_folder(folder, TILE_SIZE, prepare_frames(images, TILE_SIZE))
+
+    @property
+    def loader(self):
+        """Carga activa (la que se muestra en la pantalla de carga)."""
+        return self.menu_loader or self.game_loader
+
+    def request_game_assets(self):
+        """Arranca la carga de la partida en segundo plano (idempotente)."""
+        if self.game_loader is not None or self.level is not None:
+            return
+        import_gameplay_modules()
+        self.game_loader = AssetLoader(self.build_game_jobs())
+        self.game_loader.start()
+
+    def poll_loading(self):
+        """Avanza la carga (hilo principal) y cambia de estado según lo que ya está listo."""
+        if self.menu_loader is not None:
+            self.menu_loader.poll()
+            if self.menu_loader.is_done():
+                self.menu = self.menu_loader.result("menu")
+                self.menu.high_scores = self.high_scores
+                self.menu.difficulty = self.start_difficulty
+                PROFILER.record("fonts", "init", self.menu_loader.time_by_prefix("font"))
+                # "menu" en el pool es el import (ya medido); aquí solo la construcción
+                PROFILER.record("menu", "init", self.menu_loader.timings["menu"].get("finalize", 0.0))
+                self.menu_loader = None
+
+        if self.state == "LOADING" and self.pending_difficulty is None and self.menu is not None:
+            self.state = "MENU"
+
+        if self.game_loader is not None:
+            self.game_loader.poll()
+            if self.game_loader.is_done():
+                self._record_game_load_profile(self.game_loader)
+                with PROFILER.measure("gameplay", "init"):
+                    self.build_world(self.game_loader.result("level"))
+                self.game_loader = None
+                PROFILER.milestone("game assets ready")
+
+                if self.pending_difficulty is not None:
+                    name, self.pending_difficulty = self.pending_difficulty, None
+                    self.start_game_with_difficulty(name)
+
+    def _record_game_load_profile(self, loader):
+        PROFILER.record("audio", "init", loader.time_by_prefix("mixer") + loader.time_by_prefix("sound:"))
+        PROFILER.record("sprites", "init", loader.time_by_prefix("sprites:"))
+        PROFILER.record("level", "init", loader.time_by_prefix("level"))
+
+    def build_world(self, level_data):
+        from levels.level import Level
+        from entities.pacman import Pacman
+        from ui.hud import HUD
+
+        self.hud = HUD()
+
+        # Cargar nivel (ya parseado en el pool)
+        self.level = Level(self.level_file, game=self, data=level_data)
 
         # Surface interna
         self.map_width = len(self.level.tiles[0]) * TILE_SIZE
         self.map_height = len(self.level.tiles) * TILE_SIZE
 
-        self.game_surface = pygame.Surface((self.map_width, self.map_height))
-        self.renderer = Renderer(self.game_surface)
+        self.game_surface = self.new_game_surface((self.map_width, self.map_height))
+        self.renderer = make_renderer(self.renderer_name, self.game_surface, self.pixel_tile)
+        self.apply_quality()
 
         # Pac-Man
         spawn_col, spawn_row = self.level.pacman_spawn
         self.pacman = Pacman(
             spawn_col * TILE_SIZE + TILE_SIZE // 2,
             spawn_row * TILE_SIZE + TILE_SIZE // 2,
-            self.level
+            self.level,
+            store=self.entity_store,
+            scheduler=self.scheduler,
         )
 
         # Fantasmas
-        self.ghosts = []
-        self.ghost_colors = ["red", "pink", "blue", "orange"]
         self.spawn_ghosts_for_level()
 
-        # Variables para sonido de pasos
-        # lleva la posición previa de pacman para detectar movimiento
         self._prev_pacman_pos = (self.pacman.x, self.pacman.y)
-        # temporizador para espaciar pasos (segundos). Ajusta para ritmo.
-        self.step_interval = 0.12
-        self._step_timer = 0.0
+
+    def wait_until_loaded(self, timeout=None):
+        """Carga síncrona de menú y partida (headless / herramientas)."""
+        if self.menu_loader is not None:
+            self.menu_loader.wait(timeout)
+        self.request_game_assets()
+        if self.game_loader is not None:
+            self.game_loader.wait(timeout)
+        self.poll_loading()
 
     # ================================================================
     # CREAR FANTASMAS
     # ================================================================
     def spawn_ghosts_for_level(self, speed=None):
+        """
+        Un fantasma por spawn del nivel. Los que ya existen se reinician en el
+        lugar (Ghost.respawn: mismo objeto, slot y sprites); solo se construyen
+        los que falten y se liberan los que sobren.
+        """
+        from entities.ghost import Ghost
 
         if speed is None:
             speed = ghost_speed_for_level(self.difficulty, self.current_level)
 
-        self.ghosts = []
+        if self.swarm_size:
+            self.spawn_swarm(speed)
+            return
 
-        for i, (col, row) in enumerate(self.level.ghost_spawns):
+        spawns = self.level.ghost_spawns
+        for ghost in self.ghosts[len(spawns):]:
+            ghost.release()
+        del self.ghosts[len(spawns):]
+
+        for i, (col, row) in enumerate(spawns):
 
             gx = col * TILE_SIZE + TILE_SIZE // 2
             gy = row * TILE_SIZE + TILE_SIZE // 2
 
-            color = self.ghost_colors[i % len(self.ghost_colors)]
-            ghost = Ghost(gx, gy, self.level, color=color, speed=speed)
-
             # Fantasmas dentro de la casita
-            if (col, row) in self.level.ghost_house_area:
-                ghost.state = "house"
-                ghost.dir_x = 0
-                ghost.dir_y = 0
-                ghost.house_timer = 0.8 + i * 0.6
+            house_delay = 0.8 + i * 0.6 if (col, row) in self.level.ghost_house_area else None
 
-            self.ghosts.append(ghost)
+            color = self.ghost_colors[i % len(self.ghost_colors)]
+            if i < len(self.ghosts) and self.ghosts[i].color == color:
+                ghost = self.ghosts[i]
+                ghost.level = self.level
+                ghost.respawn(gx, gy, speed, house_delay)
+            else:
+                ghost = Ghost(
+                    gx, gy, self.level, color=color, speed=speed,
+                    store=self.entity_store, scheduler=self.scheduler,
+                )
+                if house_delay is not None:
+                    ghost.enter_house(house_delay)
+                if i < len(self.ghosts):
+                    self.ghosts[i].release()
+                    self.ghosts[i] = ghost
+                else:
+                    self.ghosts.append(ghost)
+            ghost.ai = self.ghost_ai()
+
+    def spawn_swarm(self, speed):
+        """Enjambre: se crea una vez y después se reinicia en el lugar (mismos arrays)."""
+        if self.swarm is None:
+            from entities.swarm import Swarm
+
+            self.swarm = Swarm(self.level, self.swarm_size, speed)
+        else:
+            self.swarm.reset(self.level, speed)
+
+    def ghost_ai(self):
+        """Controlador de la dificultad actual (uno por tipo, compartido); None = aleatorio."""
+        name = self.difficulty.get("ghost_ai")
+        if name is None:
+            return None
+        ai = self._ghost_ais.get(name)
+        if ai is None:
+            from entities.ghost_ai import make_ghost_ai
+
+            ai = self._ghost_ais[name] = make_ghost_ai(name, self)
+        return ai
 
     # ================================================================
     # LOOP PRINCIPAL
     # ================================================================
     def run(self):
         self._running = True
+        if self.profile_on_start:
+            self.profiler.start()
         while self._running:
             now = time.perf_counter()
             self.dt = now - self.last_time
@@ -242,127 +539,303 @@ class Game:
             self.handle_events()
             self.update(self.dt)
             self.render()
+            self.record_frame_time(time.perf_counter() - now)
 
             self.clock.tick(FPS)
 
+        if self.presenter is not None:
+            self.presenter.stop()
+        if self.high_scores is not None:
+            self.high_scores.close()
+        if self.level_watcher is not None:
+            self.level_watcher.stop()
+        if isinstance(self.session, SessionRecorder):
+            self.session.save()
+        if self.profiler.running:
+            self.toggle_profiler()
+
+    def toggle_profiler(self):
+        if not self.profiler.running:
+            self.profiler.start()
+            print(f"[profile] muestreando (F8 para detener y escribir {self.profile_path})")
+            return
+        self.profiler.stop()
+        self.profiler.write(self.profile_path)
+        print(self.profiler.report())
+        print(f"[profile] collapsed stacks en {self.profile_path}")
+
+    # ================================================================
+    # RECARGA EN VIVO DE MAPAS (--dev)
+    # ================================================================
+    def enable_hot_reload(self, interval=0.25):
+        from levels.hot_reload import LevelWatcher
+
+        directory = os.path.dirname(os.path.abspath(self.level_file))
+        self.level_watcher = LevelWatcher(directory, interval).start()
+        print(f"[dev] vigilando {directory}")
+
+    def poll_level_changes(self):
+        for path in self.level_watcher.poll():
+            if self.level is not None and os.path.abspath(path) == os.path.abspath(self.level_file):
+                self.reload_level()
+
+    def reload_level(self):
+        """Aplica el mapa editado conservando posiciones, puntaje e items comidos."""
+        from levels.level_loader import load_level_file
+
+        start = time.perf_counter()
+        try:
+            data = load_level_file(self.level_file)
+        except (OSError, ValueError, KeyError) as e:
+            # Archivo a medio guardar o inválido: se sigue con el mapa actual
+            print(f"[dev] {self.level_file}: no se pudo recargar ({e})")
+            return
+
+        rows = self.level.reload(data)
+        if rows is None:
+            self.rebuild_level(data)
+            detail = "tamaño nuevo, nivel reconstruido"
+        else:
+            detail = f"{len(rows)} filas"
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"[dev] {os.path.basename(self.level_file)} recargado: {detail} en {elapsed:.2f} ms")
+
+    def rebuild_level(self, data):
+        from levels.level import Level
+
+        self.level = Level(self.level_file, game=self, data=data)
+        for entity in (*self.pacmans(), *self.ghosts):
+            if entity is not None:
+                entity.level = self.level
+
+        size = (len(self.level.tiles[0]) * TILE_SIZE, len(self.level.tiles) * TILE_SIZE)
+        if size != self.renderer.size:
+            self.map_width, self.map_height = size
+            if self.presenter is not None:
+                self.presenter.wait_idle()
+            self.game_surface = self.new_game_surface(size)
+            self._back_surface = None
+            self.renderer.screen = self.game_surface
+
     # ================================================================
     # EVENTOS
     # ================================================================
     def handle_events(self):
+        # Una sola marca por lote: es el momento en que el juego "ve" la entrada
+        stamp = input_clock()
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self._running = False
+            elif event.type == pygame.KEYDOWN:
+                self.handle_keydown(event.key, stamp)
 
-            if self.state == "MENU" and event.type == pygame.KEYDOWN:
-                # Si hay overlay, permitir cerrarlo con Enter o Backspace
-                if self.menu_overlay and event.key in (pygame.K_RETURN, pygame.K_BACKSPACE):
-                    self.menu_overlay = None
-                    return
-
-                menu_actions = {
-                    pygame.K_UP: lambda: self.menu.handle_action("UP"),
-                    pygame.K_DOWN: lambda: self.menu.handle_action("DOWN"),
-                    pygame.K_w: lambda: self.menu.handle_action("UP"),
-                    pygame.K_s: lambda: self.menu.handle_action("DOWN"),
-                    pygame.K_a: lambda: self.menu.handle_action("UP"),
-                    pygame.K_d: lambda: self.menu.handle_action("DOWN"),
-                }
-                handler = menu_actions.get(event.key)
-                if handler:
-                    handler()
-
-                if event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                    self.start_menu_selection()
-                    return
-
-                if event.key == pygame.K_ESCAPE:
-                    self._running = False
+        if self.bot is not None and self.state == "GAME":
+            self.bot.drive(self, stamp)
 
-            if self.state == "GAME_OVER":
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
-                    self.state = "MENU"
+    def handle_keydown(self, key, stamp):
+        """Despacho por estado usando las tablas estáticas de core.input."""
+        if key in PROFILE_KEYS:
+            self.toggle_profiler()
 
-            if self.state == "VICTORY":
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
-                    self.state = "MENU"
+        elif self.state == "LOADING":
+            if key in QUIT_KEYS:
+                self._running = False
 
-        # Juego
-        if self.state == "GAME":
-            keys = pygame.key.get_pressed()
-            # delegar entrada a Pac-Man (no tocamos su lógica)
-            self.pacman.handle_input(keys)
+        elif self.state == "MENU":
+            # Si hay overlay, permitir cerrarlo con Enter o Backspace
+            if self.menu_overlay and key in OVERLAY_CLOSE_KEYS:
+                self.menu_overlay = None
+                return
+
+            action = MENU_KEYMAP.get(key)
+            if action:
+                self.menu.handle_action(action)
+            elif key in MENU_CONFIRM_KEYS:
+                self.start_menu_selection()
+            elif key in QUIT_KEYS:
+                self._running = False
 
-            if keys[pygame.K_p]:
+        elif self.state == "GAME":
+            turn = DIRECTION_KEYMAP.get(key)
+            if turn:
+                # Buffer de giro: queda pendiente hasta que Pac-Man pueda girar
+                dx, dy, name = turn
+                self.pacman.request_turn(dx, dy, name, stamp)
+            elif key in PAUSE_KEYS:
                 self.state = "PAUSE"
+            elif key in QUICKSAVE_KEYS:
+                self.quick_save()
+            elif key in QUICKLOAD_KEYS:
+                self.quick_load()
 
-        # Pausa
-        if self.state == "PAUSE":
-            keys = pygame.key.get_pressed()
-            if keys[pygame.K_r]:
+        elif self.state == "PAUSE":
+            if key in RESUME_KEYS:
                 self.state = "GAME"
 
+        elif self.state in ("GAME_OVER", "VICTORY"):
+            if key in BACK_TO_MENU_KEYS:
+                self.state = "MENU"
+
     # ================================================================
     # UPDATE
     # ================================================================
     def update(self, dt):
-        if self.state == "GAME":
-            # Actualizamos Pac-Man
-            self.pacman.update(dt)
-
-            # --- detección de movimiento para sonido de pasos ---
-            # comparamos posición actual vs previa; si cambió y no estamos en estados especiales,
-            # reproducimos pasos en intervalo definido.
-            cur_pos = (self.pacman.x, self.pacman.y)
-            moved = (abs(cur_pos[0] - self._prev_pacman_pos[0]) > 0.1 or
-                     abs(cur_pos[1] - self._prev_pacman_pos[1]) > 0.1)
-
-            # sólo si el juego está corriendo y Pac-Man se mueve
-            if moved:
-                self._step_timer += dt
-                if self._step_timer >= self.step_interval:
-                    # reproducir sonido de paso
-                    self.sfx.play_step()
-                    self._step_timer = 0.0
-            else:
-                # reset timer si no se mueve
-                self._step_timer = self.step_interval
-
-            self._prev_pacman_pos = cur_pos
-
-            # --- resto de updates (fantasmas, colisiones) ---
-            for ghost in self.ghosts:
-                ghost.update(dt)
-
-                # colisión con fantasma
-                if self.pacman.collides_with(ghost):
-
-                    if ghost.state == "eyes":
-                        continue
-
-                    if ghost.state in ["fright", "blink"]:
-                        self.ghost_combo += 1
-                        points = 200 * (2 ** (self.ghost_combo - 1))
-                        self.hud.add_score(points)
+        self.poll_loading()
+        if self.level_watcher is not None:
+            self.poll_level_changes()
+
+        if self.state in ("GAME", "DYING"):
+            # Tick fijo (core.fixed_point): el dt del frame solo decide cuántos
+            # ticks se simulan; cada tick es idéntico en cualquier máquina
+            self._sim_time = min(self._sim_time + dt, TICK_DT * MAX_TICKS_PER_FRAME)
+            # Un tick puede terminar la partida (fin de DYING): los que sobran
+            # del frame ya no se simulan
+            while self._sim_time >= TICK_DT and self.state in ("GAME", "DYING"):
+                self._sim_time -= TICK_DT
+                if self.simulate_tick():
+                    return
 
-                        # Sonido de fantasma comido
-                        self.sfx.play_ghost_eaten()
+    def simulate_tick(self):
+        """Un tick fijo, en sub-pasos si alguna entidad va muy rápido. True si Pac-Man murió."""
+        tick = self.sim_tick
+        self.sim_tick += 1
+        if self.session is not None:
+            self.session.on_tick(self, tick)
+
+        if self.state == "DYING":
+            self.update_dying()
+            return False
+
+        steps = self.substeps(TICK_DT)
+        for _ in range(steps):
+            if self.update_tick(TICK_DT / steps):
+                return True
+
+        # Por tick (no por frame): el cambio de nivel cae en el mismo tick en
+        # cualquier re-ejecución
+        self.check_level_complete()
+        return False
+
+    def substeps(self, dt):
+        """Sub-pasos del tick según la entidad más rápida (ver MAX_STEP_FRACTION)."""
+        fastest = max(
+            [p.speed * p.speed_multiplier for p in self.pacmans() if p is not None]
+            + [ghost.speed for ghost in self.ghosts]
+            + ([self.swarm.speed] if self.swarm is not None else []),
+            default=0.0,
+        )
+        return substep_count(fastest * dt, TILE_SIZE * self.MAX_STEP_FRACTION)
 
-                        ghost.enter_eyes()
-                        continue
+    def mark_previous_positions(self):
+        for pacman in self.pacmans():
+            if pacman is not None:
+                pacman.mark_previous()
+        for ghost in self.ghosts:
+            ghost.mark_previous()
+
+    def update_tick(self, dt):
+        """Un sub-paso de partida. True si Pac-Man murió (corta el resto del tick)."""
+        self.mark_previous_positions()
+        # Actualizamos Pac-Man
+        # Timers vencidos (power-ups, fright/blink, casita) en este tick
+        self.scheduler.advance(dt)
+
+        self.pacman.update(dt)
+
+        # --- detección de movimiento para sonido de pasos ---
+        # comparamos posición actual vs previa; si cambió y no estamos en estados especiales,
+        # reproducimos pasos en intervalo definido.
+        cur_pos = (self.pacman.x, self.pacman.y)
+        moved = (abs(cur_pos[0] - self._prev_pacman_pos[0]) > 0.1 or
+                 abs(cur_pos[1] - self._prev_pacman_pos[1]) > 0.1)
+
+        # sólo si el juego está corriendo y Pac-Man se mueve
+        if moved:
+            self._step_timer += dt
+            if self._step_timer >= self.step_interval:
+                # reproducir sonido de paso
+                self.sfx.play_step()
+                self._step_timer = 0.0
+        else:
+            # reset timer si no se mueve
+            self._step_timer = self.step_interval
+
+        self._prev_pacman_pos = cur_pos
+
+        # --- resto de updates (fantasmas, colisiones) ---
+        for ghost in self.ghosts:
+            ghost.update(dt)
+
+            # colisión con fantasma
+            if self.collide_with_ghost(self.pacman, ghost):
+                # Sonido de muerte
+                self.sfx.play_death()
+                self.handle_pacman_hit()
+                return True
+
+        if self.swarm is not None and self.update_swarm(dt):
+            self.sfx.play_death()
+            self.handle_pacman_hit()
+            return True
+
+        # si no quedan asustados, reset combo
+        if not self.entity_store.any_state(KIND_GHOST, FRIGHTENED_STATES) and not (
+                self.swarm is not None and self.swarm.any_frightened()):
+            self.ghost_combo = 0
+        return False
+
+    def update_swarm(self, dt):
+        """Mueve el enjambre y resuelve sus choques. True si Pac-Man pierde una vida."""
+        pacman, swarm = self.pacman, self.swarm
+        swarm.step(dt, pacman.current_cell())
+        hit, eaten = swarm.collide(pacman.fx, pacman.fy)
+        for index in eaten:
+            # Con cientos de fantasmas el combo se topa en 1600 por fantasma
+            self.ghost_combo += 1
+            points = 200 * (2 ** (min(self.ghost_combo, 4) - 1))
+            self.award_points(pacman, points)
+            TELEMETRY.emit("ghost_eaten", "swarm", points, self.ghost_combo)
+            swarm.eat(index)
+        if eaten:
+            self.sfx.play_ghost_eaten()
+        if not hit:
+            return False
 
-                    self.ghost_combo = 0
+        self.ghost_combo = 0
+        TELEMETRY.emit("death", *pacman.current_cell())
+        return True
+
+    def collide_with_ghost(self, pacman, ghost):
+        """
+        Resuelve el choque de un Pac-Man con un fantasma (puntos, ojos, combo).
+        Devuelve True si ese Pac-Man pierde una vida. Lo usa también el
+        servidor multijugador (core.net_server), con un Pac-Man por jugador.
+        """
+        if not pacman.collides_with(ghost) or ghost.state == GhostState.EYES:
+            return False
+
+        if ghost.state in FRIGHTENED_STATES:
+            self.ghost_combo += 1
+            points = 200 * (2 ** (self.ghost_combo - 1))
+            self.award_points(pacman, points)
+            TELEMETRY.emit("ghost_eaten", ghost.color, points, self.ghost_combo)
+
+            # Sonido de fantasma comido
+            self.sfx.play_ghost_eaten()
+
+            ghost.enter_eyes()
+            return False
 
-                    # Sonido de muerte
-                    self.sfx.play_death()
-                    self.handle_pacman_hit()
-                    return
+        self.ghost_combo = 0
+        TELEMETRY.emit("death", *pacman.current_cell())
+        return True
 
-            # si no quedan asustados, reset combo
-            if not any(g.state in ["fright", "blink"] for g in self.ghosts):
-                self.ghost_combo = 0
+    def award_points(self, pacman, points):
+        """Puntos ganados por un Pac-Man (pellets, fantasmas)."""
+        self.hud.add_score(points)
 
-        # Nivel completado
-        if len(self.level.pellets) == 0 and len(self.level.powerups) == 0:
+    def check_level_complete(self):
+        if self.level is not None and len(self.level.pellets) == 0 and len(self.level.powerups) == 0:
             self.current_level += 1
             self.load_next_level()
 
@@ -370,14 +843,40 @@ class Game:
     # RENDER
     # ================================================================
     def render(self):
-        self.game_surface.fill(DARK_BLUE)
-
-        if self.state == "MENU":
+        renderer = self.renderer
+        if renderer.DRAWS:
+            self.draw_frame()
+
+        if not renderer.PRESENTS_SURFACE:
+            # Backends sin ventana (null, ascii, recording): presentan solos
+            renderer.present()
+        elif self.presenter is not None:
+            # Se muestra el frame anterior, que el hilo terminó de escalar
+            scaled = self.presenter.submit(self.game_surface)
+            self.swap_buffers()
+            if scaled is not None:
+                self.show_frame(scaled)
+        else:
+            self.present(self.game_surface)
+
+        self.after_present()
+
+    def draw_frame(self):
+        """Dibuja el estado actual con el renderer (sin escalar ni presentar)."""
+        self.renderer.clear(DARK_BLUE)
+
+        if self.state == "LOADING":
+            self.draw_loading()
+
+        elif self.state == "MENU":
             self.draw_menu()
 
         elif self.state == "GAME":
             self.draw_gameplay()
 
+        elif self.state == "DYING":
+            self.draw_dying()
+
         elif self.state == "PAUSE":
             self.draw_gameplay()
             self.renderer.draw_text("PAUSA", 350, 250, (255, 255, 255), 40)
@@ -389,18 +888,41 @@ class Game:
         elif self.state == "VICTORY":
             self.renderer.draw_text("VICTORIA!", 310, 260, (255, 255, 0), 40)
 
-        # ESCALADO
-        window_w, window_h = self.screen.get_size()
-        game_w, game_h = self.game_surface.get_size()
-
-        # Deja un margen para que se vea el borde de ventana y la X
-        max_scale = 0.7
-        scale = min(window_w / game_w, window_h / game_h, max_scale)
+    def new_game_surface(self, size):
+        """Surface interna para un frame lógico de `size` px (1/factor con --pixel-tile)."""
+        factor = TILE_SIZE // self.pixel_tile
+        return pygame.Surface((size[0] // factor, size[1] // factor))
 
-        scaled_surface = pygame.transform.smoothscale(
-            self.game_surface, (int(game_w * scale), int(game_h * scale))
-        )
+    def present(self, surface):
+        """Escala la surface interna a la ventana y presenta (hilo principal)."""
+        self.show_frame(self.scale_frame(surface))
 
+    def scale_frame(self, surface):
+        """
+        Surface interna -> surface del tamaño a mostrar. No toca la ventana:
+        corre también en el hilo del presenter.
+        """
+        window_w, window_h = self.screen.get_size()
+        game_w, game_h = surface.get_size()
+
+        if self.renderer.factor > 1:
+            # Baja resolución: ampliación entera con vecino más cercano, nítida y
+            # sin filtrado (cada píxel pasa a ser un bloque de k x k)
+            k = max(1, min(window_w // game_w, window_h // game_h))
+            scaled_surface = pygame.transform.scale(surface, (game_w * k, game_h * k))
+        else:
+            # Deja un margen para que se vea el borde de ventana y la X
+            max_scale = 0.7
+            scale = min(window_w / game_w, window_h / game_h, max_scale)
+
+            # smoothscale filtra (caro); scale es vecino más cercano (calidades bajas)
+            scale_fn = pygame.transform.smoothscale if self.quality.tier.smooth_scale else pygame.transform.scale
+            scaled_surface = scale_fn(surface, (int(game_w * scale), int(game_h * scale)))
+        return scaled_surface
+
+    def show_frame(self, scaled_surface):
+        """Centra un frame ya escalado en la ventana y hace flip (solo hilo principal)."""
+        window_w, window_h = self.screen.get_size()
         x = (window_w - scaled_surface.get_width()) // 2
         y = (window_h - scaled_surface.get_height()) // 2
 
@@ -408,6 +930,41 @@ class Game:
         self.screen.blit(scaled_surface, (x, y))
         pygame.display.flip()
 
+    def swap_buffers(self):
+        """
+        El frame enviado queda en manos del presenter; se dibuja el siguiente en
+        el otro buffer (submit ya esperó a que el presenter lo soltara).
+        """
+        back = self._back_surface
+        if back is None or back.get_size() != self.game_surface.get_size():
+            back = pygame.Surface(self.game_surface.get_size())
+        self._back_surface, self.game_surface = self.game_surface, back
+        self.renderer.screen = back
+
+    def record_frame_time(self, seconds):
+        """Trabajo del frame (sin la espera de clock.tick) para el gobernador de calidad."""
+        # Solo en partida: la carga y el menú no representan el costo real
+        if self.state == "GAME" and self.quality.record(seconds * 1000):
+            self.apply_quality()
+
+    def apply_quality(self):
+        tier = self.quality.tier
+        self.renderer.neon_double = tier.neon_double
+        self.renderer.animate = tier.animate
+        if self.hud is not None:
+            self.hud.quality = tier.name
+
+    def after_present(self):
+        """Hitos de arranque; la carga de la partida espera al primer frame del menú."""
+        PROFILER.milestone("first frame")
+        if self.state == "MENU" and not PROFILER.has_milestone("menu interactive"):
+            PROFILER.milestone("menu interactive")
+            self.request_game_assets()
+
+        if self.startup_profile and self.level is not None:
+            print(PROFILER.report())
+            self._running = False
+
     # ================================================================
     # GAMEPLAY DRAW
     # ================================================================
@@ -417,9 +974,44 @@ class Game:
 
         for ghost in self.ghosts:
             ghost.draw(self.renderer)
+        if self.swarm is not None:
+            self.swarm.draw(self.renderer, self.sim_tick // 8)
 
         self.hud.draw(self.renderer)
 
+    def draw_dying(self):
+        # Los fantasmas quedan quietos en la primera parte y después se ocultan
+        progress = self.dying_ticks / self.DEATH_TICKS
+        self.level.draw(self.renderer)
+        if progress < 0.3:
+            for ghost in self.ghosts:
+                ghost.draw(self.renderer)
+            if self.swarm is not None:
+                self.swarm.draw(self.renderer)
+            self.pacman.draw(self.renderer)
+        else:
+            self.pacman.draw_dying(self.renderer, (progress - 0.3) / 0.7)
+        self.hud.draw(self.renderer)
+
+    # ================================================================
+    # PANTALLA DE CARGA
+    # ================================================================
+    def draw_loading(self):
+        progress = self.loader.progress() if self.loader else 1.0
+        width, height = self.renderer.size
+
+        bar_w, bar_h = width * 2 // 3, 28
+        x = (width - bar_w) // 2
+        y = height // 2
+
+        # La fuente se inicializa como primer trabajo de carga; antes solo hay barra
+        if self.loading_font is not None:
+            self.renderer.draw_text_centered(f"CARGANDO... {int(progress * 100)}%", width // 2, y - 40,
+                                             (255, 255, 0), 36)
+
+        self.renderer.fill_rect((x, y, bar_w, bar_h), (255, 255, 255), width=2)
+        self.renderer.fill_rect((x + 4, y + 4, int((bar_w - 8) * progress), bar_h - 8), (255, 255, 0))
+
     # ================================================================
     # MENU DRAW (capa imperativa)
     # ================================================================
@@ -432,11 +1024,10 @@ class Game:
         # Panel semitransparente centrado
         panel_width = 500
         panel_height = 260
-        x = (self.game_surface.get_width() - panel_width) // 2
+        x = (self.renderer.size[0] - panel_width) // 2
         y = 180
-        surface = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
-        surface.fill((0, 0, 0, 180))
-        self.game_surface.blit(surface, (x, y))
+        # Color con alfa: el backend pygame cachea el panel (una sola Surface)
+        self.renderer.fill_rect((x, y, panel_width, panel_height), (0, 0, 0, 180))
 
         title = self.menu_overlay.get("title", "")
         lines = self.menu_overlay.get("lines", [])
@@ -450,46 +1041,99 @@ class Game:
     # VIDA PERDIDA
     # ================================================================
     def handle_pacman_hit(self):
+        """
+        Pierde una vida y arranca la secuencia de muerte. DYING avanza con los
+        ticks de simulación (el loop sigue atendiendo eventos, dibujando y
+        sonando) y al terminar respawnea o da game over.
+        """
         self.hud.lives -= 1
 
         # reproducir sonido de muerte ya fue llamado antes
+        self.state = "DYING"
+        self.dying_ticks = 0
+
+    def update_dying(self):
+        # Nada se mueve ni corre el Scheduler: los power-ups y el fright no
+        # se consumen durante la animación
+        self.dying_ticks += 1
+        if self.dying_ticks < self.DEATH_TICKS:
+            return
+
         if self.hud.lives <= 0:
             self.state = "GAME_OVER"
+            TELEMETRY.emit("game_over", self.hud.score, self.current_level)
+            self.submit_score()
+            if isinstance(self.session, SessionRecorder):
+                self.session.save()
             return
 
-        # asegurar que suene un poco el "death" antes de respawnear
-        pygame.time.delay(700)
+        self.state = "GAME"
         self.respawn_entities()
 
+    def submit_score(self):
+        """Encola el puntaje final (el escritor de fondo hace el INSERT)."""
+        if self.menu is not None:
+            self.menu.last_score = self.hud.score
+        if self.high_scores is not None:
+            self.high_scores.submit(self.difficulty_name, self.hud.score, self.current_level)
+
     # ================================================================
     # RESPAWN
     # ================================================================
-    def respawn_entities(self):
+    def pacmans(self):
+        """Pac-Man en juego (el multijugador tiene uno por jugador)."""
+        return (self.pacman,)
+
+    def respawn_pacman(self, pacman):
         spawn_col, spawn_row = self.level.pacman_spawn
-        self.pacman.x = spawn_col * TILE_SIZE + TILE_SIZE // 2
-        self.pacman.y = spawn_row * TILE_SIZE + TILE_SIZE // 2
+        pacman.x = spawn_col * TILE_SIZE + TILE_SIZE // 2
+        pacman.y = spawn_row * TILE_SIZE + TILE_SIZE // 2
 
-        self.pacman.dir_x = 0
-        self.pacman.dir_y = 0
-        self.pacman.next_dir_x = 0
-        self.pacman.next_dir_y = 0
+        pacman.mark_previous()
 
-        self.ghosts.clear()
+        pacman.dir_x = 0
+        pacman.dir_y = 0
+        pacman.next_dir_x = 0
+        pacman.next_dir_y = 0
+        pacman.turn_stamp = None
+        pacman.anim_frame = 0
+        pacman.anim_timer = 0
+
+    def respawn_entities(self):
+        """Todo a su spawn, en el lugar: no se crean entidades ni se cargan sprites."""
+        for pacman in self.pacmans():
+            self.respawn_pacman(pacman)
+        if self.bot is not None:
+            self.bot.reset()
 
         speed = ghost_speed_for_level(self.difficulty, self.current_level)
         self.spawn_ghosts_for_level(speed=speed)
 
+    def restart_level(self):
+        """
+        Nivel desde cero. El Level actual ya tiene el mapa parseado, las capas
+        y el grafo: basta reponer sus items. Solo si cambió el archivo se carga
+        uno nuevo.
+        """
+        if self.level is not None and self.level.map_file == self.level_file:
+            self.level.reset_items()
+            return
+
+        from levels.level import Level
+
+        self.level = Level(self.level_file, game=self)
+        for pacman in self.pacmans():
+            pacman.level = self.level
+
     # ================================================================
     # RESET GAME
     # ================================================================
     def reset_game(self):
         self.hud.reset()
+        for pacman in self.pacmans():
+            pacman.clear_effects()
 
-        self.ghosts.clear()
-
-        self.level = Level("levels/maps/level1.json", game=self)
-        self.pacman.level = self.level
-
+        self.restart_level()
         self.respawn_entities()
 
     # ================================================================
@@ -497,9 +1141,16 @@ class Game:
     # ================================================================
     def freeze_ghosts(self, state):
         for ghost in self.ghosts:
-            ghost.frozen = state
+            ghost.set_frozen(state)
+        if self.swarm is not None:
+            self.swarm.frozen = state
 
     def activate_powerup(self, pacman, col, row):
+        from powerups.speed_boost import SpeedBoost
+        from powerups.time_freeze import TimeFreeze
+        from powerups.score_multiplier import ScoreMultiplier
+        from powerups.fright_mode import FrightMode
+
         p = random.choice([
             SpeedBoost(),
             TimeFreeze(),
@@ -507,22 +1158,48 @@ class Game:
             FrightMode()
         ])
 
+        TELEMETRY.emit("powerup", type(p).__name__, col, row)
+
         # Sonido + loop frightened
         self.sfx.play_power()
 
         pacman.add_effect(p)
 
+    # ================================================================
+    # SAVE-STATES
+    # ================================================================
+    def quick_save(self):
+        if self.swarm is not None:
+            # El save-state serializa Ghost por Ghost; el enjambre no entra
+            return
+        from core.savestate import snapshot
+
+        self.saved_state = snapshot(self)
+
+    def quick_load(self):
+        if self.saved_state is None:
+            return
+        from core.savestate import restore
+
+        restore(self, self.saved_state)
+        self._prev_pacman_pos = (self.pacman.x, self.pacman.y)
+        if self.bot is not None:
+            self.bot.reset()
+
     # ================================================================
     # START NORMAL MODE
     # ================================================================
     def start_normal_mode(self):
-        self.start_game_with_difficulty("NORMAL")
+        self.start_game_with_difficulty(self.start_difficulty)
 
     def start_menu_selection(self):
         """Imperative shell: lee selección y delega en núcleo funcional."""
         action = self.menu.get_selected_action()
         if action == "start":
-            self.start_game_with_difficulty("NORMAL")
+            self.start_game_with_difficulty(self.start_difficulty)
+        elif action == "difficulty":
+            self.menu.cycle_difficulty(DIFFICULTY_PRESETS)
+            self.start_difficulty = self.menu.difficulty
         elif action == "exit":
             self._running = False
         elif action == "help":
@@ -550,19 +1227,38 @@ class Game:
             self.set_menu_overlay(
                 "Configuracion",
                 [
-                    "Dificultad fija: NORMAL",
+                    f"Dificultad: {self.start_difficulty}",
                     "Sonido: activado",
                     "Volumen: 60%",
                     "Pulsa ENTER para cerrar",
                 ],
             )
 
-    def start_game_with_difficulty(self, name):
+    def start_game_with_difficulty(self, name, seed=None):
+        if self.level is None:
+            # Assets del juego aún cargando: se arranca en cuanto terminen
+            self.pending_difficulty = name
+            self.state = "LOADING"
+            self.request_game_assets()
+            return
+
+        # Semilla propia por partida: con ella y los giros por tick la partida
+        # se reproduce idéntica (core.replay)
+        self.session_seed = random.randrange(1 << 32) if seed is None else seed
+        random.seed(self.session_seed)
+        self.sim_tick = 0
+        self._sim_time = 0.0
+
         self.difficulty = resolve_difficulty(DIFFICULTY_PRESETS, name)
+        self.difficulty_name = name if name in DIFFICULTY_PRESETS else "NORMAL"
+        if self.menu is not None:
+            self.menu.difficulty = self.difficulty_name
         self.current_level = 1
         self.reset_game()
         self.state = "GAME"
         self.sfx.play_intro()
+        if self.session is not None:
+            self.session.begin(self)
 
     def set_menu_overlay(self, title, lines):
         self.menu_overlay = {"title": title, "lines": lines}
@@ -571,11 +1267,9 @@ class Game:
     # SIGUIENTE NIVEL
     # ================================================================
     def load_next_level(self):
-        self.ghosts.clear()
-
-        self.level = Level("levels/maps/level1.json", game=self)
-        self.pacman.level = self.level
+        TELEMETRY.emit("level", self.current_level)
 
+        self.restart_level()
         self.respawn_entities()
 
     # ================================================================
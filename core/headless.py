@@ -0,0 +1,81 @@
+# core/headless.py
+# Sesiones sin ventana ni audio real, manejadas por un bot (core.bots).
+# Paso fijo de simulación: los resultados no dependen de la velocidad de la máquina.
+import os
+import random
+import time
+
+
+def use_dummy_drivers():
+    """SDL sin ventana ni audio reales (debe llamarse antes de pygame.display.init)."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+def create_headless_game(bot, renderer="pygame", swarm=0, level_file=None, pixel_tile=None):
+    use_dummy_drivers()
+    from core.game import Game
+
+    game = Game(bot=bot, renderer=renderer, swarm=swarm, level_file=level_file, pixel_tile=pixel_tile)
+    game.wait_until_loaded()
+    return game
+
+
+def run_headless(bot_name="greedy", seconds=60.0, seed=0, dt=1 / 60, difficulty="NORMAL",
+                 render_every=0, game=None, level_file=None, pixel_tile=None):
+    """
+    Juega `seconds` de tiempo de simulación con el bot indicado.
+    render_every > 0 dibuja cada N ticks (para medir también el render).
+    level_file y pixel_tile se usan solo si hay que crear el Game.
+    Devuelve un dict con métricas de la sesión.
+    """
+    from core.bots import make_bot
+
+    random.seed(seed)
+    bot = make_bot(bot_name)
+    if game is None:
+        game = create_headless_game(bot, level_file=level_file, pixel_tile=pixel_tile)
+    else:
+        game.bot = bot
+
+    game.start_game_with_difficulty(difficulty)
+
+    ticks = int(seconds / dt)
+    sim_time = 0.0
+    games_played = 1
+    for tick in range(ticks):
+        start = time.perf_counter()
+        game.handle_events()
+        game.update(dt)
+        sim_time += time.perf_counter() - start
+
+        if render_every and tick % render_every == 0:
+            game.render()
+
+        if game.state in ("GAME_OVER", "VICTORY"):
+            game.start_game_with_difficulty(difficulty)
+            games_played += 1
+
+    sim_step_ms = sim_time / ticks * 1000 if ticks else 0.0
+    return {
+        "bot": bot_name,
+        "ticks": ticks,
+        "games": games_played,
+        "score": game.hud.score,
+        "level": game.current_level,
+        "lives": game.hud.lives,
+        "sim_step_ms": sim_step_ms,
+        "bot_decisions": bot.decisions,
+        "bot_decision_ms": bot.mean_decision_ms,
+        "bot_ms_per_tick": bot.decision_time / ticks * 1000 if ticks else 0.0,
+        "game": game,
+    }
+
+
+def format_report(stats):
+    return (
+        f"[headless] bot={stats['bot']} ticks={stats['ticks']} games={stats['games']} "
+        f"score={stats['score']} level={stats['level']} lives={stats['lives']} | "
+        f"sim step {stats['sim_step_ms']:.3f} ms, bot {stats['bot_ms_per_tick']:.3f} ms/tick "
+        f"({stats['bot_decisions']} decisiones, {stats['bot_decision_ms']:.3f} ms c/u)"
+    )
@@ -0,0 +1,163 @@
+# core/highscores.py
+# Tabla de récords persistente (SQLite en modo WAL).
+# Lecturas: el menú solo consulta un cache en memoria (top-N por dificultad),
+# cargado una vez en el pool del AssetLoader. Escrituras: submit() actualiza el
+# cache al instante y encola la fila; un hilo escritor con su propia conexión
+# hace el INSERT + commit, así el paso a GAME_OVER nunca espera un fsync.
+import bisect
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS difficulty_scores (
+        id INTEGER PRIMARY KEY,
+        difficulty TEXT NOT NULL,
+        score INTEGER NOT NULL,
+        level INTEGER NOT NULL,
+        created_at REAL NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS difficulty_scores_top ON difficulty_scores (difficulty, score DESC)",
+    # Mejor puntaje con el que se llegó a cada nivel
+    """CREATE TABLE IF NOT EXISTS level_scores (
+        difficulty TEXT NOT NULL,
+        level INTEGER NOT NULL,
+        score INTEGER NOT NULL,
+        created_at REAL NOT NULL,
+        PRIMARY KEY (difficulty, level)
+    )""",
+)
+
+
+def default_path():
+    return os.path.join(os.path.expanduser("~"), ".pacman_highscores.db")
+
+
+def connect(path):
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    # En WAL, NORMAL no hace fsync en cada commit (sí en los checkpoints)
+    conn.execute("PRAGMA synchronous=NORMAL")
+    for statement in SCHEMA:
+        conn.execute(statement)
+    conn.commit()
+    return conn
+
+
+def insert_top(entries, score, level, limit):
+    """Funcion pura: nueva lista top-N (mayor a menor) con (score, level) insertado."""
+    keys = [-s for s, _ in entries]
+    index = bisect.bisect_right(keys, -score)
+    result = entries[:index] + [(score, level)] + entries[index:]
+    return result[:limit]
+
+
+class HighScoreStore:
+    def __init__(self, path=None, top_n=10):
+        self.path = path or default_path()
+        self.top_n = top_n
+        # dificultad -> [(score, level), ...] de mayor a menor
+        self._top = {}
+        self._level_best = {}
+        self._queue = queue.Queue()
+        self._writer = None
+        self.written = 0
+
+    # ----------------------------------------------------------
+    # LECTURA (una vez, en el pool de carga)
+    # ----------------------------------------------------------
+    def load(self):
+        conn = connect(self.path)
+        try:
+            top = {}
+            rows = conn.execute(
+                "SELECT difficulty, score, level FROM ("
+                "  SELECT difficulty, score, level,"
+                "         ROW_NUMBER() OVER (PARTITION BY difficulty ORDER BY score DESC) AS rank"
+                "  FROM difficulty_scores"
+                ") WHERE rank <= ? ORDER BY difficulty, score DESC",
+                (self.top_n,),
+            )
+            for difficulty, score, level in rows:
+                top.setdefault(difficulty, []).append((score, level))
+            level_best = {
+                (difficulty, level): score
+                for difficulty, level, score in conn.execute(
+                    "SELECT difficulty, level, score FROM level_scores"
+                )
+            }
+        finally:
+            conn.close()
+        self._top = top
+        self._level_best = level_best
+        return self
+
+    # ----------------------------------------------------------
+    # CACHE (sin disco)
+    # ----------------------------------------------------------
+    def top(self, difficulty):
+        return self._top.get(difficulty, [])
+
+    def best(self, difficulty):
+        entries = self._top.get(difficulty)
+        return entries[0][0] if entries else 0
+
+    def level_best(self, difficulty, level):
+        return self._level_best.get((difficulty, level), 0)
+
+    # ----------------------------------------------------------
+    # ESCRITURA ASÍNCRONA
+    # ----------------------------------------------------------
+    def submit(self, difficulty, score, level):
+        score, level = int(score), int(level)
+        self._top[difficulty] = insert_top(self.top(difficulty), score, level, self.top_n)
+        key = (difficulty, level)
+        if score > self._level_best.get(key, -1):
+            self._level_best[key] = score
+
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._run, name="highscores", daemon=True)
+            self._writer.start()
+        self._queue.put((difficulty, score, level, time.time()))
+
+    def close(self):
+        """Espera a que el escritor vacíe la cola (al salir del juego)."""
+        if self._writer is not None:
+            self._queue.put(None)
+            self._writer.join()
+            self._writer = None
+
+    def _run(self):
+        conn = connect(self.path)
+        try:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    return
+                # Lote: todo lo que ya esté encolado va en una sola transacción
+                batch = [item]
+                while not self._queue.empty():
+                    extra = self._queue.get()
+                    if extra is None:
+                        self._queue.put(None)
+                        break
+                    batch.append(extra)
+                self._write(conn, batch)
+        finally:
+            conn.close()
+
+    def _write(self, conn, batch):
+        with conn:
+            conn.executemany(
+                "INSERT INTO difficulty_scores (difficulty, score, level, created_at) VALUES (?, ?, ?, ?)",
+                batch,
+            )
+            conn.executemany(
+                "INSERT INTO level_scores (difficulty, level, score, created_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (difficulty, level) DO UPDATE SET score = excluded.score, "
+                "created_at = excluded.created_at WHERE excluded.score > level_scores.score",
+                [(d, level, score, t) for d, score, level, t in batch],
+            )
+        self.written += len(batch)
@@ -0,0 +1,106 @@
+# core/input.py
+# Capa de entrada: tablas de teclas estáticas, filtrado de eventos y métricas
+# de latencia entrada -> movimiento. Todo es edge-triggered (KEYDOWN): no se
+# sondea pygame.key.get_pressed(), así que ningún toque corto se pierde.
+import time
+from collections import deque
+
+import pygame
+
+
+# ==========================================================
+# TABLAS ESTÁTICAS (se construyen una sola vez al importar)
+# ==========================================================
+
+# Menú: tecla -> acción declarativa para Menu.handle_action
+MENU_KEYMAP = {
+    pygame.K_UP: "UP",
+    pygame.K_DOWN: "DOWN",
+    pygame.K_w: "UP",
+    pygame.K_s: "DOWN",
+    pygame.K_a: "UP",
+    pygame.K_d: "DOWN",
+}
+MENU_CONFIRM_KEYS = frozenset((pygame.K_RETURN, pygame.K_SPACE))
+OVERLAY_CLOSE_KEYS = frozenset((pygame.K_RETURN, pygame.K_BACKSPACE))
+
+# Juego: tecla -> (dx, dy, nombre de sprite)
+DIRECTION_KEYMAP = {
+    pygame.K_LEFT: (-1, 0, "left"),
+    pygame.K_RIGHT: (1, 0, "right"),
+    pygame.K_UP: (0, -1, "up"),
+    pygame.K_DOWN: (0, 1, "down"),
+}
+PAUSE_KEYS = frozenset((pygame.K_p,))
+RESUME_KEYS = frozenset((pygame.K_r,))
+BACK_TO_MENU_KEYS = frozenset((pygame.K_RETURN,))
+QUIT_KEYS = frozenset((pygame.K_ESCAPE,))
+QUICKSAVE_KEYS = frozenset((pygame.K_F5,))
+QUICKLOAD_KEYS = frozenset((pygame.K_F9,))
+# En cualquier estado: arranca/detiene el perfilador por muestreo
+PROFILE_KEYS = frozenset((pygame.K_F8,))
+
+# Únicos tipos de evento que el juego consume; el resto ni entra a la cola
+ALLOWED_EVENTS = (
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.VIDEORESIZE,
+    pygame.VIDEOEXPOSE,
+)
+
+
+def install_event_filter(allowed=ALLOWED_EVENTS):
+    """Bloquea todos los tipos de evento salvo los que el juego usa (requiere display.init)."""
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(list(allowed))
+
+
+# ==========================================================
+# LATENCIA ENTRADA -> MOVIMIENTO
+# ==========================================================
+
+class InputLatency:
+    """
+    Acumula latencias (segundos) entre el evento de tecla y el frame en que
+    Pac-Man aplica el giro. Guarda las últimas `window` muestras para percentiles.
+    """
+
+    def __init__(self, window=256):
+        self.count = 0
+        self.total = 0.0
+        self.worst = 0.0
+        self.recent = deque(maxlen=window)
+
+    def record(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.worst = max(self.worst, seconds)
+        self.recent.append(seconds)
+
+    def reset(self):
+        self.count = 0
+        self.total = 0.0
+        self.worst = 0.0
+        self.recent.clear()
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, p):
+        if not self.recent:
+            return 0.0
+        ordered = sorted(self.recent)
+        index = min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def summary(self):
+        return (
+            f"input->move: n={self.count} mean={self.mean * 1000:.1f}ms "
+            f"p95={self.percentile(95) * 1000:.1f}ms max={self.worst * 1000:.1f}ms"
+        )
+
+
+def now():
+    """Reloj de las marcas de entrada (mismo que usa Pac-Man al aplicar el giro)."""
+    return time.perf_counter()
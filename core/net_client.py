@@ -0,0 +1,316 @@
+# core/net_client.py
+# Cliente del multijugador: dibuja con Game y predice SOLO su Pac-Man.
+# Cada tick manda su dirección pedida (con redundancia) y avanza su Pac-Man
+# localmente; al llegar un snapshot toma la posición autoritativa y re-simula
+# los inputs que el servidor todavía no procesó (reconciliación).
+import asyncio
+from collections import OrderedDict, deque
+
+from core.game import Game
+from core.input import PAUSE_KEYS
+from core.net_protocol import (
+    CODE_DIRS, DIR_CODES, DIR_NAMES, INPUT_REDUNDANCY, MSG_FULL, MSG_SNAPSHOT, MSG_WELCOME,
+    PLAYER_ID_BASE, apply_entities, cells_from_mask, decode_snapshot, decode_welcome,
+    dequantize, effects_from_mask, encode_hello, encode_input, message_type,
+)
+from core.savestate import effect_types
+from entities.store import GhostState
+from powerups.speed_boost import SpeedBoost
+
+# Efectos que cambian cómo se mueve el Pac-Man propio: se reflejan localmente
+# para que la predicción avance a la misma velocidad que el servidor
+MOVEMENT_EFFECTS = (SpeedBoost,)
+
+
+class ClientProtocol(asyncio.DatagramProtocol):
+    def __init__(self, inbox):
+        self.inbox = inbox
+
+    def datagram_received(self, data, addr):
+        self.inbox.append(data)
+
+
+class NetClientGame(Game):
+    """Game que no simula fantasmas ni choques: los toma del servidor."""
+
+    # Estados recibidos que se guardan como posibles bases delta
+    HISTORY = 64
+
+    def __init__(self, bot=None):
+        super().__init__(bot=bot)
+        self.transport = None
+        self.inbox = deque()
+        self.player_id = None
+        self.tick_dt = 1 / 60
+        self._accum = 0.0
+
+        # Predicción: inputs enviados aún no confirmados (seq, código)
+        self.seq = 0
+        self.pending = deque()
+        self.sent_codes = deque(maxlen=INPUT_REDUNDANCY)
+
+        # Estado del servidor: tick -> (entidades, jugadores, items restantes)
+        self.states = OrderedDict()
+        self.last_tick = 0
+        self.server_substeps = None  # sub-pasos del próximo tick según el servidor
+        self.server_level = None
+        self.remote_pacmans = {}     # jugador -> Pacman (solo para dibujar)
+        self.scores = {}
+        self.snapshot_bytes = 0
+        self.snapshots = 0
+        self.corrections = 0
+
+    # ----------------------------------------------------------
+    # CONEXIÓN
+    # ----------------------------------------------------------
+    async def connect(self, host, port, timeout=5.0):
+        loop = asyncio.get_running_loop()
+        self.transport, _ = await loop.create_datagram_endpoint(
+            lambda: ClientProtocol(self.inbox), remote_addr=(host, port)
+        )
+        deadline = loop.time() + timeout
+        while loop.time() < deadline:
+            self.transport.sendto(encode_hello())
+            await asyncio.sleep(0.1)
+            while self.inbox:
+                data = self.inbox.popleft()
+                if message_type(data) == MSG_WELCOME:
+                    self.player_id, tick_rate, _ = decode_welcome(data)
+                    self.tick_dt = 1 / tick_rate
+                    return self.player_id
+                if message_type(data) == MSG_FULL:
+                    raise ConnectionError("servidor lleno")
+        raise ConnectionError(f"sin respuesta de {host}:{port}")
+
+    def award_points(self, pacman, points):
+        # El puntaje es autoritativo: llega en los snapshots
+        pass
+
+    def activate_powerup(self, pacman, col, row):
+        # Los efectos los decide el servidor (llegan en el snapshot: mirror_effects)
+        pass
+
+    # ----------------------------------------------------------
+    # LOOP
+    # ----------------------------------------------------------
+    def handle_keydown(self, key, stamp):
+        # Pausar no tiene sentido con otros jugadores
+        if self.state == "GAME" and key in PAUSE_KEYS:
+            return
+        super().handle_keydown(key, stamp)
+
+    def update(self, dt):
+        self.receive_snapshots()
+        if self.state != "GAME":
+            return
+
+        self._accum += dt
+        while self._accum >= self.tick_dt:
+            self._accum -= self.tick_dt
+            self.send_input_and_predict()
+
+    def send_input_and_predict(self):
+        """Un input por tick (el mismo paso que el servidor) + predicción local."""
+        pacman = self.pacman
+        code = DIR_CODES.get((pacman.next_dir_x, pacman.next_dir_y), 0)
+        self.seq += 1
+        self.pending.append((self.seq, code))
+        self.sent_codes.append(code)
+        first_seq = self.seq - len(self.sent_codes) + 1
+        self.transport.sendto(encode_input(self.player_id, self.last_tick, first_seq, self.sent_codes))
+
+        self.predict_tick(pacman)
+
+    def predict_tick(self, pacman):
+        """Mismos sub-pasos que MatchGame.step, así la predicción no diverge."""
+        # El servidor cuenta a todos los jugadores y fantasmas; acá solo se ve
+        # el Pac-Man propio (antes del primer snapshot no hay otra opción)
+        steps = self.server_substeps or self.substeps(self.tick_dt)
+        for _ in range(steps):
+            pacman.update(self.tick_dt / steps)
+
+    # ----------------------------------------------------------
+    # SNAPSHOTS
+    # ----------------------------------------------------------
+    def receive_snapshots(self):
+        latest = None
+        while self.inbox:
+            data = self.inbox.popleft()
+            if message_type(data) != MSG_SNAPSHOT:
+                continue
+            self.snapshot_bytes += len(data)
+            self.snapshots += 1
+            snap = decode_snapshot(data)
+            if snap.tick > self.last_tick and self.store_snapshot(snap):
+                latest = snap
+        if latest is not None:
+            self.apply_server_state(latest)
+
+    def store_snapshot(self, snap):
+        """Reconstruye el estado completo del tick; False si falta la base."""
+        if snap.is_full:
+            if snap.level != self.server_level:
+                self.change_level(snap.level)
+            entities, players = snap.entities, snap.players
+            items = cells_from_mask(self.level.item_cells, snap.item_mask)
+        else:
+            base = self.states.get(snap.base_tick)
+            if base is None or snap.level != self.server_level:
+                return False
+            base_entities, base_players, base_items = base
+            entities = apply_entities(base_entities, snap.entities, snap.removed)
+            players = snap.players if snap.players is not None else base_players
+            items = base_items.difference(snap.eaten)
+
+        self.states[snap.tick] = (entities, players, items)
+        while len(self.states) > self.HISTORY:
+            self.states.popitem(last=False)
+        self.last_tick = snap.tick
+        return True
+
+    def change_level(self, level_no):
+        if self.server_level is not None:
+            self.load_next_level()
+        self.server_level = level_no
+        self.current_level = level_no
+        self.states.clear()
+
+    def apply_server_state(self, snap):
+        entities, players, items = self.states[snap.tick]
+        self.level.set_items(items)
+        self.scores = players
+        self.server_substeps = snap.substeps
+
+        for i, ghost in enumerate(self.ghosts):
+            st = entities.get(i)
+            if st is not None:
+                self.place(ghost, st)
+                ghost.state = GhostState(st[0])
+                ghost.anim_frame = snap.tick // 8
+
+        self.sync_remote_pacmans(entities)
+
+        own = entities.get(PLAYER_ID_BASE + self.player_id)
+        stats = players.get(self.player_id)
+        if stats is not None:
+            self.hud.score, self.hud.lives = stats
+        if own is None:
+            if stats is not None and stats[1] == 0:
+                self.state = "GAME_OVER"
+            return
+        if self.state == "GAME_OVER":
+            # El servidor reinició la partida
+            self.state = "GAME"
+        self.mirror_effects(self.pacman, effects_from_mask(effect_types(), own[0]))
+        self.reconcile(own, snap.ack_seq)
+
+    def mirror_effects(self, pacman, active):
+        """Aplica/quita localmente los efectos de movimiento activos en el servidor."""
+        for kind in MOVEMENT_EFFECTS:
+            effect = kind()
+            if kind in active:
+                effect.apply(pacman)
+            else:
+                effect.remove(pacman)
+
+    def reconcile(self, own, ack_seq):
+        """Posición autoritativa + re-simular los inputs aún no procesados."""
+        while self.pending and self.pending[0][0] <= ack_seq:
+            self.pending.popleft()
+
+        pacman = self.pacman
+        before = (pacman.x, pacman.y)
+        self.place(pacman, own)
+        for _, code in self.pending:
+            if code:
+                dx, dy = CODE_DIRS[code]
+                pacman.next_dir_x, pacman.next_dir_y = dx, dy
+            self.predict_tick(pacman)
+
+        if abs(pacman.x - before[0]) + abs(pacman.y - before[1]) > 1.0:
+            self.corrections += 1
+
+    def place(self, entity, st):
+        _, code, x, y = st
+        entity.x, entity.y = dequantize(x), dequantize(y)
+        entity.dir_x, entity.dir_y = CODE_DIRS.get(code, (0, 0))
+        if code:
+            entity.direction = DIR_NAMES[code]
+
+    def sync_remote_pacmans(self, entities):
+        from entities.pacman import Pacman
+
+        alive = set()
+        for eid, st in entities.items():
+            pid = eid - PLAYER_ID_BASE
+            if pid < 0 or pid == self.player_id:
+                continue
+            alive.add(pid)
+            pacman = self.remote_pacmans.get(pid)
+            if pacman is None:
+                pacman = self.remote_pacmans[pid] = Pacman(0, 0, self.level, store=self.entity_store)
+            before = (pacman.x, pacman.y)
+            self.place(pacman, st)
+            if (pacman.x, pacman.y) != before:
+                pacman.anim_frame += 1
+
+        for pid in tuple(self.remote_pacmans):
+            if pid not in alive:
+                self.remote_pacmans.pop(pid).release()
+
+    # ----------------------------------------------------------
+    # DRAW
+    # ----------------------------------------------------------
+    def draw_gameplay(self):
+        super().draw_gameplay()
+        for pacman in self.remote_pacmans.values():
+            pacman.draw(self.renderer)
+
+        y = 40
+        for pid, (score, lives) in sorted(self.scores.items()):
+            marker = "*" if pid == self.player_id else " "
+            self.renderer.draw_text(f"{marker}P{pid + 1}: {score}  x{lives}", 10, y, (255, 255, 255), 20)
+            y += 22
+
+    # ----------------------------------------------------------
+    # MÉTRICAS
+    # ----------------------------------------------------------
+    @property
+    def mean_snapshot_bytes(self):
+        return self.snapshot_bytes / self.snapshots if self.snapshots else 0.0
+
+    async def run_async(self, duration=None):
+        self.start_game_with_difficulty("NORMAL")
+        loop = asyncio.get_running_loop()
+        start = last = loop.time()
+        frame = 1 / 60
+        self._running = True
+        while self._running and (duration is None or loop.time() - start < duration):
+            now = loop.time()
+            self.dt, last = now - last, now
+            self.handle_events()
+            self.update(self.dt)
+            self.render()
+            self.record_frame_time(loop.time() - now)
+            await asyncio.sleep(max(0.0, frame - (loop.time() - now)))
+        self.transport.close()
+
+
+def run_client(host, port, bot=None, duration=None, headless=False):
+    if headless:
+        from core.headless import use_dummy_drivers
+
+        use_dummy_drivers()
+
+    async def main():
+        game = NetClientGame(bot=bot)
+        game.wait_until_loaded()
+        await game.connect(host, port)
+        print(f"[client] conectado como jugador {game.player_id + 1}")
+        await game.run_async(duration)
+        return game
+
+    game = asyncio.run(main())
+    print(f"[client] {game.snapshots} snapshots, {game.mean_snapshot_bytes:.0f} bytes promedio, "
+          f"{game.corrections} correcciones de predicción")
+    return game
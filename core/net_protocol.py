@@ -0,0 +1,227 @@
+# core/net_protocol.py
+# Protocolo UDP del multijugador (núcleo funcional: solo bytes <-> datos).
+#
+# Cliente -> servidor: HELLO para unirse; luego un INPUT por tick con las
+# últimas N direcciones pedidas (redundancia ante pérdida de paquetes) y el
+# último snapshot recibido (ack).
+# Servidor -> cliente: WELCOME con el id de jugador; luego un SNAPSHOT por tick,
+# delta contra el último snapshot que el cliente confirmó (o completo si no hay base).
+import struct
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+from core.fixed_point import SUBPIXEL as FIXED_SUBPIXEL
+
+PROTOCOL_VERSION = 3
+MAX_PLAYERS = 4
+
+MSG_HELLO = 1
+MSG_WELCOME = 2
+MSG_FULL = 3
+MSG_INPUT = 4
+MSG_SNAPSHOT = 5
+
+# Posiciones en la misma unidad que la simulación (core.fixed_point): viajan
+# sin pérdida y un mapa de 28 tiles de 32 px cabe en 16 bits
+SUBPIXEL = FIXED_SUBPIXEL
+
+# Ids de entidad: fantasmas 0..15, Pac-Man del jugador p = PLAYER_ID_BASE + p
+PLAYER_ID_BASE = 16
+
+# Dirección -> código de 1 byte (0 = sin dirección / sin giro pedido)
+DIR_CODES = {(0, 0): 0, (-1, 0): 1, (1, 0): 2, (0, -1): 3, (0, 1): 4}
+CODE_DIRS = {code: d for d, code in DIR_CODES.items()}
+DIR_NAMES = {1: "left", 2: "right", 3: "up", 4: "down"}
+
+# Inputs redundantes por paquete
+INPUT_REDUNDANCY = 4
+
+FLAG_FULL = 1
+FLAG_PLAYERS = 2
+
+_HELLO = struct.Struct("!BB")              # tipo, versión
+_WELCOME = struct.Struct("!BBBB")          # tipo, jugador, tick rate, nivel
+_INPUT = struct.Struct("!BBIIB")           # tipo, jugador, ack tick, primer seq, cantidad
+_SNAPSHOT = struct.Struct("!BIIIBBBBB")    # tipo, tick, base, ack seq, nivel, sub-pasos, flags,
+                                           # n entidades, n quitadas
+_ENTITY = struct.Struct("!BBBHH")          # id, estado (Pac-Man: máscara de efectos), dirección, x, y
+_PLAYER = struct.Struct("!BIB")            # jugador, puntaje, vidas
+_COUNT = struct.Struct("!H")
+_CELL = struct.Struct("!BB")
+
+
+@dataclass
+class Snapshot:
+    tick: int
+    base_tick: int          # 0 = snapshot completo
+    ack_seq: int            # último input del destinatario ya simulado
+    level: int
+    # id -> (estado, código de dirección, x, y) ; en un delta solo lo que cambió
+    entities: Dict[int, Tuple[int, int, int, int]] = field(default_factory=dict)
+    removed: Tuple[int, ...] = ()
+    # jugador -> (puntaje, vidas) ; None en un delta = sin cambios
+    players: Optional[Dict[int, Tuple[int, int]]] = None
+    # Completo: máscara de items restantes (orden Level.item_cells)
+    item_mask: Optional[bytes] = None
+    # Delta: celdas comidas desde base_tick
+    eaten: Tuple[Tuple[int, int], ...] = ()
+    # Sub-pasos con los que el servidor simula el próximo tick (el cliente
+    # predice con los mismos: dependen de TODOS los jugadores y fantasmas)
+    substeps: int = 1
+
+    @property
+    def is_full(self):
+        return self.base_tick == 0
+
+
+# ==========================================================
+# ESTADO DE ENTIDADES / ITEMS (puro)
+# ==========================================================
+
+def quantize(value):
+    return min(0xFFFF, max(0, int(round(value * SUBPIXEL))))
+
+
+def dequantize(value):
+    return value / SUBPIXEL
+
+
+def entity_state(state, dir_x, dir_y, x, y):
+    return (int(state), DIR_CODES.get((dir_x, dir_y), 0), quantize(x), quantize(y))
+
+
+def diff_entities(base, current):
+    """(cambiadas, quitadas) para pasar de base a current."""
+    changed = {eid: st for eid, st in current.items() if base.get(eid) != st}
+    removed = tuple(eid for eid in base if eid not in current)
+    return changed, removed
+
+
+def apply_entities(base, changed, removed):
+    result = dict(base)
+    for eid in removed:
+        result.pop(eid, None)
+    result.update(changed)
+    return result
+
+
+def item_mask(cells, remaining):
+    """Bit i encendido si cells[i] sigue en remaining."""
+    mask = bytearray((len(cells) + 7) // 8)
+    for i, cell in enumerate(cells):
+        if cell in remaining:
+            mask[i >> 3] |= 1 << (i & 7)
+    return bytes(mask)
+
+
+def cells_from_mask(cells, mask):
+    return frozenset(cell for i, cell in enumerate(cells) if mask[i >> 3] & (1 << (i & 7)))
+
+
+def effect_mask(kinds, active):
+    """Bit i encendido si kinds[i] está entre los efectos activos (cabe en el byte de estado)."""
+    return sum(1 << i for i, kind in enumerate(kinds) if kind in active)
+
+
+def effects_from_mask(kinds, mask):
+    return frozenset(kind for i, kind in enumerate(kinds) if mask & (1 << i))
+
+
+# ==========================================================
+# CODIFICACIÓN
+# ==========================================================
+
+def message_type(data):
+    return data[0] if data else None
+
+
+def encode_hello():
+    return _HELLO.pack(MSG_HELLO, PROTOCOL_VERSION)
+
+
+def decode_hello(data):
+    _, version = _HELLO.unpack_from(data)
+    return version
+
+
+def encode_welcome(player_id, tick_rate, level):
+    return _WELCOME.pack(MSG_WELCOME, player_id, tick_rate, level & 0xFF)
+
+
+def decode_welcome(data):
+    _, player_id, tick_rate, level = _WELCOME.unpack_from(data)
+    return player_id, tick_rate, level
+
+
+def encode_full():
+    return bytes((MSG_FULL,))
+
+
+def encode_input(player_id, ack_tick, first_seq, codes):
+    codes = bytes(codes)
+    return _INPUT.pack(MSG_INPUT, player_id, ack_tick, first_seq, len(codes)) + codes
+
+
+def decode_input(data):
+    """(jugador, ack_tick, [(seq, código), ...]) ; el más viejo primero."""
+    _, player_id, ack_tick, first_seq, count = _INPUT.unpack_from(data)
+    codes = data[_INPUT.size:_INPUT.size + count]
+    return player_id, ack_tick, [(first_seq + i, code) for i, code in enumerate(codes)]
+
+
+def encode_snapshot(snap):
+    flags = (FLAG_FULL if snap.is_full else 0) | (FLAG_PLAYERS if snap.players is not None else 0)
+    parts = [_SNAPSHOT.pack(
+        MSG_SNAPSHOT, snap.tick, snap.base_tick, snap.ack_seq, snap.level & 0xFF,
+        min(snap.substeps, 0xFF), flags, len(snap.entities), len(snap.removed),
+    )]
+    for eid, (state, code, x, y) in snap.entities.items():
+        parts.append(_ENTITY.pack(eid, state, code, x, y))
+    parts.append(bytes(snap.removed))
+
+    if snap.players is not None:
+        parts.append(bytes((len(snap.players),)))
+        for pid, (score, lives) in snap.players.items():
+            parts.append(_PLAYER.pack(pid, score, lives))
+
+    if snap.is_full:
+        parts.append(_COUNT.pack(len(snap.item_mask)))
+        parts.append(snap.item_mask)
+    else:
+        parts.append(_COUNT.pack(len(snap.eaten)))
+        parts.extend(_CELL.pack(col, row) for col, row in snap.eaten)
+    return b"".join(parts)
+
+
+def decode_snapshot(data):
+    (_, tick, base_tick, ack_seq, level, substeps, flags,
+     n_entities, n_removed) = _SNAPSHOT.unpack_from(data)
+    offset = _SNAPSHOT.size
+
+    entities = {}
+    for _ in range(n_entities):
+        eid, state, code, x, y = _ENTITY.unpack_from(data, offset)
+        entities[eid] = (state, code, x, y)
+        offset += _ENTITY.size
+    removed = tuple(data[offset:offset + n_removed])
+    offset += n_removed
+
+    players = None
+    if flags & FLAG_PLAYERS:
+        count = data[offset]
+        offset += 1
+        players = {}
+        for _ in range(count):
+            pid, score, lives = _PLAYER.unpack_from(data, offset)
+            players[pid] = (score, lives)
+            offset += _PLAYER.size
+
+    (count,) = _COUNT.unpack_from(data, offset)
+    offset += _COUNT.size
+    mask, eaten = None, ()
+    if flags & FLAG_FULL:
+        mask = bytes(data[offset:offset + count])
+    else:
+        eaten = tuple(_CELL.unpack_from(data, offset + i * _CELL.size) for i in range(count))
+
+    return Snapshot(tick, base_tick, ack_seq, level, entities, removed, players, mask, eaten, substeps)
@@ -0,0 +1,355 @@
+# core/net_server.py
+# Servidor autoritativo del multijugador local (2-4 jugadores, asyncio UDP).
+# La simulación es la de Game (mismos Pac-Man, fantasmas, power-ups y choques)
+# a tick fijo; cada jugador solo manda direcciones y recibe snapshots delta.
+import asyncio
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+
+from core.game import Game
+from core.headless import use_dummy_drivers
+from core.net_protocol import (
+    CODE_DIRS, DIR_NAMES, MAX_PLAYERS, MSG_HELLO, MSG_INPUT, PLAYER_ID_BASE, PROTOCOL_VERSION,
+    Snapshot, decode_hello, decode_input, diff_entities, effect_mask, encode_full, encode_snapshot,
+    encode_welcome, entity_state, item_mask, message_type,
+)
+from core.savestate import effect_types
+from entities.store import FRIGHTENED_STATES, KIND_GHOST
+
+DEFAULT_PORT = 47800
+
+
+@dataclass
+class PlayerStats:
+    score: int = 0
+    lives: int = 3
+
+
+class MatchGame(Game):
+    """
+    Game sin ventana con un Pac-Man por jugador. Reutiliza la lógica de Game
+    (collide_with_ghost, power-ups, niveles); solo cambia quién recibe puntos
+    y qué pasa al morir (respawn individual, sin pausa bloqueante).
+    """
+
+    def __init__(self, difficulty="NORMAL"):
+        use_dummy_drivers()
+        # El servidor no dibuja: backend nulo (ni capas ni escalado)
+        super().__init__(renderer="null")
+        self.players = {}        # jugador -> Pacman
+        self.stats = {}          # jugador -> PlayerStats
+        self._owner = {}         # id(Pacman) -> jugador
+        self.wait_until_loaded()
+        self.difficulty_name = difficulty
+        self.start_game_with_difficulty(difficulty)
+
+    def build_world(self, level_data):
+        super().build_world(level_data)
+        # El Pac-Man de un jugador lo crea add_player
+        self.pacman.release()
+        self.pacman = None
+
+    def pacmans(self):
+        return tuple(self.players.values())
+
+    # ----------------------------------------------------------
+    # JUGADORES
+    # ----------------------------------------------------------
+    def add_player(self, pid):
+        from entities.pacman import Pacman
+
+        pacman = Pacman(0, 0, self.level, store=self.entity_store, scheduler=self.scheduler)
+        self.respawn_pacman(pacman)
+        self.players[pid] = pacman
+        self.stats[pid] = PlayerStats()
+        self._owner[id(pacman)] = pid
+
+    def remove_player(self, pid):
+        pacman = self.players.pop(pid, None)
+        if pacman is not None:
+            self._owner.pop(id(pacman), None)
+            pacman.release()
+        self.stats.pop(pid, None)
+
+    def apply_input(self, pid, code):
+        pacman = self.players.get(pid)
+        if pacman is not None and code:
+            dx, dy = CODE_DIRS[code]
+            pacman.request_turn(dx, dy, DIR_NAMES[code])
+
+    # ----------------------------------------------------------
+    # SIMULACIÓN (un tick fijo)
+    # ----------------------------------------------------------
+    def step(self, dt):
+        # Tick fijo bajo para ahorrar CPU: los sub-pasos evitan que un
+        # fantasma rápido atraviese a un jugador entre dos ticks
+        steps = self.substeps(dt)
+        for _ in range(steps):
+            self.step_once(dt / steps)
+        self.check_level_complete()
+
+    def step_once(self, dt):
+        self.mark_previous_positions()
+        self.scheduler.advance(dt)
+
+        for pacman in self.pacmans():
+            pacman.update(dt)
+
+        for ghost in self.ghosts:
+            ghost.update(dt)
+            for pid, pacman in tuple(self.players.items()):
+                if self.collide_with_ghost(pacman, ghost):
+                    self.player_hit(pid)
+
+        if not self.entity_store.any_state(KIND_GHOST, FRIGHTENED_STATES):
+            self.ghost_combo = 0
+
+    def award_points(self, pacman, points):
+        pid = self._owner.get(id(pacman))
+        if pid is not None:
+            # ScoreMultiplier da puntos float (10 * 2.0); el snapshot lleva enteros
+            self.stats[pid].score += int(points)
+
+    def player_hit(self, pid):
+        stats = self.stats[pid]
+        stats.lives -= 1
+        pacman = self.players[pid]
+        if stats.lives > 0:
+            self.respawn_pacman(pacman)
+            return
+
+        # Sin vidas: queda como espectador (su Pac-Man sale del mapa)
+        self._owner.pop(id(pacman), None)
+        del self.players[pid]
+        pacman.release()
+        if not self.players:
+            self.restart_match()
+
+    def restart_match(self):
+        """Todos sin vidas: partida nueva para los mismos jugadores."""
+        pids = tuple(self.stats)
+        self.stats.clear()
+        self.start_game_with_difficulty(self.difficulty_name)
+        for pid in pids:
+            self.add_player(pid)
+
+    # ----------------------------------------------------------
+    # ESTADO PARA SNAPSHOTS
+    # ----------------------------------------------------------
+    def entity_states(self):
+        states = {
+            i: entity_state(g.state, g.dir_x, g.dir_y, g.x, g.y) for i, g in enumerate(self.ghosts)
+        }
+        kinds = effect_types()
+        for pid, p in self.players.items():
+            # Los efectos viajan para que el cliente prediga con la misma velocidad
+            active = {type(effect) for effect in p.effects}
+            states[PLAYER_ID_BASE + pid] = entity_state(
+                effect_mask(kinds, active), p.dir_x, p.dir_y, p.x, p.y)
+        return states
+
+    def player_states(self):
+        return {pid: (s.score, max(0, s.lives)) for pid, s in self.stats.items()}
+
+
+class ClientSlot:
+    __slots__ = ("addr", "pid", "inputs", "last_seq", "applied_seq", "acked_tick", "last_seen")
+
+    def __init__(self, addr, pid):
+        self.addr = addr
+        self.pid = pid
+        self.inputs = deque()
+        self.last_seq = 0        # último seq recibido
+        self.applied_seq = 0     # último seq simulado (ack para el cliente)
+        self.acked_tick = 0      # último snapshot que el cliente confirmó
+        self.last_seen = time.monotonic()
+
+
+class ServerProtocol(asyncio.DatagramProtocol):
+    def __init__(self, server):
+        self.server = server
+
+    def connection_made(self, transport):
+        self.server.transport = transport
+
+    def datagram_received(self, data, addr):
+        self.server.handle_datagram(data, addr)
+
+
+class MatchServer:
+    # Ticks de historia para bases delta (~1 s a 60 Hz)
+    HISTORY = 64
+    # Inputs encolados por cliente: más que esto es latencia acumulada
+    MAX_QUEUED_INPUTS = 8
+    CLIENT_TIMEOUT = 5.0
+
+    def __init__(self, game, tick_rate=60, max_players=MAX_PLAYERS):
+        self.game = game
+        self.tick_rate = tick_rate
+        self.dt = 1.0 / tick_rate
+        self.max_players = max_players
+        self.transport = None
+        self.clients = {}                # addr -> ClientSlot
+        self.tick = 0
+        self.history = OrderedDict()     # tick -> (entidades, jugadores)
+        self.next_substeps = 1           # sub-pasos del próximo tick (ver Snapshot.substeps)
+        self.eaten_log = []              # (tick, celda) del nivel actual
+        self._level = None
+        self._level_no = None
+        self._items = frozenset()
+        self.bytes_sent = 0
+        self.snapshots_sent = 0
+
+    # ----------------------------------------------------------
+    # RED
+    # ----------------------------------------------------------
+    def handle_datagram(self, data, addr):
+        kind = message_type(data)
+        if kind == MSG_HELLO:
+            self.handle_hello(data, addr)
+        elif kind == MSG_INPUT:
+            client = self.clients.get(addr)
+            if client is not None:
+                self.handle_input(client, data)
+
+    def handle_hello(self, data, addr):
+        if decode_hello(data) != PROTOCOL_VERSION:
+            return
+        client = self.clients.get(addr)
+        if client is None:
+            used = {c.pid for c in self.clients.values()}
+            free = [pid for pid in range(self.max_players) if pid not in used]
+            if not free:
+                self.transport.sendto(encode_full(), addr)
+                return
+            client = self.clients[addr] = ClientSlot(addr, free[0])
+            self.game.add_player(client.pid)
+            print(f"[server] jugador {client.pid} conectado desde {addr[0]}:{addr[1]}")
+        self.transport.sendto(encode_welcome(client.pid, self.tick_rate, self.game.current_level), addr)
+
+    def handle_input(self, client, data):
+        _, ack_tick, inputs = decode_input(data)
+        client.last_seen = time.monotonic()
+        client.acked_tick = max(client.acked_tick, ack_tick)
+        for seq, code in inputs:
+            if code not in CODE_DIRS:
+                # Byte desconocido: se descarta la dirección pero el seq avanza
+                # (el ack del cliente no se traba); 0 = sin giro
+                code = 0
+            if seq > client.last_seq:
+                client.inputs.append((seq, code))
+                client.last_seq = seq
+        while len(client.inputs) > self.MAX_QUEUED_INPUTS:
+            client.applied_seq, _ = client.inputs.popleft()
+
+    def drop_stale_clients(self):
+        limit = time.monotonic() - self.CLIENT_TIMEOUT
+        for addr, client in tuple(self.clients.items()):
+            if client.last_seen < limit:
+                print(f"[server] jugador {client.pid} desconectado (timeout)")
+                self.game.remove_player(client.pid)
+                del self.clients[addr]
+
+    # ----------------------------------------------------------
+    # TICK
+    # ----------------------------------------------------------
+    def run_tick(self):
+        self.tick += 1
+        # Un input por jugador y tick: el cliente predice con el mismo paso
+        for client in self.clients.values():
+            if client.inputs:
+                client.applied_seq, code = client.inputs.popleft()
+                self.game.apply_input(client.pid, code)
+
+        self.game.step(self.dt)
+        self.record_state()
+        # Los inputs no cambian velocidades: ya se sabe con cuántos sub-pasos
+        # se simulará el próximo tick
+        self.next_substeps = self.game.substeps(self.dt)
+
+        for client in self.clients.values():
+            data = encode_snapshot(self.build_snapshot(client))
+            self.transport.sendto(data, client.addr)
+            self.bytes_sent += len(data)
+            self.snapshots_sent += 1
+
+    def record_state(self):
+        level = self.game.level
+        items = frozenset(level.pellets | level.powerups)
+        # Nivel nuevo o reiniciado: el Level se reutiliza (reset_items), así
+        # que se detecta por el número o por items que reaparecen. Las bases
+        # viejas ya no sirven (un delta solo sabe quitar items): sin historia,
+        # el próximo snapshot va completo
+        if (level is not self._level or self.game.current_level != self._level_no
+                or items - self._items):
+            self._level = level
+            self._level_no = self.game.current_level
+            self.history.clear()
+            self.eaten_log = []
+        else:
+            self.eaten_log.extend((self.tick, cell) for cell in self._items - items)
+        self._items = items
+
+        self.history[self.tick] = (self.game.entity_states(), self.game.player_states())
+        while len(self.history) > self.HISTORY:
+            self.history.popitem(last=False)
+        if self.eaten_log and self.eaten_log[0][0] < next(iter(self.history)):
+            oldest = next(iter(self.history))
+            self.eaten_log = [e for e in self.eaten_log if e[0] >= oldest]
+
+    def build_snapshot(self, client):
+        entities, players = self.history[self.tick]
+        level_no = self.game.current_level
+        base = self.history.get(client.acked_tick)
+
+        if base is None:
+            level = self.game.level
+            return Snapshot(
+                self.tick, 0, client.applied_seq, level_no, entities, (), players,
+                item_mask=item_mask(level.item_cells, self._items), substeps=self.next_substeps,
+            )
+
+        base_entities, base_players = base
+        changed, removed = diff_entities(base_entities, entities)
+        eaten = tuple(cell for tick, cell in self.eaten_log if tick > client.acked_tick)
+        return Snapshot(
+            self.tick, client.acked_tick, client.applied_seq, level_no, changed, removed,
+            players if players != base_players else None, eaten=eaten, substeps=self.next_substeps,
+        )
+
+    async def serve(self, host="127.0.0.1", port=DEFAULT_PORT, duration=None):
+        """Tick fijo sobre el reloj del loop; si se atrasa mucho, no intenta recuperar."""
+        loop = asyncio.get_running_loop()
+        transport, _ = await loop.create_datagram_endpoint(
+            lambda: ServerProtocol(self), local_addr=(host, port)
+        )
+        print(f"[server] escuchando en {host}:{port} a {self.tick_rate} Hz")
+        start = loop.time()
+        next_tick = start
+        try:
+            while duration is None or loop.time() - start < duration:
+                self.run_tick()
+                if self.tick % self.tick_rate == 0:
+                    self.drop_stale_clients()
+
+                next_tick += self.dt
+                delay = next_tick - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                elif delay < -0.25:
+                    next_tick = loop.time()
+        finally:
+            transport.close()
+
+
+def run_server(port=DEFAULT_PORT, host="127.0.0.1", tick_rate=60, duration=None):
+    server = MatchServer(MatchGame(), tick_rate=tick_rate)
+    try:
+        asyncio.run(server.serve(host, port, duration))
+    except KeyboardInterrupt:
+        pass
+    if server.snapshots_sent:
+        print(f"[server] {server.snapshots_sent} snapshots, "
+              f"{server.bytes_sent / server.snapshots_sent:.0f} bytes/snapshot promedio")
+    return server
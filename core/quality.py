@@ -0,0 +1,95 @@
+# core/quality.py
+# Gobernador de calidad: mira el tiempo de frame (ventana móvil) y baja o sube
+# de nivel de calidad automáticamente. Con histéresis: para bajar basta pasarse
+# del presupuesto durante una ventana; para subir hace falta holgura clara y
+# sostenida por más tiempo, así no oscila entre dos niveles.
+from collections import deque
+from dataclasses import dataclass
+
+from config import FPS
+from core.telemetry import TELEMETRY
+
+
+@dataclass(frozen=True)
+class QualityTier:
+    name: str
+    smooth_scale: bool    # smoothscale (True) o scale rápido
+    neon_double: bool     # paredes con doble línea de neón o línea simple
+    animate: bool         # sprites animados o primer frame fijo
+
+
+# De mejor a peor
+TIERS = (
+    QualityTier("ALTA", smooth_scale=True, neon_double=True, animate=True),
+    QualityTier("MEDIA", smooth_scale=False, neon_double=True, animate=True),
+    QualityTier("BAJA", smooth_scale=False, neon_double=False, animate=True),
+    QualityTier("MINIMA", smooth_scale=False, neon_double=False, animate=False),
+)
+
+
+def decide_tier(index, over_frames, calm_frames, degrade_after, restore_after):
+    """
+    Funcion pura: índice de nivel para el próximo frame. over_frames/calm_frames
+    son rachas consecutivas con la media por encima del umbral de bajada o por
+    debajo del de subida (entre ambos umbrales no corre ninguna racha).
+    """
+    if over_frames >= degrade_after:
+        return min(index + 1, len(TIERS) - 1)
+    if calm_frames >= restore_after:
+        return max(index - 1, 0)
+    return index
+
+
+class QualityGovernor:
+    def __init__(self, budget_ms=1000.0 / FPS, window=60, degrade_ratio=0.95, restore_ratio=0.6,
+                 degrade_after=60, restore_after=300):
+        self.budget_ms = budget_ms
+        self.degrade_ratio = degrade_ratio
+        self.restore_ratio = restore_ratio
+        # Largo de racha necesario para cambiar (subir cuesta más que bajar)
+        self.degrade_after = degrade_after
+        self.restore_after = restore_after
+        self.samples = deque(maxlen=window)
+        self._total = 0.0
+        self.index = 0
+        # False = nivel fijo (--quality NOMBRE): record() solo mide
+        self.adaptive = True
+        self.over_frames = 0
+        self.calm_frames = 0
+        self.changes = 0
+
+    @property
+    def tier(self):
+        return TIERS[self.index]
+
+    @property
+    def mean_ms(self):
+        return self._total / len(self.samples) if self.samples else 0.0
+
+    def record(self, frame_ms):
+        """Registra un frame; True si cambió el nivel."""
+        if len(self.samples) == self.samples.maxlen:
+            self._total -= self.samples[0]
+        self.samples.append(frame_ms)
+        self._total += frame_ms
+        if not self.adaptive:
+            return False
+
+        mean = self.mean_ms
+        self.over_frames = self.over_frames + 1 if mean > self.budget_ms * self.degrade_ratio else 0
+        self.calm_frames = self.calm_frames + 1 if mean < self.budget_ms * self.restore_ratio else 0
+        index = decide_tier(self.index, self.over_frames, self.calm_frames,
+                            self.degrade_after, self.restore_after)
+        if index == self.index:
+            return False
+
+        previous = self.tier
+        self.index = index
+        self.over_frames = self.calm_frames = 0
+        # Las muestras viejas son del nivel anterior
+        self.samples.clear()
+        self._total = 0.0
+        self.changes += 1
+        print(f"[quality] {previous.name} -> {self.tier.name} (frame {mean:.1f} ms, presupuesto {self.budget_ms:.1f} ms)")
+        TELEMETRY.emit("quality", self.tier.name, round(mean, 2))
+        return True
@@ -0,0 +1,153 @@
+# core/render_backends.py
+# Backends de dibujo además del de pygame (interfaz en core.renderer):
+#   - "ascii": el frame como grilla de caracteres (un carácter por tile) en la
+#     terminal, para depurar por SSH sin ventana.
+#   - "recording": guarda los comandos de dibujo de cada frame (tests).
+# make_renderer elige el backend por nombre (--renderer) y, con un tile menor
+# a TILE_SIZE (--pixel-tile), la variante de baja resolución del de pygame.
+import sys
+import time
+
+from core.renderer import TILE_SIZE, NullRenderer, PixelRenderer, Renderer
+
+
+# ----------------------------------------------------------
+# ASCII
+# ----------------------------------------------------------
+class AsciiRenderer(NullRenderer):
+    NAME = "ascii"
+    DRAWS = True
+
+    # Tiles del mapa -> carácter
+    TILE_GLYPHS = {"#": "#", "-": "-"}
+    PELLET, POWERUP = ".", "o"
+
+    def __init__(self, screen, stream=None, max_fps=10):
+        super().__init__(screen)
+        self.stream = stream if stream is not None else sys.stdout
+        # La terminal no aguanta 60 fps: se escribe como mucho max_fps
+        self.min_interval = 1.0 / max_fps if max_fps else 0.0
+        self._last_write = None
+        self.rows = []
+
+    def cell(self, x, y):
+        return int(x) // TILE_SIZE, int(y) // TILE_SIZE
+
+    def put(self, col, row, text):
+        if 0 <= row < len(self.rows):
+            line = self.rows[row]
+            for i, ch in enumerate(text, col):
+                if 0 <= i < len(line):
+                    line[i] = ch
+
+    def clear(self, color):
+        width, height = self.size
+        self.rows = [[" "] * (width // TILE_SIZE) for _ in range(height // TILE_SIZE)]
+
+    def draw_sprite(self, image, x, y, glyph="?"):
+        # (x, y) es la esquina: el sprite ocupa el tile de su centro
+        self.put(*self.cell(x + TILE_SIZE // 2, y + TILE_SIZE // 2), glyph)
+
+    def draw_map(self, level):
+        glyphs = self.TILE_GLYPHS
+        for row, line in enumerate(level.tiles):
+            self.put(0, row, "".join(glyphs.get(ch, " ") for ch in line))
+        for col, row in level.pellets:
+            self.put(col, row, self.PELLET)
+        for col, row in level.powerups:
+            self.put(col, row, self.POWERUP)
+
+    def draw_text(self, text, x, y, color=(255,255,255), size=24):
+        self.put(*self.cell(x, y), text)
+
+    def draw_text_centered(self, text, cx, cy, color=(255,255,255), size=24, bold=False):
+        col, row = self.cell(cx, cy)
+        self.put(col - len(text) // 2, row, text)
+
+    def text(self):
+        return "\n".join("".join(line).rstrip() for line in self.rows)
+
+    def present(self):
+        now = time.perf_counter()
+        if self._last_write is not None and now - self._last_write < self.min_interval:
+            return
+        self._last_write = now
+        # Cursor al inicio y borrar hasta el final: redibuja sin scroll
+        self.stream.write("\x1b[H" + self.text() + "\n\x1b[J")
+        self.stream.flush()
+
+
+# ----------------------------------------------------------
+# GRABACIÓN
+# ----------------------------------------------------------
+class RecordingRenderer(NullRenderer):
+    """
+    Guarda cada llamada como tupla ("comando", args...) en `commands`; present()
+    cierra el frame en `frames` (los últimos max_frames). Sprites y mapa se
+    registran por su glyph / estado, no por píxeles.
+    """
+
+    NAME = "recording"
+    DRAWS = True
+
+    def __init__(self, screen, max_frames=120):
+        super().__init__(screen)
+        self.max_frames = max_frames
+        self.commands = []
+        self.frames = []
+
+    def clear(self, color):
+        self.commands.append(("clear", tuple(color)))
+
+    def fill_rect(self, rect, color, width=0, border_radius=0):
+        self.commands.append(("rect", tuple(rect), tuple(color), width))
+
+    def draw_circle(self, x, y, radius, color):
+        self.commands.append(("circle", x, y, radius, tuple(color)))
+
+    def draw_polygon(self, points, color):
+        self.commands.append(("polygon", len(points), tuple(color)))
+
+    def draw_sprite(self, image, x, y, glyph="?"):
+        self.commands.append(("sprite", glyph, x, y))
+
+    def draw_sprites(self, image, points, glyph="?"):
+        self.commands.append(("sprites", glyph, len(points)))
+
+    def draw_map(self, level):
+        self.commands.append(("map", level.map_file, len(level.pellets), len(level.powerups)))
+
+    def draw_text(self, text, x, y, color=(255,255,255), size=24):
+        self.commands.append(("text", text, x, y))
+
+    def draw_text_centered(self, text, cx, cy, color=(255,255,255), size=24, bold=False):
+        self.commands.append(("text", text, cx, cy))
+
+    def present(self):
+        self.frames.append(self.commands)
+        del self.frames[:-self.max_frames]
+        self.commands = []
+
+    def find(self, kind):
+        """Comandos de un tipo en el frame en curso."""
+        return [c for c in self.commands if c[0] == kind]
+
+
+RENDERERS = {
+    "pygame": Renderer,
+    "null": NullRenderer,
+    "ascii": AsciiRenderer,
+    "recording": RecordingRenderer,
+}
+
+
+def make_renderer(name, screen, tile=TILE_SIZE):
+    try:
+        backend = RENDERERS[name]
+    except KeyError:
+        raise ValueError(f"renderer desconocido: {name} (opciones: {', '.join(RENDERERS)})") from None
+    if tile == TILE_SIZE:
+        return backend(screen)
+    if backend is not Renderer:
+        raise ValueError(f"--pixel-tile solo aplica al renderer pygame (no a {name})")
+    return PixelRenderer(screen, tile)
@@ -0,0 +1,93 @@
+# core/render_pipeline.py
+# Escalado en un hilo aparte: mientras el hilo principal simula y dibuja el
+# frame N+1, este hilo escala el frame N. pygame suelta el GIL dentro de
+# smoothscale, así que en máquinas multinúcleo ese costo queda casi oculto
+# detrás de la simulación.
+#
+# SDL no es thread-safe para video en ninguna plataforma: el hilo solo trabaja
+# sobre surfaces sueltas (escalar). Blit a la ventana y display.flip siguen en
+# el hilo principal, el mismo que bombea los eventos.
+import threading
+import time
+
+
+class FramePresenter:
+    """
+    Un frame en vuelo como máximo. submit() espera a que el frame anterior se
+    haya escalado y lo devuelve para presentarlo en el hilo principal: al
+    volver, el buffer anterior queda libre para dibujar (doble buffer: ver
+    Game.swap_buffers).
+    """
+
+    def __init__(self, scale):
+        self._scale = scale
+        self._cond = threading.Condition()
+        self._pending = None
+        self._ready = None
+        self._busy = False
+        self._running = True
+        self._error = None
+        # Métricas: tiempo del hilo escalando y del hilo principal esperando
+        self.frames = 0
+        self.scale_time = 0.0
+        self.wait_time = 0.0
+        self._thread = threading.Thread(target=self._loop, name="presenter", daemon=True)
+        self._thread.start()
+
+    def submit(self, surface):
+        """Entrega `surface` al hilo; devuelve el frame anterior ya escalado (o None)."""
+        start = time.perf_counter()
+        with self._cond:
+            while self._pending is not None or self._busy:
+                self._cond.wait()
+            self.wait_time += time.perf_counter() - start
+            if self._error is not None:
+                error, self._error = self._error, None
+                raise error
+            ready, self._ready = self._ready, None
+            self._pending = surface
+            self._cond.notify_all()
+        return ready
+
+    def wait_idle(self):
+        with self._cond:
+            while self._pending is not None or self._busy:
+                self._cond.wait()
+
+    def stop(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        self._thread.join()
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                while self._pending is None and self._running:
+                    self._cond.wait()
+                if self._pending is None:
+                    return
+                surface, self._pending = self._pending, None
+                self._busy = True
+
+            start = time.perf_counter()
+            result = error = None
+            try:
+                result = self._scale(surface)
+            except Exception as e:
+                error = e
+            self.scale_time += time.perf_counter() - start
+            self.frames += 1
+
+            with self._cond:
+                self._ready, self._error = result, error
+                self._busy = False
+                self._cond.notify_all()
+
+    @property
+    def mean_scale_ms(self):
+        return self.scale_time / self.frames * 1000 if self.frames else 0.0
+
+    @property
+    def mean_wait_ms(self):
+        return self.wait_time / self.frames * 1000 if self.frames else 0.0
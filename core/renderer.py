@@ -1,19 +1,229 @@
 # core/renderer.py
+from collections import OrderedDict
+
 import pygame
 
 TILE_SIZE = 32  # tamaño en pixeles para cada celda
 
-class Renderer:
+# Fuentes cacheadas por (tamaño, negrita): SysFont abre y parsea el archivo
+# de fuente en cada llamada, así que nunca se crea una por frame.
+_FONTS = {}
+
+# Textos ya rasterizados (HUD, menú): LRU acotada para no crecer sin límite
+# cuando cambia el score.
+_TEXT_CACHE = OrderedDict()
+TEXT_CACHE_SIZE = 128
+
+# Tamaño mínimo de letra a baja resolución (PixelRenderer): por debajo no se lee
+MIN_TEXT_SIZE = 12
+
+
+def get_font(size, bold=False):
+    key = (size, bold)
+    font = _FONTS.get(key)
+    if font is None:
+        font = _FONTS[key] = pygame.font.SysFont(None, size, bold=bold)
+    return font
+
+
+def render_text(text, color, size, bold=False):
+    key = (text, tuple(color), size, bold)
+    surface = _TEXT_CACHE.get(key)
+    if surface is None:
+        surface = get_font(size, bold).render(text, True, color)
+        _TEXT_CACHE[key] = surface
+        if len(_TEXT_CACHE) > TEXT_CACHE_SIZE:
+            _TEXT_CACHE.popitem(last=False)
+    else:
+        _TEXT_CACHE.move_to_end(key)
+    return surface
+
+
+# ----------------------------------------------------------
+# INTERFAZ DE DIBUJO
+# Todo el código de draw (Level, Pacman, Ghost, HUD, Menu, Game) pasa por
+# estos métodos; nadie toca la surface directamente. NullRenderer es la
+# interfaz y a la vez el backend que no dibuja nada (servidores, headless).
+# Otros backends: Renderer (pygame) aquí; ASCII y grabación en
+# core.render_backends.
+# ----------------------------------------------------------
+class NullRenderer:
+    NAME = "null"
+    # False: Game ni siquiera recorre el draw del frame
+    DRAWS = False
+    # True: dibuja en `screen` y Game escala/presenta esa surface en la ventana;
+    # False: el backend presenta solo (present)
+    PRESENTS_SURFACE = False
+
     def __init__(self, screen):
+        # Surface interna del juego: define el tamaño lógico del frame
         self.screen = screen
+        # Calidad de dibujo (la ajusta el gobernador de core.quality)
+        self.neon_double = True
+        self.animate = True
+        # Píxeles lógicos por píxel de `screen` (> 1 solo en PixelRenderer)
+        self.factor = 1
+
+    @property
+    def size(self):
+        return self.screen.get_size()
+
+    def clear(self, color):
+        pass
+
+    def fill_rect(self, rect, color, width=0, border_radius=0):
+        """rect (x, y, w, h); color con alfa = panel semitransparente."""
 
     def draw_rect(self, x, y, color):
-        pygame.draw.rect(self.screen, color, (x, y, TILE_SIZE, TILE_SIZE))
+        self.fill_rect((x, y, TILE_SIZE, TILE_SIZE), color)
+
+    def draw_circle(self, x, y, radius, color):
+        pass
+
+    def draw_polygon(self, points, color):
+        pass
+
+    def draw_sprite(self, image, x, y, glyph="?"):
+        """image con esquina superior izquierda en (x, y); glyph = cómo se ve en texto."""
+
+    def draw_sprites(self, image, points, glyph="?"):
+        """La misma image en cada esquina de `points` (enjambres: una llamada por grupo)."""
+        for x, y in points:
+            self.draw_sprite(image, x, y, glyph)
+
+    def draw_map(self, level):
+        """Paredes, casita e items del nivel."""
+
+    def draw_text(self, text, x, y, color=(255,255,255), size=24):
+        pass
+
+    def draw_text_centered(self, text, cx, cy, color=(255,255,255), size=24, bold=False):
+        pass
+
+    def present(self):
+        """Fin de frame para backends que presentan solos."""
+
+
+class Renderer(NullRenderer):
+    """Backend pygame: dibuja en la surface interna que Game presenta en la ventana."""
+
+    NAME = "pygame"
+    DRAWS = True
+    PRESENTS_SURFACE = True
+
+    def __init__(self, screen):
+        super().__init__(screen)
+        # Paneles semitransparentes por (tamaño, color): se crean una sola vez
+        self._panels = {}
+
+    def clear(self, color):
+        self.screen.fill(color)
+
+    def fill_rect(self, rect, color, width=0, border_radius=0):
+        if len(color) == 4 and width == 0:
+            x, y, w, h = rect
+            key = (w, h, tuple(color))
+            panel = self._panels.get(key)
+            if panel is None:
+                panel = self._panels[key] = pygame.Surface((w, h), pygame.SRCALPHA)
+                panel.fill(color)
+            self.screen.blit(panel, (x, y))
+            return
+        pygame.draw.rect(self.screen, color, rect, width, border_radius=border_radius)
 
     def draw_circle(self, x, y, radius, color):
         pygame.draw.circle(self.screen, color, (x, y), radius)
 
+    def draw_polygon(self, points, color):
+        pygame.draw.polygon(self.screen, color, points)
+
+    def draw_sprite(self, image, x, y, glyph="?"):
+        self.screen.blit(image, (x, y))
+
+    def draw_sprites(self, image, points, glyph="?"):
+        self.screen.blits([(image, p) for p in points], doreturn=False)
+
+    def draw_map(self, level):
+        # Capas cacheadas del nivel: dos blits sin importar el tamaño del mapa
+        self.screen.blit(level.wall_layer(self.neon_double), (0, 0))
+        self.screen.blit(level.item_layer(), (0, 0))
+
+    def draw_text(self, text, x, y, color=(255,255,255), size=24):
+        self.screen.blit(render_text(text, color, size), (x, y))
+
+    def draw_text_centered(self, text, cx, cy, color=(255,255,255), size=24, bold=False):
+        surf = render_text(text, color, size, bold)
+        self.screen.blit(surf, surf.get_rect(center=(cx, cy)))
+
+
+class PixelRenderer(Renderer):
+    """
+    Backend pygame a baja resolución (--pixel-tile): `screen` mide 1/factor del
+    frame lógico, con tiles de `tile` px en vez de TILE_SIZE. Quien dibuja
+    sigue usando píxeles lógicos; acá se dividen. Sprites reducidos una sola
+    vez (cache) y capas del mapa dibujadas al tamaño chico; Game amplía la
+    surface a la ventana por un factor entero con vecino más cercano.
+    """
+
+    NAME = "pixel"
+
+    def __init__(self, screen, tile=16):
+        if tile <= 0 or TILE_SIZE % tile:
+            raise ValueError(f"tile de {tile} px: tiene que dividir a {TILE_SIZE}")
+        super().__init__(screen)
+        self.tile = tile
+        self.factor = TILE_SIZE // tile
+        # Sprite original -> versión reducida
+        self._sprites = {}
+
+    @property
+    def size(self):
+        width, height = self.screen.get_size()
+        return width * self.factor, height * self.factor
+
+    def sprite(self, image):
+        small = self._sprites.get(image)
+        if small is None:
+            width, height = image.get_size()
+            size = (max(1, width // self.factor), max(1, height // self.factor))
+            small = self._sprites[image] = pygame.transform.smoothscale(image, size)
+        return small
+
+    def text_size(self, size):
+        return max(MIN_TEXT_SIZE, size // self.factor)
+
+    def fill_rect(self, rect, color, width=0, border_radius=0):
+        f = self.factor
+        x, y, w, h = rect
+        super().fill_rect(
+            (x // f, y // f, max(1, w // f), max(1, h // f)), color,
+            max(1, width // f) if width else 0, border_radius // f,
+        )
+
+    def draw_circle(self, x, y, radius, color):
+        f = self.factor
+        pygame.draw.circle(self.screen, color, (x // f, y // f), max(1, radius // f))
+
+    def draw_polygon(self, points, color):
+        f = self.factor
+        pygame.draw.polygon(self.screen, color, [(x / f, y / f) for x, y in points])
+
+    def draw_sprite(self, image, x, y, glyph="?"):
+        self.screen.blit(self.sprite(image), (x // self.factor, y // self.factor))
+
+    def draw_sprites(self, image, points, glyph="?"):
+        small, f = self.sprite(image), self.factor
+        self.screen.blits([(small, (x // f, y // f)) for x, y in points], doreturn=False)
+
+    def draw_map(self, level):
+        self.screen.blit(level.wall_layer(self.neon_double, self.tile), (0, 0))
+        self.screen.blit(level.item_layer(self.tile), (0, 0))
+
     def draw_text(self, text, x, y, color=(255,255,255), size=24):
-        font = pygame.font.SysFont(None, size)
-        surface = font.render(text, True, color)
-        self.screen.blit(surface, (x, y))
+        f = self.factor
+        self.screen.blit(render_text(text, color, self.text_size(size)), (x // f, y // f))
+
+    def draw_text_centered(self, text, cx, cy, color=(255,255,255), size=24, bold=False):
+        f = self.factor
+        surf = render_text(text, color, self.text_size(size), bold)
+        self.screen.blit(surf, surf.get_rect(center=(cx // f, cy // f)))
@@ -0,0 +1,99 @@
+# core/replay.py
+# Grabación y reproducción de partidas. La simulación es determinista (punto
+# fijo, tick fijo, RNG sembrado por partida), así que una partida queda descrita
+# por su semilla, dificultad, mapa y los giros pedidos en cada tick: unos pocos
+# KB aunque dure minutos. Re-ejecutarla reproduce cada frame exactamente.
+import json
+from dataclasses import dataclass, field
+from typing import List, Tuple
+
+from core.net_protocol import CODE_DIRS, DIR_CODES, DIR_NAMES
+
+SESSION_VERSION = 1
+
+
+@dataclass
+class Session:
+    seed: int
+    difficulty: str
+    level_file: str
+    ticks: int = 0
+    # (tick, código de dirección) cada vez que cambia el giro pedido
+    inputs: List[Tuple[int, int]] = field(default_factory=list)
+
+    def to_dict(self):
+        return {
+            "version": SESSION_VERSION,
+            "seed": self.seed,
+            "difficulty": self.difficulty,
+            "level_file": self.level_file,
+            "ticks": self.ticks,
+            "inputs": [list(i) for i in self.inputs],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        if data.get("version") != SESSION_VERSION:
+            raise ValueError(f"sesión versión {data.get('version')} (se esperaba {SESSION_VERSION})")
+        return cls(
+            seed=data["seed"],
+            difficulty=data["difficulty"],
+            level_file=data["level_file"],
+            ticks=data["ticks"],
+            inputs=[tuple(i) for i in data["inputs"]],
+        )
+
+
+def save_session(session, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(session.to_dict(), f)
+
+
+def load_session(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return Session.from_dict(json.load(f))
+
+
+# ----------------------------------------------------------
+# GANCHOS DE Game (Game.session): begin() al iniciar partida y on_tick() al
+# comienzo de cada tick fijo, antes de mover nada
+# ----------------------------------------------------------
+class SessionRecorder:
+    def __init__(self, path=None):
+        self.path = path
+        self.session = None
+        self._last_code = 0
+
+    def begin(self, game):
+        self.session = Session(game.session_seed, game.difficulty_name, game.level_file)
+        self._last_code = 0
+
+    def on_tick(self, game, tick):
+        pacman = game.pacman
+        code = DIR_CODES.get((pacman.next_dir_x, pacman.next_dir_y), 0)
+        if code != self._last_code:
+            self.session.inputs.append((tick, code))
+            self._last_code = code
+        self.session.ticks = tick + 1
+
+    def save(self):
+        if self.session is not None and self.path:
+            save_session(self.session, self.path)
+
+
+class SessionPlayer:
+    def __init__(self, session):
+        self.session = session
+        self._index = 0
+
+    def begin(self, game):
+        self._index = 0
+
+    def on_tick(self, game, tick):
+        inputs = self.session.inputs
+        while self._index < len(inputs) and inputs[self._index][0] <= tick:
+            code = inputs[self._index][1]
+            self._index += 1
+            if code:
+                dx, dy = CODE_DIRS[code]
+                game.pacman.request_turn(dx, dy, DIR_NAMES[code])
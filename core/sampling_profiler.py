@@ -0,0 +1,172 @@
+# core/sampling_profiler.py
+# Perfilador por muestreo para producción (--profile / tecla F8): el juego no
+# se instrumenta; cada `interval` segundos de CPU se anota la pila del hilo
+# principal y se cuentan pilas idénticas. La salida es "collapsed stacks" (una
+# línea "raíz;...;hoja N" por pila), el formato que leen flamegraph.pl,
+# speedscope e inferno.
+#
+# En Unix muestrea con una señal (setitimer/ITIMER_PROF): el handler corre en
+# el hilo principal y ve el frame exacto. Donde no hay setitimer se usa un hilo
+# que lee sys._current_frames(); ese modo sobrerrepresenta las llamadas que
+# sueltan el GIL (blits, flip), porque solo ahí el hilo consigue muestrear.
+import os
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+
+DEFAULT_INTERVAL = 0.005
+PROFILE_FILE = "profile.folded"
+
+# Subsistemas del resumen: una muestra cuenta para cada uno que esté en su pila
+SUBSYSTEMS = (
+    "Game.render",
+    "Level.draw",
+    "Pacman.update",
+    "Ghost.update",
+    "SoundManager.play",
+)
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# ----------------------------------------------------------
+# FUNCIONES PURAS
+# ----------------------------------------------------------
+def frame_label(qualname, filename):
+    """'Ghost.update (entities/ghost.py)'; rutas fuera del repo solo por nombre de archivo."""
+    path = os.path.relpath(filename, _ROOT) if filename.startswith(_ROOT) else os.path.basename(filename)
+    return f"{qualname} ({path.replace(os.sep, '/')})"
+
+
+def collapse(stacks):
+    """{(label raíz, ..., label hoja): n} -> líneas collapsed, las más frecuentes primero."""
+    return [f"{';'.join(stack)} {n}" for stack, n in sorted(stacks.items(), key=lambda kv: -kv[1])]
+
+
+def subsystem_totals(stacks, subsystems=SUBSYSTEMS):
+    """{subsistema: muestras inclusivas} (una pila puede sumar a varios)."""
+    totals = dict.fromkeys(subsystems, 0)
+    for stack, n in stacks.items():
+        names = {label.split(" ", 1)[0] for label in stack}
+        for name in subsystems:
+            if name in names:
+                totals[name] += n
+    return totals
+
+
+# ----------------------------------------------------------
+# PERFILADOR
+# ----------------------------------------------------------
+class SamplingProfiler:
+    def __init__(self, interval=DEFAULT_INTERVAL):
+        self.interval = interval
+        # Pilas como tuplas de code objects (baratas de hashear); se pasan a
+        # texto recién al exportar
+        self._samples = Counter()
+        self._labels = {}
+        self._target = None
+        self._stop = threading.Event()
+        self._thread = None
+        self._previous_handler = None
+        self.mode = None
+        self.sample_time = 0.0
+        self.started_at = 0.0
+        self.elapsed = 0.0
+
+    @property
+    def running(self):
+        return self.mode is not None
+
+    @property
+    def samples(self):
+        return sum(self._samples.values())
+
+    def start(self):
+        """Empieza a muestrear el hilo que llama."""
+        if self.running:
+            return self
+        self._samples.clear()
+        self.sample_time = 0.0
+        self.started_at = time.perf_counter()
+        if hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread():
+            self.mode = "signal"
+            self._previous_handler = signal.signal(signal.SIGPROF, self._on_signal)
+            # Que la señal no corte syscalls en curso (audio, sockets): se reanudan
+            signal.siginterrupt(signal.SIGPROF, False)
+            signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        else:
+            self.mode = "thread"
+            self._target = threading.get_ident()
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        if self.mode == "signal":
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            signal.signal(signal.SIGPROF, self._previous_handler or signal.SIG_DFL)
+        elif self.mode == "thread":
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        else:
+            return
+        self.mode = None
+        self.elapsed = time.perf_counter() - self.started_at
+
+    def _record(self, frame):
+        stack = []
+        while frame is not None:
+            stack.append(frame.f_code)
+            frame = frame.f_back
+        self._samples[tuple(stack)] += 1
+
+    def _on_signal(self, signum, frame):
+        start = time.perf_counter()
+        self._record(frame)
+        self.sample_time += time.perf_counter() - start
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            start = time.perf_counter()
+            frame = sys._current_frames().get(self._target)
+            if frame is None:
+                return
+            self._record(frame)
+            del frame
+            self.sample_time += time.perf_counter() - start
+
+    # ----------------------------------------------------------
+    # RESULTADOS
+    # ----------------------------------------------------------
+    def label(self, code):
+        label = self._labels.get(code)
+        if label is None:
+            qualname = getattr(code, "co_qualname", code.co_name)
+            label = self._labels[code] = frame_label(qualname, code.co_filename)
+        return label
+
+    def stacks(self):
+        """{(raíz, ..., hoja): muestras} con labels de texto."""
+        stacks = Counter()
+        for codes, n in self._samples.items():
+            stacks[tuple(self.label(c) for c in reversed(codes))] += n
+        return stacks
+
+    def write(self, path):
+        lines = collapse(self.stacks())
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + ("\n" if lines else ""))
+        return path
+
+    def report(self):
+        total = self.samples
+        overhead = self.sample_time / self.elapsed * 100 if self.elapsed else 0.0
+        lines = [f"[profile] {total} muestras en {self.elapsed:.1f} s (costo de muestreo {overhead:.2f}%)"]
+        for name, n in subsystem_totals(self.stacks()).items():
+            share = n / total * 100 if total else 0.0
+            lines.append(f"  {name:<20}{share:>6.1f}%")
+        return "\n".join(lines)
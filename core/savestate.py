@@ -0,0 +1,323 @@
+# core/savestate.py
+# Save-states binarios de una partida (quick-save, rollback, reproducir bugs).
+#
+# Lo mutable (Game, HUD, EntityStore completo, efectos, timers, items restantes
+# y el estado del RNG) se empaqueta en bytes; lo inmutable (tiles, orden de
+# items) se comparte por referencia. Restaurar reescribe en el lugar: no
+# recarga sprites ni vuelve a parsear el mapa.
+import random
+import struct
+from array import array
+from dataclasses import dataclass
+
+from difficulty import DIFFICULTY_PRESETS
+from entities.store import EntityStore
+from core.net_protocol import cells_from_mask, item_mask
+
+SAVESTATE_VERSION = 3
+MAGIC = b"PMSS"
+
+GAME_STATES = ("LOADING", "MENU", "GAME", "PAUSE", "GAME_OVER", "VICTORY", "DYING")
+DIRECTION_CODES = ("left", "right", "up", "down")
+GHOST_COLORS = ("red", "pink", "blue", "orange")
+
+# Sin timer (o ya disparado)
+NO_TIMER = -1.0
+
+# versión, estado, nivel, combo, dificultad, reloj, puntaje, vidas, combo HUD, ticks de muerte (DYING)
+_HEADER = struct.Struct("<BBHHBdiiHH")
+_COUNT = struct.Struct("<H")
+_PACMAN = struct.Struct("<hBdBB")        # slot, dirección, multiplicador, invencible, n efectos
+_EFFECT = struct.Struct("<BdB")          # tipo, restante, pausado
+_GHOST = struct.Struct("<HBBBBdddddd")   # slot, color, dirección, congelado, casa abierta,
+                                         # velocidad base, spawn x/y, restante blink/salida/casa
+_RNG = struct.Struct("<625I")
+_GAUSS = struct.Struct("<Bd")
+
+
+def effect_types():
+    from powerups.speed_boost import SpeedBoost
+    from powerups.time_freeze import TimeFreeze
+    from powerups.score_multiplier import ScoreMultiplier
+    from powerups.fright_mode import FrightMode
+    from powerups.invincibility import Invincibility
+
+    return (SpeedBoost, TimeFreeze, ScoreMultiplier, FrightMode, Invincibility)
+
+
+@dataclass(frozen=True)
+class SaveState:
+    data: bytes
+    # Compartido por referencia (inmutable por mapa)
+    map_file: str
+    tiles: tuple
+    item_cells: tuple
+
+    def __len__(self):
+        return len(self.data)
+
+    def to_bytes(self):
+        name = self.map_file.encode("utf-8")
+        return MAGIC + _COUNT.pack(len(name)) + name + self.data
+
+
+# ==========================================================
+# HELPERS PUROS
+# ==========================================================
+
+def timer_remaining(timer):
+    """Restante de un timer (pausado o no); NO_TIMER si no hay o ya se disparó/canceló."""
+    if timer is None:
+        return NO_TIMER
+    if timer.paused is not None:
+        return timer.paused
+    if timer.cancelled:
+        return NO_TIMER
+    return timer.remaining
+
+
+def pack_rng(state):
+    version, internal, gauss = state
+    gauss_flag = gauss is not None
+    return _RNG.pack(*internal) + _GAUSS.pack(gauss_flag, gauss if gauss_flag else 0.0)
+
+
+def unpack_rng(data, offset):
+    internal = _RNG.unpack_from(data, offset)
+    flag, gauss = _GAUSS.unpack_from(data, offset + _RNG.size)
+    return (3, internal, gauss if flag else None), offset + _RNG.size + _GAUSS.size
+
+
+def difficulty_index(difficulty):
+    for i, preset in enumerate(DIFFICULTY_PRESETS.values()):
+        if preset is difficulty or preset == difficulty:
+            return i
+    return 0
+
+
+# ==========================================================
+# SNAPSHOT
+# ==========================================================
+
+def snapshot(game, include_rng=True):
+    """Captura la partida en curso (un jugador: game.pacman)."""
+    level, pacman, hud, store = game.level, game.pacman, game.hud, game.entity_store
+    types = effect_types()
+    parts = [_HEADER.pack(
+        SAVESTATE_VERSION, GAME_STATES.index(game.state), game.current_level, game.ghost_combo,
+        difficulty_index(game.difficulty), game.scheduler.now,
+        # El puntaje es float con ScoreMultiplier (10 * 2.0); siempre vale un entero
+        int(hud.score), hud.lives, hud.ghost_combo, game.dying_ticks,
+    )]
+
+    # EntityStore: cada array tipado se copia tal cual (memcpy)
+    parts.append(_COUNT.pack(len(store)))
+    for name in EntityStore.FIELDS:
+        parts.append(getattr(store, name).tobytes())
+    parts.append(_COUNT.pack(len(store._free)))
+    parts.append(array("H", store._free).tobytes())
+
+    parts.append(_PACMAN.pack(
+        pacman._slot, DIRECTION_CODES.index(pacman.direction), pacman.score_multiplier,
+        pacman.invincible, len(pacman.effects),
+    ))
+    for effect in pacman.effects:
+        parts.append(_EFFECT.pack(
+            types.index(type(effect)), timer_remaining(effect.timer),
+            effect.timer is not None and effect.timer.paused is not None,
+        ))
+
+    parts.append(_COUNT.pack(len(game.ghosts)))
+    for ghost in game.ghosts:
+        blink, exit_ = ghost.fright_timers or (None, None)
+        parts.append(_GHOST.pack(
+            ghost._slot, GHOST_COLORS.index(ghost.color), DIRECTION_CODES.index(ghost.direction),
+            ghost.frozen, ghost.house_open, ghost.base_speed, ghost.spawn_x, ghost.spawn_y,
+            timer_remaining(blink), timer_remaining(exit_), timer_remaining(ghost.house_timer),
+        ))
+
+    mask = item_mask(level.item_cells, level.pellets | level.powerups)
+    parts.append(_COUNT.pack(len(mask)))
+    parts.append(mask)
+
+    parts.append(bytes((include_rng,)))
+    if include_rng:
+        parts.append(pack_rng(random.getstate()))
+
+    return SaveState(b"".join(parts), level.map_file, level.tiles, level.item_cells)
+
+
+# ==========================================================
+# RESTORE
+# ==========================================================
+
+def restore(game, save):
+    """Deja `game` exactamente como estaba al tomar `save` (en el lugar)."""
+    from levels.level import Level
+
+    data = save.data
+    (version, state, current_level, combo, difficulty, now,
+     score, lives, hud_combo, dying_ticks) = _HEADER.unpack_from(data)
+    if version != SAVESTATE_VERSION:
+        raise ValueError(f"save-state versión {version} (se esperaba {SAVESTATE_VERSION})")
+    offset = _HEADER.size
+
+    if game.level is None or game.level.map_file != save.map_file:
+        game.level = Level(save.map_file, game=game)
+        game.pacman.level = game.level
+
+    # Reloj: todos los timers vigentes se reemplazan por los guardados
+    scheduler = game.scheduler
+    scheduler.clear()
+    scheduler.now = now
+
+    game.state = GAME_STATES[state]
+    game.dying_ticks = dying_ticks
+    game.current_level = current_level
+    game.ghost_combo = combo
+    game.difficulty = tuple(DIFFICULTY_PRESETS.values())[difficulty]
+    game.hud.score, game.hud.lives, game.hud.ghost_combo = score, lives, hud_combo
+
+    offset = restore_store(game.entity_store, data, offset)
+    offset = restore_pacman(game.pacman, data, offset)
+    offset = restore_ghosts(game, data, offset)
+
+    (mask_len,) = _COUNT.unpack_from(data, offset)
+    offset += _COUNT.size
+    game.level.set_items(cells_from_mask(game.level.item_cells, data[offset:offset + mask_len]))
+    offset += mask_len
+
+    if data[offset]:
+        rng_state, offset = unpack_rng(data, offset + 1)
+        random.setstate(rng_state)
+
+
+def restore_store(store, data, offset):
+    (size,) = _COUNT.unpack_from(data, offset)
+    offset += _COUNT.size
+    for name, (code, _) in EntityStore.FIELDS.items():
+        values = array(code)
+        nbytes = size * values.itemsize
+        values.frombytes(data[offset:offset + nbytes])
+        setattr(store, name, values)
+        offset += nbytes
+
+    (free,) = _COUNT.unpack_from(data, offset)
+    offset += _COUNT.size
+    slots = array("H")
+    slots.frombytes(data[offset:offset + free * slots.itemsize])
+    store._free = slots.tolist()
+    return offset + free * slots.itemsize
+
+
+def restore_pacman(pacman, data, offset):
+    types = effect_types()
+    slot, direction, multiplier, invincible, n_effects = _PACMAN.unpack_from(data, offset)
+    offset += _PACMAN.size
+
+    pacman._slot = slot
+    pacman.direction = DIRECTION_CODES[direction]
+    pacman.score_multiplier = multiplier
+    pacman.invincible = bool(invincible)
+    pacman.turn_stamp = None
+
+    # Los efectos ya están aplicados en el estado restaurado: solo se
+    # recrean los objetos y su expiración (sin volver a llamar apply)
+    pacman.effects = []
+    for _ in range(n_effects):
+        kind, remaining, paused = _EFFECT.unpack_from(data, offset)
+        offset += _EFFECT.size
+        effect = types[kind]()
+        effect.timer = restore_timer(pacman.scheduler, remaining, paused, pacman.expire_effect, effect)
+        pacman.effects.append(effect)
+    return offset
+
+
+def restore_ghosts(game, data, offset):
+    from entities.ghost import Ghost
+
+    (count,) = _COUNT.unpack_from(data, offset)
+    offset += _COUNT.size
+
+    records = []
+    for _ in range(count):
+        records.append(_GHOST.unpack_from(data, offset))
+        offset += _GHOST.size
+
+    colors = [GHOST_COLORS[r[1]] for r in records]
+    if [g.color for g in game.ghosts] != colors:
+        # Otra cantidad/orden de fantasmas: vistas nuevas (sprites de la cache).
+        # Los slots viejos no se liberan: el store restaurado ya los describe.
+        for ghost in game.ghosts:
+            ghost._slot = -1
+        # Se construyen sobre un store descartable para no tocar el restaurado
+        scratch = EntityStore(len(colors))
+        game.ghosts = [
+            Ghost(0, 0, game.level, color=color, store=scratch, scheduler=game.scheduler)
+            for color in colors
+        ]
+        for ghost in game.ghosts:
+            ghost._store = game.entity_store
+
+    scheduler = game.scheduler
+    for ghost, record in zip(game.ghosts, records):
+        (slot, _, direction, frozen, house_open, base_speed, spawn_x, spawn_y,
+         blink, exit_, house) = record
+        ghost._slot = slot
+        ghost.level = game.level
+        ghost.ai = game.ghost_ai()
+        ghost.direction = DIRECTION_CODES[direction]
+        ghost.frozen = bool(frozen)
+        ghost.house_open = bool(house_open)
+        ghost.base_speed = base_speed
+        ghost.fright_speed = base_speed * 0.7
+        ghost.eyes_speed = base_speed * 1.7
+        ghost.spawn_x, ghost.spawn_y = spawn_x, spawn_y
+
+        # Congelado = timers pausados (ver Ghost.set_frozen)
+        if exit_ == NO_TIMER:
+            ghost.fright_timers = ()
+        else:
+            ghost.fright_timers = (
+                restore_timer(scheduler, blink, frozen, ghost.enter_blink),
+                restore_timer(scheduler, exit_, frozen, ghost.exit_fright),
+            )
+        ghost.house_timer = restore_timer(scheduler, house, frozen, ghost.open_house)
+    return offset
+
+
+def restore_timer(scheduler, remaining, paused, callback, *args):
+    if remaining == NO_TIMER:
+        # Handle ya consumido (como el blink que ya se disparó)
+        timer = scheduler.schedule(0.0, callback, *args)
+        scheduler.cancel(timer)
+        return timer
+    timer = scheduler.schedule(remaining, callback, *args)
+    return scheduler.pause(timer) if paused else timer
+
+
+# ==========================================================
+# ARCHIVOS
+# ==========================================================
+
+def save_file(game, path):
+    with open(path, "wb") as f:
+        f.write(snapshot(game).to_bytes())
+
+
+def load_file(game, path):
+    """Lee un save-state de disco y lo restaura sobre `game` (mismo mapa)."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    if raw[:4] != MAGIC:
+        raise ValueError(f"{path}: no es un save-state")
+    (name_len,) = _COUNT.unpack_from(raw, 4)
+    start = 4 + _COUNT.size
+    map_file = raw[start:start + name_len].decode("utf-8")
+
+    from levels.level_loader import load_level_file
+
+    level = game.level if game.level is not None and game.level.map_file == map_file else None
+    tiles = level.tiles if level is not None else load_level_file(map_file)["tiles"]
+    item_cells = level.item_cells if level is not None else ()
+    restore(game, SaveState(raw[start + name_len:], map_file, tiles, item_cells))
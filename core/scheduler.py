@@ -0,0 +1,120 @@
+# core/scheduler.py
+# Planificador central sobre el reloj de simulación (min-heap por deadline).
+# Power-ups y estados de fantasmas registran aquí su expiración; advance(dt)
+# solo toca los timers que vencen en ese tick: O(k log n) con k = vencidos,
+# independiente de cuántos timers haya activos.
+import heapq
+import itertools
+
+
+class Timer:
+    """Handle devuelto por Scheduler.schedule (se puede cancelar o consultar)."""
+
+    __slots__ = ("deadline", "seq", "callback", "args", "cancelled", "scheduler", "paused")
+
+    def __init__(self, deadline, seq, callback, args, scheduler):
+        self.deadline = deadline
+        self.seq = seq
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+        self.scheduler = scheduler
+        # Si no es None: timer pausado (fuera del heap) con este tiempo restante
+        self.paused = None
+
+    def __lt__(self, other):
+        # Desempate por orden de registro: dos timers con el mismo deadline
+        # se disparan en el orden en que se pidieron (determinista)
+        return (self.deadline, self.seq) < (other.deadline, other.seq)
+
+    @property
+    def active(self):
+        return not self.cancelled and self.paused is None and self.deadline > self.scheduler.now
+
+    @property
+    def remaining(self):
+        if self.paused is not None:
+            return self.paused
+        if self.cancelled:
+            return 0.0
+        return max(0.0, self.deadline - self.scheduler.now)
+
+    def cancel(self):
+        self.scheduler.cancel(self)
+
+
+class Scheduler:
+    # Si más de la mitad del heap son timers cancelados, se compacta
+    COMPACT_RATIO = 0.5
+
+    def __init__(self):
+        self.now = 0.0
+        self._heap = []
+        self._seq = itertools.count()
+        self._cancelled = 0
+
+    def __len__(self):
+        return len(self._heap) - self._cancelled
+
+    # ----------------------------------------------------------
+    # REGISTRO
+    # ----------------------------------------------------------
+    def schedule(self, delay, callback, *args):
+        """Llama callback(*args) cuando el reloj avance `delay` segundos."""
+        timer = Timer(self.now + max(0.0, delay), next(self._seq), callback, args, self)
+        heapq.heappush(self._heap, timer)
+        return timer
+
+    def cancel(self, timer):
+        if timer is None or timer.cancelled:
+            return
+        timer.cancelled = True
+        # Borrado perezoso: el timer queda en el heap hasta que salga por arriba
+        self._cancelled += 1
+        if self._cancelled > len(self._heap) * self.COMPACT_RATIO:
+            self._compact()
+
+    def pause(self, timer):
+        """Saca un timer del reloj conservando lo que le falta (ver resume)."""
+        if timer is None or timer.cancelled:
+            return timer
+        remaining = timer.remaining
+        self.cancel(timer)
+        timer.paused = remaining
+        return timer
+
+    def resume(self, timer):
+        """Vuelve a poner en el reloj un timer pausado; devuelve el nuevo handle."""
+        if timer is None or timer.paused is None:
+            return timer
+        return self.schedule(timer.paused, timer.callback, *timer.args)
+
+    def clear(self):
+        for timer in self._heap:
+            timer.cancelled = True
+        self._heap = []
+        self._cancelled = 0
+
+    # ----------------------------------------------------------
+    # TICK
+    # ----------------------------------------------------------
+    def advance(self, dt):
+        """Avanza el reloj y dispara, en orden de deadline, los timers vencidos."""
+        self.now += dt
+        heap = self._heap
+        fired = 0
+        while heap and heap[0].deadline <= self.now:
+            timer = heapq.heappop(heap)
+            if timer.cancelled:
+                self._cancelled -= 1
+                continue
+            # Marcar como consumido antes de llamar (el callback puede re-agendar)
+            timer.cancelled = True
+            timer.callback(*timer.args)
+            fired += 1
+        return fired
+
+    def _compact(self):
+        self._heap = [t for t in self._heap if not t.cancelled]
+        heapq.heapify(self._heap)
+        self._cancelled = 0
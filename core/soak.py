@@ -0,0 +1,191 @@
+# core/soak.py
+# Modo soak: partidas de bot una tras otra durante horas, con muestreo periódico
+# de RSS, top de asignaciones (tracemalloc), cantidad de Surfaces vivas y deriva
+# del tiempo de frame. Si algo crece más allá del umbral, falla con un reporte.
+import gc
+import json
+import os
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from typing import List
+
+import pygame
+
+
+@dataclass(frozen=True)
+class SoakThresholds:
+    rss_growth_mb: float = 64.0
+    traced_growth_mb: float = 32.0
+    surface_growth: int = 200
+    frame_drift_pct: float = 50.0
+
+
+@dataclass
+class SoakSample:
+    elapsed_s: float
+    rss_mb: float
+    traced_mb: float
+    surfaces: int
+    frame_ms: float
+    games: int
+
+
+@dataclass
+class SoakReport:
+    ok: bool
+    failures: List[str] = field(default_factory=list)
+    samples: List[SoakSample] = field(default_factory=list)
+    top_allocators: List[str] = field(default_factory=list)
+
+    def to_json(self):
+        return json.dumps(asdict(self), indent=2)
+
+
+# ==========================================================
+# MEDICIONES
+# ==========================================================
+
+def current_rss_mb():
+    """RSS actual (Linux: /proc/self/statm); fallback al pico de getrusage."""
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reporta KB, macOS bytes
+        return peak / (1024 * 1024) if peak > 1 << 30 else peak / 1024
+
+
+def count_surfaces():
+    """
+    Surfaces vivas alcanzables desde objetos rastreados por el GC.
+    (pygame.Surface no es rastreado por sí mismo, así que se buscan como referentes.)
+    """
+    seen = set()
+    for obj in gc.get_objects():
+        for ref in gc.get_referents(obj):
+            if isinstance(ref, pygame.Surface):
+                seen.add(id(ref))
+    return len(seen)
+
+
+def check_growth(baseline, sample, limits):
+    """Funcion pura: lista de fallas de `sample` respecto a `baseline`."""
+    failures = []
+    if sample.rss_mb - baseline.rss_mb > limits.rss_growth_mb:
+        failures.append(f"RSS creció {sample.rss_mb - baseline.rss_mb:.1f} MB (> {limits.rss_growth_mb})")
+    if sample.traced_mb - baseline.traced_mb > limits.traced_growth_mb:
+        failures.append(
+            f"heap Python creció {sample.traced_mb - baseline.traced_mb:.1f} MB (> {limits.traced_growth_mb})"
+        )
+    if sample.surfaces - baseline.surfaces > limits.surface_growth:
+        failures.append(f"Surfaces vivas +{sample.surfaces - baseline.surfaces} (> {limits.surface_growth})")
+    if baseline.frame_ms > 0:
+        drift = (sample.frame_ms - baseline.frame_ms) / baseline.frame_ms * 100
+        if drift > limits.frame_drift_pct:
+            failures.append(f"tiempo de frame derivó {drift:.0f}% (> {limits.frame_drift_pct}%)")
+    return failures
+
+
+# ==========================================================
+# SHELL
+# ==========================================================
+
+def run_soak(hours, bot_name="avoid", interval_s=60.0, thresholds=SoakThresholds(),
+             report_path=None, dt=1 / 60, difficulty="NORMAL", trace_frames=1):
+    """
+    Corre partidas de bot hasta completar `hours` de reloj real.
+    La primera muestra (tras un intervalo de calentamiento) es la línea base.
+    trace_frames: profundidad de tracemalloc (más profundo = más lento).
+    Devuelve SoakReport; si report_path está definido, lo escribe como JSON.
+    """
+    from core.bots import make_bot
+    from core.headless import create_headless_game
+
+    tracemalloc.start(trace_frames)
+    bot = make_bot(bot_name)
+    game = create_headless_game(bot)
+    game.start_game_with_difficulty(difficulty)
+
+    report = SoakReport(ok=True)
+    start = time.perf_counter()
+    deadline = start + hours * 3600
+    next_sample = start + interval_s
+    baseline, baseline_snapshot = None, None
+    frame_total, frame_count, games = 0.0, 0, 1
+
+    while time.perf_counter() < deadline:
+        t0 = time.perf_counter()
+        game.handle_events()
+        game.update(dt)
+        game.render()
+        frame_total += time.perf_counter() - t0
+        frame_count += 1
+
+        if game.state in ("GAME_OVER", "VICTORY"):
+            game.start_game_with_difficulty(difficulty)
+            games += 1
+
+        now = time.perf_counter()
+        if now < next_sample:
+            continue
+        next_sample = now + interval_s
+
+        gc.collect()
+        sample = SoakSample(
+            elapsed_s=now - start,
+            rss_mb=current_rss_mb(),
+            traced_mb=tracemalloc.get_traced_memory()[0] / (1024 * 1024),
+            surfaces=count_surfaces(),
+            frame_ms=frame_total / frame_count * 1000,
+            games=games,
+        )
+        frame_total, frame_count = 0.0, 0
+        report.samples.append(sample)
+        print(f"[soak] {format_sample(sample)}")
+
+        if baseline is None:
+            baseline, baseline_snapshot = sample, tracemalloc.take_snapshot()
+            continue
+
+        failures = check_growth(baseline, sample, thresholds)
+        if failures:
+            report.ok = False
+            report.failures = failures
+            report.top_allocators = top_allocators(baseline_snapshot)
+            break
+
+    if report.ok and baseline_snapshot is not None:
+        report.top_allocators = top_allocators(baseline_snapshot)
+    tracemalloc.stop()
+
+    if report_path:
+        with open(report_path, "w") as f:
+            f.write(report.to_json())
+    return report
+
+
+def top_allocators(baseline_snapshot, limit=10):
+    """Líneas que más crecieron desde la línea base."""
+    stats = tracemalloc.take_snapshot().compare_to(baseline_snapshot, "lineno")
+    return [str(stat) for stat in stats[:limit]]
+
+
+def format_sample(sample):
+    return (
+        f"t={sample.elapsed_s:.0f}s rss={sample.rss_mb:.1f}MB heap={sample.traced_mb:.2f}MB "
+        f"surfaces={sample.surfaces} frame={sample.frame_ms:.3f}ms games={sample.games}"
+    )
+
+
+def format_report(report):
+    lines = ["[soak] OK" if report.ok else "[soak] FALLÓ"]
+    lines.extend(f"  - {failure}" for failure in report.failures)
+    if report.top_allocators:
+        lines.append("  top allocators (vs línea base):")
+        lines.extend(f"    {line}" for line in report.top_allocators)
+    return "\n".join(lines)
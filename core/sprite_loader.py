@@ -1,17 +1,50 @@
 import pygame
 import os
 
+# Cache de frames ya convertidos/escalados: (folder, size) -> [Surface]
+# Lo llena el AssetLoader en segundo plano; Pacman/Ghost solo leen de aquí.
+_FOLDER_CACHE = {}
+
+
+def _cache_key(folder_path, size):
+    return os.path.normpath(folder_path), size
+
+
 def load_sprite(path, size):
     """Carga una imagen individual y la escala a size."""
     img = pygame.image.load(path).convert_alpha()
     return pygame.transform.scale(img, (size, size))
 
-def load_folder(folder_path, size):
-    """Carga todos los png del folder y los escala."""
-    frames = []
+
+def read_folder(folder_path):
+    """
+    Decodifica los png del folder SIN convertir.
+    No toca el display, así que puede correr en un hilo del pool de carga.
+    """
+    images = []
     for filename in sorted(os.listdir(folder_path)):
         if filename.endswith(".png"):
-            img = pygame.image.load(os.path.join(folder_path, filename)).convert_alpha()
-            img = pygame.transform.scale(img, (size, size))
-            frames.append(img)
+            images.append(pygame.image.load(os.path.join(folder_path, filename)))
+    return images
+
+
+def prepare_frames(images, size):
+    """Convierte al formato del display y escala (hilo principal)."""
+    return [pygame.transform.scale(img.convert_alpha(), (size, size)) for img in images]
+
+
+def cache_folder(folder_path, size, frames):
+    _FOLDER_CACHE[_cache_key(folder_path, size)] = frames
+    return frames
+
+
+def is_folder_cached(folder_path, size):
+    return _cache_key(folder_path, size) in _FOLDER_CACHE
+
+
+def load_folder(folder_path, size):
+    """Carga todos los png del folder y los escala (usa la cache si ya se precargó)."""
+    frames = _FOLDER_CACHE.get(_cache_key(folder_path, size))
+    if frames is None:
+        frames = cache_folder(folder_path, size, prepare_frames(read_folder(folder_path), size))
     return frames
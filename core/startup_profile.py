@@ -0,0 +1,71 @@
+# core/startup_profile.py
+# Perfilador de arranque: tiempo de import e inicialización por subsistema.
+# Se activa con `python main.py --startup-profile`; registrar siempre es barato
+# (un perf_counter por sección), así que las mediciones no dependen del flag.
+import time
+from contextlib import contextmanager
+
+# Referencia temprana: lo más cerca posible del arranque del proceso
+PROCESS_START = time.perf_counter()
+
+
+class StartupProfiler:
+    KINDS = ("import", "init")
+
+    def __init__(self, t0=PROCESS_START):
+        self.t0 = t0
+        self.entries = []     # (subsystem, kind, seconds)
+        self.milestones = []  # (nombre, segundos desde t0)
+
+    # ----------------------------------------------------------
+    # REGISTRO
+    # ----------------------------------------------------------
+    @contextmanager
+    def measure(self, subsystem, kind="init"):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(subsystem, kind, time.perf_counter() - start)
+
+    def record(self, subsystem, kind, seconds):
+        if kind not in self.KINDS:
+            raise ValueError(f"Tipo de medición desconocido: {kind}")
+        self.entries.append((subsystem, kind, seconds))
+
+    def milestone(self, name):
+        """Marca un hito una sola vez (p.ej. primer frame)."""
+        if not self.has_milestone(name):
+            self.milestones.append((name, time.perf_counter() - self.t0))
+
+    def has_milestone(self, name):
+        return any(n == name for n, _ in self.milestones)
+
+    # ----------------------------------------------------------
+    # REPORTE
+    # ----------------------------------------------------------
+    def totals(self):
+        """Funcion pura sobre entries: {subsystem: {"import": s, "init": s}} en orden de aparición."""
+        table = {}
+        for subsystem, kind, seconds in self.entries:
+            row = table.setdefault(subsystem, {k: 0.0 for k in self.KINDS})
+            row[kind] += seconds
+        return table
+
+    def report(self):
+        lines = [
+            "== Startup profile ==",
+            f"{'subsystem':<14}{'import ms':>12}{'init ms':>12}",
+        ]
+        for subsystem, row in self.totals().items():
+            lines.append(f"{subsystem:<14}{row['import'] * 1000:>12.2f}{row['init'] * 1000:>12.2f}")
+
+        if self.milestones:
+            lines.append("-- milestones (ms since start) --")
+            for name, at in self.milestones:
+                lines.append(f"{name:<26}{at * 1000:>12.2f}")
+        return "\n".join(lines)
+
+
+# Instancia global: main.py y Game registran aquí
+PROFILER = StartupProfiler()
@@ -0,0 +1,149 @@
+# core/telemetry.py
+# Telemetría estructurada sin bloquear el frame: emit() solo escribe una tupla
+# en un ring buffer preasignado; un hilo escritor vacía el buffer por lotes a
+# archivos JSONL rotativos. Si el buffer se llena, el evento se descarta y se
+# cuenta (el escritor reporta los descartes como un evento más).
+import json
+import os
+import threading
+import time
+
+# Evento -> nombres de sus campos (emit pasa los valores en este orden)
+EVENT_FIELDS = {
+    "pellet": ("col", "row"),
+    "powerup": ("kind", "col", "row"),
+    "ghost_eaten": ("color", "points", "combo"),
+    "death": ("col", "row"),
+    "level": ("level",),
+    "game_over": ("score", "level"),
+    "sound_error": ("name", "message"),
+    "quality": ("tier", "frame_ms"),
+    "telemetry_dropped": ("count",),
+}
+
+
+def event_to_dict(record):
+    """Funcion pura: (t, evento, valores) -> dict serializable."""
+    t, kind, values = record
+    fields = EVENT_FIELDS.get(kind)
+    data = {"t": round(t, 6), "event": kind}
+    if fields is None:
+        data["data"] = list(values)
+    else:
+        data.update(zip(fields, values))
+    return data
+
+
+class Telemetry:
+    def __init__(self, capacity=4096, max_bytes=5 * 1024 * 1024, backups=3, flush_interval=0.25):
+        self.capacity = capacity
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.flush_interval = flush_interval
+
+        # Ring buffer preasignado: head = próximo a escribir, tail = próximo a leer
+        self._ring = [None] * capacity
+        self._head = 0
+        self._tail = 0
+        # emit puede venir de hilos del AssetLoader (errores de sonido)
+        self._lock = threading.Lock()
+
+        self.enabled = False
+        self.path = None
+        self.emitted = 0
+        self.dropped = 0
+        self.written = 0
+        self._reported_drops = 0
+        self._thread = None
+        self._wake = threading.Event()
+        self._stop = False
+
+    # ----------------------------------------------------------
+    # HOT PATH
+    # ----------------------------------------------------------
+    def emit(self, kind, *values):
+        if not self.enabled:
+            return
+        with self._lock:
+            if self._head - self._tail >= self.capacity:
+                self.dropped += 1
+                return
+            self._ring[self._head % self.capacity] = (time.time(), kind, values)
+            self._head += 1
+            self.emitted += 1
+
+    # ----------------------------------------------------------
+    # CICLO DE VIDA
+    # ----------------------------------------------------------
+    def start(self, path):
+        if self.enabled:
+            return
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._stop = False
+        self.enabled = True
+        self._thread = threading.Thread(target=self._run, name="telemetry", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Deja de aceptar eventos y vacía lo pendiente a disco."""
+        if not self.enabled:
+            return
+        self.enabled = False
+        self._stop = True
+        self._wake.set()
+        self._thread.join()
+        self._thread = None
+
+    # ----------------------------------------------------------
+    # ESCRITOR (hilo de fondo)
+    # ----------------------------------------------------------
+    def drain(self):
+        with self._lock:
+            head, tail = self._head, self._tail
+            batch = [self._ring[i % self.capacity] for i in range(tail, head)]
+            for i in range(tail, head):
+                self._ring[i % self.capacity] = None
+            self._tail = head
+            dropped = self.dropped
+        if dropped > self._reported_drops:
+            batch.append((time.time(), "telemetry_dropped", (dropped - self._reported_drops,)))
+            self._reported_drops = dropped
+        return batch
+
+    def _run(self):
+        f = open(self.path, "a", encoding="utf-8")
+        try:
+            while True:
+                self._wake.wait(self.flush_interval)
+                self._wake.clear()
+                batch = self.drain()
+                if batch:
+                    f.write("".join(json.dumps(event_to_dict(r)) + "\n" for r in batch))
+                    f.flush()
+                    self.written += len(batch)
+                    if f.tell() >= self.max_bytes:
+                        f.close()
+                        self.rotate()
+                        f = open(self.path, "a", encoding="utf-8")
+                if self._stop and self._head == self._tail:
+                    return
+        finally:
+            f.close()
+
+    def rotate(self):
+        """events.jsonl -> events.jsonl.1 -> ... -> events.jsonl.<backups> (el más viejo se borra)."""
+        for i in range(self.backups - 1, 0, -1):
+            src = f"{self.path}.{i}"
+            if os.path.exists(src):
+                os.replace(src, f"{self.path}.{i + 1}")
+        if self.backups > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+
+
+# Instancia global (deshabilitada hasta TELEMETRY.start(path))
+TELEMETRY = Telemetry()
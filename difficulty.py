@@ -15,10 +15,12 @@ DIFFICULTY_PRESETS = {
         "ghost_speed": 150,
         "ghost_speed_growth": 1.12,
         "powerup_duration_factor": 0.8,
+        "ghost_ai": "lookahead",      # entities.ghost_ai (sin clave = aleatorio)
     },
     "CHAOS": {
         "ghost_speed": 180,
         "ghost_speed_growth": 1.15,
         "powerup_duration_factor": 0.6,
+        "ghost_ai": "lookahead",
     },
 }
@@ -1,13 +1,43 @@
 # entities/entity.py
 import math
 
+from core.fixed_point import cell_of, center_of, next_center
+from entities.store import DEFAULT_STORE, KIND_FREE, FixedField, StoreField
+
+
 class Entity:
-    def __init__(self, x, y, speed=100):
+    """
+    Vista fina sobre un slot del EntityStore: posición, velocidad y timers
+    viven en arrays tipados; aquí solo quedan referencias (__slots__).
+    """
+
+    __slots__ = ("_store", "_slot", "effects", "invincible")
+
+    KIND = KIND_FREE
+
+    # Píxeles (float) para dibujo, red y colisión; fx/fy son los enteros en
+    # sub-píxeles con los que se mueve la simulación
+    x = FixedField("x")
+    y = FixedField("y")
+    fx = StoreField("x")
+    fy = StoreField("y")
+    prev_x = FixedField("prev_x")
+    prev_y = FixedField("prev_y")
+    speed = StoreField("speed")
+    speed_multiplier = StoreField("speed_multiplier")
+    dir_x = StoreField("dir_x")
+    dir_y = StoreField("dir_y")
+
+    def __init__(self, x, y, speed=100, store=None):
         """
         x, y representan SIEMPRE el CENTRO del sprite.
         """
+        self._store = store if store is not None else DEFAULT_STORE
+        self._slot = self._store.allocate(self.KIND)
+
         self.x = x
         self.y = y
+        self.mark_previous()
         self.speed = speed
 
         # Para powerups
@@ -15,6 +45,74 @@ class Entity:
         self.invincible = False
         self.speed_multiplier = 1.0
 
+    # -----------------------------
+    # SLOT DEL STORE
+    # -----------------------------
+    def release(self):
+        """Devuelve el slot al store (idempotente)."""
+        if self._slot >= 0:
+            self._store.release(self._slot)
+            self._slot = -1
+
+    def __del__(self):
+        try:
+            self.release()
+        except Exception:
+            pass
+
+    def mark_previous(self):
+        """Inicio de un sub-paso: desde acá se barre el movimiento."""
+        store, slot = self._store, self._slot
+        store.prev_x[slot] = store.x[slot]
+        store.prev_y[slot] = store.y[slot]
+
+    # -----------------------------
+    # MOVIMIENTO EN PUNTO FIJO
+    # -----------------------------
+    def current_cell(self):
+        return cell_of(self.fx), cell_of(self.fy)
+
+    def is_centered(self):
+        return self.fx == center_of(cell_of(self.fx)) and self.fy == center_of(cell_of(self.fy))
+
+    def move_fixed(self, step, on_center):
+        """
+        Avanza `step` sub-píxeles en la dirección actual. Cada centro de tile se
+        alcanza exacto (nunca se saltea): ahí se llama on_center() para decidir
+        giros y, si la dirección queda bloqueada, la entidad se queda en el centro.
+        El eje perpendicular al movimiento siempre queda en el centro del tile.
+        """
+        store, slot = self._store, self._slot
+        xs, ys = store.x, store.y
+        while step > 0:
+            fx, fy = xs[slot], ys[slot]
+            cx, cy = center_of(cell_of(fx)), center_of(cell_of(fy))
+            if fx == cx and fy == cy:
+                on_center()
+                if not self.can_move(self.dir_x, self.dir_y):
+                    return
+
+            dx, dy = self.dir_x, self.dir_y
+            if dx:
+                ys[slot] = cy
+                target = next_center(fx, dx)
+                dist = abs(target - fx)
+                if step < dist:
+                    xs[slot] = fx + dx * step
+                    return
+                xs[slot] = target
+            elif dy:
+                xs[slot] = cx
+                target = next_center(fy, dy)
+                dist = abs(target - fy)
+                if step < dist:
+                    ys[slot] = fy + dy * step
+                    return
+                ys[slot] = target
+            else:
+                return
+            step -= dist
+
     # -----------------------------
     # POWERUPS
     # -----------------------------
@@ -2,84 +2,147 @@
 import random
 import os
 from entities.entity import Entity
+from entities.store import KIND_GHOST, FRIGHTENED_STATES, GhostState, StateField, StoreField
+from core.scheduler import Scheduler
 from core.renderer import TILE_SIZE
 from core.sprite_loader import load_folder
+from core.fixed_point import approach, step_units, to_fixed
 
 
-class Ghost(Entity):
+GHOST_SPRITES_DIR = "assets/sprites/ghosts"
+DIRECTIONS = ("left", "right", "up", "down")
+
+
+def sprite_folders(color):
+    """Función pura: carpetas de sprites que usa un fantasma de ese color (para precarga)."""
+    folders = [f"{GHOST_SPRITES_DIR}/{color}/{d}" for d in DIRECTIONS]
+    folders.append(f"{GHOST_SPRITES_DIR}/fright")
+    folders.append(f"{GHOST_SPRITES_DIR}/fright_blink")
+    folders.extend(f"{GHOST_SPRITES_DIR}/eyes/{d}" for d in DIRECTIONS)
+    return [f for f in folders if os.path.isdir(f)]
+
+
+def load_safe(folder):
+    return load_folder(folder, TILE_SIZE) if os.path.exists(folder) else []
+
+
+# color -> (normal, fright, blink, eyes); los frames ya vienen de la cache de sprites
+_ANIMS = {}
+
+
+def load_anims(color):
+    cached = _ANIMS.get(color)
+    if cached is not None:
+        return cached
 
-    def __init__(self, x, y, level, color="red", speed=90):
-        super().__init__(x, y, speed)
+    base = f"{GHOST_SPRITES_DIR}/{color}"
+    anim_normal = {
+        "left":  load_safe(base + "/left"),
+        "right": load_safe(base + "/right"),
+        "up":    load_safe(base + "/up"),
+        "down":  load_safe(base + "/down"),
+    }
+
+    if all(len(fr) == 0 for fr in anim_normal.values()):
+        frames = load_safe(base)
+        anim_normal = {d: frames for d in ["left", "right", "up", "down"]}
+
+    anim_fright = {d: load_safe(f"{GHOST_SPRITES_DIR}/fright")
+                   for d in ["left", "right", "up", "down"]}
+
+    anim_blink = {d: load_safe(f"{GHOST_SPRITES_DIR}/fright_blink")
+                  for d in ["left", "right", "up", "down"]}
+
+    eyes = f"{GHOST_SPRITES_DIR}/eyes"
+    anim_eyes = {
+        "left": load_safe(eyes + "/left"),
+        "right": load_safe(eyes + "/right"),
+        "up": load_safe(eyes + "/up"),
+        "down": load_safe(eyes + "/down"),
+    }
+
+    cached = _ANIMS[color] = (anim_normal, anim_fright, anim_blink, anim_eyes)
+    return cached
+
+
+class Ghost(Entity):
+    __slots__ = (
+        "level", "color", "frozen",
+        "base_speed", "fright_speed", "eyes_speed",
+        "fright_duration", "blink_threshold",
+        "spawn_x", "spawn_y",
+        "anim_normal", "anim_fright", "anim_blink", "anim_eyes",
+        "direction", "anim_speed",
+        "scheduler", "fright_timers", "house_timer", "house_open", "ai",
+    )
+
+    KIND = KIND_GHOST
+
+    state = StateField("state")
+    anim_timer = StoreField("anim_timer")
+    anim_frame = StoreField("anim_frame")
+
+    def __init__(self, x, y, level, color="red", speed=90, store=None, scheduler=None):
+        super().__init__(x, y, speed, store=store)
         self.level = level
         self.color = color
+
+        # Timers de estado registrados en el reloj de simulación
+        self.scheduler = scheduler if scheduler is not None else Scheduler()
+        self.fright_timers = ()
+        self.house_timer = None
+
+        # Controlador de búsqueda opcional (entities.ghost_ai); None = aleatorio
+        self.ai = None
+
+        self.fright_duration = 6.0
+        self.blink_threshold = 2.0
+
+        # Sprites (dicts compartidos por color: respawnear no los reconstruye)
+        self.anim_normal, self.anim_fright, self.anim_blink, self.anim_eyes = load_anims(color)
+        self.anim_speed = 0.15
+
+        self.respawn(x, y, speed)
+
+    def respawn(self, x, y, speed, house_delay=None):
+        """
+        Deja el fantasma como recién creado en (x, y), en el lugar: mismo slot
+        del store, mismos sprites, sin objetos nuevos. Con house_delay arranca
+        esperando en la casita.
+        """
+        self.cancel_fright_timers()
+        self.scheduler.cancel(self.house_timer)
+        self.house_timer = None
+        self.house_open = False
         self.frozen = False
 
+        self.x = x
+        self.y = y
+        self.mark_previous()
+        self.speed_multiplier = 1.0
+
         # Velocidades por estado
         self.base_speed = speed
         self.fright_speed = speed * 0.7
         self.eyes_speed = speed * 1.7
+        self.speed = speed
 
-        # Estados
-        self.state = "normal"      # normal | fright | blink | eyes | house
-        self.fright_timer = 0.0
-        self.fright_duration = 6.0
-        self.blink_threshold = 2.0
+        self.state = GhostState.NORMAL
 
         # Spawn real (para ojos)
         self.spawn_x = x
         self.spawn_y = y
 
-        # Sprites
-        base = f"assets/sprites/ghosts/{color}"
-        self.anim_normal = {
-            "left":  self.load_safe(base + "/left"),
-            "right": self.load_safe(base + "/right"),
-            "up":    self.load_safe(base + "/up"),
-            "down":  self.load_safe(base + "/down"),
-        }
-
-        if all(len(fr) == 0 for fr in self.anim_normal.values()):
-            frames = self.load_safe(base)
-            self.anim_normal = {d: frames for d in ["left", "right", "up", "down"]}
-
-        self.anim_fright = {d: self.load_safe("assets/sprites/ghosts/fright")
-                            for d in ["left", "right", "up", "down"]}
-
-        self.anim_blink = {d: self.load_safe("assets/sprites/ghosts/fright_blink")
-                           for d in ["left", "right", "up", "down"]}
-
-        eyes = "assets/sprites/ghosts/eyes"
-        self.anim_eyes = {
-            "left": self.load_safe(eyes + "/left"),
-            "right": self.load_safe(eyes + "/right"),
-            "up": self.load_safe(eyes + "/up"),
-            "down": self.load_safe(eyes + "/down"),
-        }
-
         # Animación
         self.direction = "left"
         self.anim_frame = 0
         self.anim_timer = 0.0
-        self.anim_speed = 0.15
 
         # Dirección inicial
         self.dir_x, self.dir_y = random.choice([(1,0), (-1,0), (0,1), (0,-1)])
 
-
-    # ----------------------------------------------------------
-    # HELPERS
-    # ----------------------------------------------------------
-    def load_safe(self, folder):
-        return load_folder(folder, TILE_SIZE) if os.path.exists(folder) else []
-
-    def current_cell(self):
-        return int(self.x // TILE_SIZE), int(self.y // TILE_SIZE)
-
-    def tile_center(self, col, row):
-        return (
-            col * TILE_SIZE + TILE_SIZE / 2,
-            row * TILE_SIZE + TILE_SIZE / 2
-        )
+        if house_delay is not None:
+            self.enter_house(house_delay)
 
 
     # ----------------------------------------------------------
@@ -110,7 +173,7 @@ class Ghost(Entity):
         # ------------------------------------------------------
         # 3) MODO OJOS → ignora puerta y casita
         # ------------------------------------------------------
-        if self.state == "eyes":
+        if self.state == GhostState.EYES:
             return True
 
         # ------------------------------------------------------
@@ -134,6 +197,12 @@ class Ghost(Entity):
             if self.can_move(dx, dy):
                 options.append((dx, dy))
 
+        if len(options) > 1 and self.ai is not None:
+            choice = self.ai.choose(self, options)
+            if choice is not None:
+                self.dir_x, self.dir_y = choice
+                return
+
         if options:
             self.dir_x, self.dir_y = random.choice(options)
         else:
@@ -149,30 +218,85 @@ class Ghost(Entity):
     # ESTADOS
     # ----------------------------------------------------------
     def enter_fright(self):
-        if self.state == "eyes":
+        if self.state == GhostState.EYES:
             return
-        self.state = "fright"
-        self.fright_timer = self.fright_duration
+        self.state = GhostState.FRIGHT
         self.speed = self.fright_speed
         self.dir_x *= -1
         self.dir_y *= -1
 
+        # Un nuevo fright reinicia la cuenta: se reemplazan los timers previos
+        self.cancel_fright_timers()
+        self.fright_timers = (
+            self.schedule_state(self.fright_duration - self.blink_threshold, self.enter_blink),
+            self.schedule_state(self.fright_duration, self.exit_fright),
+        )
+
     def enter_blink(self):
-        if self.state == "fright":
-            self.state = "blink"
+        if self.state == GhostState.FRIGHT:
+            self.state = GhostState.BLINK
 
     def enter_eyes(self):
-        self.state = "eyes"
+        self.cancel_fright_timers()
+        self.state = GhostState.EYES
         self.speed = self.eyes_speed
 
     def exit_fright(self):
-        self.state = "normal"
+        if self.state not in FRIGHTENED_STATES:
+            return
+        self.state = GhostState.NORMAL
         self.speed = self.base_speed
 
     def exit_eyes(self):
-        self.state = "normal"
+        self.state = GhostState.NORMAL
         self.speed = self.base_speed
 
+    def enter_house(self, delay):
+        """Espera `delay` segundos de simulación dentro de la casita antes de salir."""
+        self.state = GhostState.HOUSE
+        self.dir_x = 0
+        self.dir_y = 0
+        self.house_open = False
+        self.scheduler.cancel(self.house_timer)
+        self.house_timer = self.schedule_state(delay, self.open_house)
+
+    def open_house(self):
+        self.house_open = True
+
+    @property
+    def fright_remaining(self):
+        return self.fright_timers[1].remaining if self.fright_timers else 0.0
+
+    # ----------------------------------------------------------
+    # TIMERS
+    # ----------------------------------------------------------
+    def cancel_fright_timers(self):
+        for timer in self.fright_timers:
+            self.scheduler.cancel(timer)
+            timer.paused = None
+        self.fright_timers = ()
+
+    def schedule_state(self, delay, callback):
+        """Timer de estado; congelado, nace pausado (lo reanuda set_frozen(False))."""
+        timer = self.scheduler.schedule(delay, callback)
+        return self.scheduler.pause(timer) if self.frozen else timer
+
+    def set_frozen(self, frozen):
+        """Congelado, el fantasma tampoco avanza sus timers de estado (se pausan)."""
+        if frozen == self.frozen:
+            return
+        self.frozen = frozen
+        step = self.scheduler.pause if frozen else self.scheduler.resume
+        self.fright_timers = tuple(step(t) for t in self.fright_timers)
+        self.house_timer = step(self.house_timer)
+
+    def release(self):
+        # Un fantasma descartado no debe recibir callbacks de timers viejos
+        self.cancel_fright_timers()
+        self.scheduler.cancel(self.house_timer)
+        self.house_timer = None
+        super().release()
+
 
     # ----------------------------------------------------------
     # UPDATE
@@ -182,21 +306,14 @@ class Ghost(Entity):
             return
 
         # Modo casita
-        if self.state == "house":
+        if self.state == GhostState.HOUSE:
             return self.update_house(dt)
 
         # Modo ojos
-        if self.state == "eyes":
+        if self.state == GhostState.EYES:
             return self.update_eyes(dt)
 
-        # Manejo fright/blink
-        if self.state in ["fright", "blink"]:
-            self.fright_timer -= dt
-            if self.state == "fright" and self.fright_timer <= self.blink_threshold:
-                self.enter_blink()
-            if self.fright_timer <= 0:
-                self.exit_fright()
-
+        # fright/blink -> normal lo disparan los timers del Scheduler
         self.update_walk(dt)
 
 
@@ -204,64 +321,16 @@ class Ghost(Entity):
     # WALK
     # ----------------------------------------------------------
     def update_walk(self, dt):
+        # Punto fijo: en cada centro de tile (exacto) se elige la próxima salida
+        self.move_fixed(step_units(self.speed, dt), self.choose_new_direction)
 
-        move_step = self.speed * dt
-
-        col, row = self.current_cell()
-        cx, cy = self.tile_center(col, row)
-
-        dist_x = cx - self.x
-        dist_y = cy - self.y
-
-        # 1. Si está cerca del centro → SNAP SUAVE + cambio de dirección
-        if abs(dist_x) <= 1.2 and abs(dist_y) <= 1.2:
-
-            # Snap suave
-            self.x += dist_x * 0.35
-            self.y += dist_y * 0.35
-
-            self.choose_new_direction()
-
-        # 2. Overshoot prevention (misma lógica que Pac-Man)
-        limit = abs(dist_x) if self.dir_x != 0 else abs(dist_y)
-
-        if move_step > limit >= 0.1:
-
-            # Llegar al centro sin pasarse
-            self.x += self.dir_x * limit
-            self.y += self.dir_y * limit
-
-            # Snap suave (nada de teletransporte)
-            self.x += (cx - self.x) * 0.35
-            self.y += (cy - self.y) * 0.35
-
-            leftover = move_step - limit
-
-            if self.can_move(self.dir_x, self.dir_y):
-                self.x += self.dir_x * leftover
-                self.y += self.dir_y * leftover
-
-            return
-
-        # 3. Movimiento normal
-        nx = self.x + self.dir_x * move_step
-        ny = self.y + self.dir_y * move_step
-
-        if self.can_move(self.dir_x, self.dir_y):
-            self.x = nx
-            self.y = ny
-        else:
-            # Snap suave para evitar rebotes raros
-            self.x += dist_x * 0.35
-            self.y += dist_y * 0.35
-
-        # 4. Sprite direction
+        # Sprite direction
         if self.dir_x < 0: self.direction = "left"
         elif self.dir_x > 0: self.direction = "right"
         elif self.dir_y < 0: self.direction = "up"
         elif self.dir_y > 0: self.direction = "down"
 
-        # 5. Animación
+        # Animación
         self.anim_timer += dt
         if self.anim_timer >= self.anim_speed:
             self.anim_timer = 0
@@ -274,39 +343,33 @@ class Ghost(Entity):
     # HOUSE MODE
     # ----------------------------------------------------------
     def update_house(self, dt):
-        self.house_timer -= dt
-        if self.house_timer > 0:
+        if not self.house_open:
             return
 
         # Salir hacia arriba
         self.dir_x = 0
         self.dir_y = -1
-        step = self.speed * dt
-        self.y += self.dir_y * step
+        self.fy -= step_units(self.speed, dt)
 
         col, row = self.current_cell()
 
         # En cuanto sale → normal
         if (col, row) not in self.level.ghost_house_area:
-            self.state = "normal"
+            self.state = GhostState.NORMAL
 
 
     # ----------------------------------------------------------
     # EYES MODE
     # ----------------------------------------------------------
     def update_eyes(self, dt):
-        sx, sy = self.spawn_x, self.spawn_y
-
-        # Regresa al spawn
-        step = self.eyes_speed * dt
-        dx = 1 if sx > self.x else -1 if sx < self.x else 0
-        dy = 1 if sy > self.y else -1 if sy < self.y else 0
+        sx, sy = to_fixed(self.spawn_x), to_fixed(self.spawn_y)
 
-        self.x += dx * step
-        self.y += dy * step
+        # Regresa al spawn (en diagonal, atravesando paredes) y llega exacto
+        step = step_units(self.eyes_speed, dt)
+        self.fx = approach(self.fx, sx, step)
+        self.fy = approach(self.fy, sy, step)
 
-        if abs(self.x - sx) < 2 and abs(self.y - sy) < 2:
-            self.x, self.y = sx, sy
+        if self.fx == sx and self.fy == sy:
             self.exit_eyes()
 
         # Animación
@@ -320,17 +383,26 @@ class Ghost(Entity):
     # DRAW
     # ----------------------------------------------------------
     def draw(self, renderer):
-        if self.state == "eyes":
+        if self.state == GhostState.EYES:
             frames = self.anim_eyes[self.direction]
-        elif self.state == "blink":
+        elif self.state == GhostState.BLINK:
             frames = self.anim_blink[self.direction]
-        elif self.state == "fright":
+        elif self.state == GhostState.FRIGHT:
             frames = self.anim_fright[self.direction]
         else:
             frames = self.anim_normal[self.direction]
 
-        frame = frames[self.anim_frame % len(frames)]
-        renderer.screen.blit(
-            frame,
-            (self.x - TILE_SIZE // 2, self.y - TILE_SIZE // 2)
-        )
+        # Calidad mínima: frame fijo, salvo el parpadeo (avisa que se acaba el susto)
+        if renderer.animate or self.state == GhostState.BLINK:
+            frame = frames[self.anim_frame % len(frames)]
+        else:
+            frame = frames[0]
+        renderer.draw_sprite(frame, self.x - TILE_SIZE // 2, self.y - TILE_SIZE // 2, self.glyph())
+
+    def glyph(self):
+        """Carácter para backends de texto: inicial del color; asustado/ojos aparte."""
+        if self.state == GhostState.EYES:
+            return '"'
+        if self.state in FRIGHTENED_STATES:
+            return "f"
+        return self.color[0].upper()
@@ -0,0 +1,208 @@
+# entities/ghost_ai.py
+# IA de fantasmas por búsqueda (modos difíciles). En cada cruce, Ghost le
+# pregunta a su controlador qué salida tomar; el controlador "bifurca" un estado
+# de movimiento mínimo (celda, dirección, tiempo) y simula unos tiles por delante
+# contra el camino probable de Pac-Man. Las evaluaciones se guardan en una tabla
+# de transposición acotada (LRU) compartida por los cuatro fantasmas.
+import time
+from collections import OrderedDict
+
+from core.renderer import TILE_SIZE
+from entities.store import FRIGHTENED_STATES
+from levels.maze_graph import MazeGraph
+
+# Cuántos tiles por delante del camino de Pac-Man apunta cada fantasma:
+# así no persiguen los cuatro el mismo punto (rojo persigue, rosa corta, ...)
+LEAD_BY_COLOR = {"red": 0, "pink": 4, "blue": 2, "orange": 6}
+
+# Distancia usada cuando la rama no llega a ninguna celda útil
+UNREACHABLE = 99
+
+
+# ----------------------------------------------------------
+# FUNCIONES PURAS sobre el grafo
+# ----------------------------------------------------------
+def walk_corridor(graph, cell, direction, limit):
+    """
+    Sigue el pasillo desde cell en `direction` hasta un cruce, callejón o
+    `limit` tiles. Devuelve (celdas recorridas, dirección de llegada).
+    """
+    dx, dy = direction
+    cells = []
+    cur = cell
+    while len(cells) < limit:
+        nxt = (cur[0] + dx, cur[1] + dy)
+        if not graph.walkable(nxt):
+            break
+        cells.append(nxt)
+        cur = nxt
+        exits = [(ex, ey) for ex, ey, _ in graph.exits(cur) if (ex, ey) != (-dx, -dy)]
+        if len(exits) != 1:
+            break
+        dx, dy = exits[0]
+    return tuple(cells), (dx, dy)
+
+
+def predict_path(graph, cell, direction, length):
+    """
+    Camino probable de Pac-Man: sigue recto mientras puede; en un cruce sin
+    salida recta toma la primera salida que no sea volver. Detenido = quieto.
+    """
+    path = [cell]
+    dx, dy = direction
+    cur = cell
+    while len(path) < length:
+        if (dx, dy) == (0, 0):
+            break
+        nxt = (cur[0] + dx, cur[1] + dy)
+        if not graph.walkable(nxt):
+            turns = [(ex, ey) for ex, ey, _ in graph.exits(cur) if (ex, ey) != (-dx, -dy)]
+            if not turns:
+                break
+            dx, dy = turns[0]
+            nxt = (cur[0] + dx, cur[1] + dy)
+        path.append(nxt)
+        cur = nxt
+    path.extend([cur] * (length - len(path)))
+    return tuple(path)
+
+
+class LookaheadGhostAI:
+    """
+    Búsqueda a `depth` cruces y `horizon` tiles. Puntaje de una rama: la menor
+    distancia (BFS) que logra el fantasma al punto donde estará Pac-Man en ese
+    mismo tiempo (negada al perseguir, tal cual al huir si está asustado).
+    """
+
+    TABLE_SIZE = 4096
+
+    def __init__(self, game, depth=3, horizon=14):
+        self.game = game
+        self.depth = depth
+        self.horizon = horizon
+        self.graph = None
+        self._graph_tiles = None
+        self._corridors = {}
+        self.table = OrderedDict()
+        # Métricas
+        self.decisions = 0
+        self.decision_time = 0.0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def mean_decision_ms(self):
+        return self.decision_time / self.decisions * 1000 if self.decisions else 0.0
+
+    # ----------------------------------------------------------
+    # API para Ghost.choose_new_direction
+    # ----------------------------------------------------------
+    def choose(self, ghost, options):
+        """Mejor (dx, dy) entre `options`, o None para caer en el movimiento aleatorio."""
+        start = time.perf_counter()
+        graph = self.graph_for(ghost.level.tiles)
+        cell = ghost.current_cell()
+        pacman = self.target_pacman(ghost)
+        if pacman is None or not graph.walkable(cell):
+            return None
+
+        pac_cell = (int(pacman.x // TILE_SIZE), int(pacman.y // TILE_SIZE))
+        pac_dir = (pacman.dir_x, pacman.dir_y)
+        lead = LEAD_BY_COLOR.get(ghost.color, 0)
+        flee = ghost.state in FRIGHTENED_STATES
+        path = predict_path(graph, pac_cell, pac_dir, self.horizon + lead + 1)
+        context = (pac_cell, pac_dir, lead, flee)
+
+        best, best_value = None, None
+        for option in options:
+            value = self.evaluate(graph, cell, option, 0, self.depth, path, context)
+            if best_value is None or value > best_value:
+                best, best_value = option, value
+
+        self.decisions += 1
+        self.decision_time += time.perf_counter() - start
+        return best
+
+    # ----------------------------------------------------------
+    # BÚSQUEDA
+    # ----------------------------------------------------------
+    def evaluate(self, graph, cell, direction, t, depth, path, context):
+        key = (context, cell, direction, t, depth)
+        cached = self.table.get(key)
+        if cached is not None:
+            self.hits += 1
+            self.table.move_to_end(key)
+            return cached
+        self.misses += 1
+
+        cells, arrive = self.corridor(graph, cell, direction)
+        lead, flee = context[2], context[3]
+
+        # Fork barato: el "estado" simulado es solo (celda, dirección, t)
+        closest = None
+        for i, c in enumerate(cells[:self.horizon - t]):
+            target = path[min(t + i + 1 + lead, len(path) - 1)]
+            d = graph.distance(c, target)
+            if d is not None and (closest is None or d < closest):
+                closest = d
+        if closest is None:
+            closest = UNREACHABLE
+
+        value = closest if flee else -closest
+        t_end = t + len(cells)
+        if cells and depth > 1 and t_end < self.horizon:
+            end = cells[-1]
+            back = (-arrive[0], -arrive[1])
+            branches = [
+                self.evaluate(graph, end, (ex, ey), t_end, depth - 1, path, context)
+                for ex, ey, _ in graph.exits(end) if (ex, ey) != back
+            ]
+            if branches:
+                # El fantasma elegirá la mejor rama en ese cruce
+                value = max(value, max(branches)) if not flee else min(value, max(branches))
+
+        self.table[key] = value
+        if len(self.table) > self.TABLE_SIZE:
+            self.table.popitem(last=False)
+        return value
+
+    def corridor(self, graph, cell, direction):
+        key = (cell, direction)
+        cached = self._corridors.get(key)
+        if cached is None:
+            cached = self._corridors[key] = walk_corridor(graph, cell, direction, self.horizon)
+        return cached
+
+    # ----------------------------------------------------------
+    # HELPERS
+    # ----------------------------------------------------------
+    def graph_for(self, tiles):
+        if self._graph_tiles is not tiles:
+            self.graph = MazeGraph.for_tiles(tiles)
+            self._graph_tiles = tiles
+            self._corridors = {}
+            self.table.clear()
+        return self.graph
+
+    def target_pacman(self, ghost):
+        """El Pac-Man más cercano (en multijugador hay varios)."""
+        best, best_d = None, None
+        for pacman in self.game.pacmans():
+            if pacman is None:
+                continue
+            d = abs(pacman.x - ghost.x) + abs(pacman.y - ghost.y)
+            if best_d is None or d < best_d:
+                best, best_d = pacman, d
+        return best
+
+
+GHOST_AIS = {
+    "lookahead": LookaheadGhostAI,
+}
+
+
+def make_ghost_ai(name, game):
+    try:
+        return GHOST_AIS[name](game)
+    except KeyError:
+        raise ValueError(f"IA de fantasma desconocida '{name}' (opciones: {', '.join(GHOST_AIS)})") from None
@@ -1,9 +1,24 @@
 # entities/pacman.py
-import pygame
 import math
+
+from config import YELLOW
 from entities.entity import Entity
+from entities.store import KIND_PACMAN, StoreField
+from core.input import InputLatency, now as input_clock
+from core.scheduler import Scheduler
 from core.renderer import TILE_SIZE
 from core.sprite_loader import load_folder
+from core.telemetry import TELEMETRY
+from core.functional_core import swept_min_distance
+from core.fixed_point import step_units
+
+
+PACMAN_SPRITES_DIR = "assets/sprites/pacman"
+DIRECTIONS = ("left", "right", "up", "down")
+# Ángulo (grados, y hacia abajo como en pantalla) hacia donde mira cada dirección
+FACING = {"left": 180, "right": 0, "up": 270, "down": 90}
+# Cómo se ve en los backends de texto (boca hacia donde va)
+GLYPHS = {"left": ">", "right": "<", "up": "v", "down": "^"}
 
 
 # ----------------------------------------------------------
@@ -19,13 +34,49 @@ def compute_distance_to_center(x, y, cx, cy):
     return abs(cx - x), abs(cy - y)
 
 
+def sprite_folders():
+    """Función pura: carpetas de sprites que usa Pac-Man (para precarga)."""
+    return [f"{PACMAN_SPRITES_DIR}/{d}" for d in DIRECTIONS]
+
+
+def death_wedge(cx, cy, radius, progress, facing, segments=24):
+    """
+    Función pura: polígono de Pac-Man muriendo. La boca se abre desde
+    `facing` hasta cerrar el círculo cuando progress llega a 1 ([] = ya no se ve).
+    """
+    mouth = min(max(progress, 0.0), 1.0) * 180.0
+    if mouth >= 180.0:
+        return []
+    start, end = facing + mouth, facing + 360.0 - mouth
+    points = [(cx, cy)]
+    for i in range(segments + 1):
+        a = math.radians(start + (end - start) * i / segments)
+        points.append((cx + radius * math.cos(a), cy + radius * math.sin(a)))
+    return points
+
+
 # ----------------------------------------------------------
 # CLASE PACMAN
 # ----------------------------------------------------------
 class Pacman(Entity):
-    def __init__(self, x, y, level=None):
-        super().__init__(x, y, speed=140)
+    __slots__ = (
+        "level", "direction", "turn_stamp", "input_latency",
+        "score_multiplier", "anim", "anim_speed", "scheduler",
+    )
+
+    KIND = KIND_PACMAN
+
+    next_dir_x = StoreField("next_dir_x")
+    next_dir_y = StoreField("next_dir_y")
+    anim_timer = StoreField("anim_timer")
+    anim_frame = StoreField("anim_frame")
+
+    def __init__(self, x, y, level=None, store=None, scheduler=None):
+        super().__init__(x, y, speed=140, store=store)
         self.level = level
+        # Reloj de simulación donde se registran las expiraciones de power-ups
+        # (sin Game, Pac-Man usa uno propio que avanza quien lo controle)
+        self.scheduler = scheduler if scheduler is not None else Scheduler()
 
         # Direcciones
         self.dir_x = 0
@@ -33,6 +84,9 @@ class Pacman(Entity):
         self.next_dir_x = 0
         self.next_dir_y = 0
         self.direction = "left"
+        # Marca de tiempo del giro pendiente + métricas de latencia
+        self.turn_stamp = None
+        self.input_latency = InputLatency()
 
         # Power-ups
         self.invincible = False
@@ -42,10 +96,7 @@ class Pacman(Entity):
 
         # Sprites
         self.anim = {
-            "left": load_folder("assets/sprites/pacman/left", TILE_SIZE),
-            "right": load_folder("assets/sprites/pacman/right", TILE_SIZE),
-            "up": load_folder("assets/sprites/pacman/up", TILE_SIZE),
-            "down": load_folder("assets/sprites/pacman/down", TILE_SIZE),
+            d: load_folder(f"{PACMAN_SPRITES_DIR}/{d}", TILE_SIZE) for d in DIRECTIONS
         }
 
         self.anim_frame = 0
@@ -53,43 +104,24 @@ class Pacman(Entity):
         self.anim_speed = 0.10
 
     # ----------------------------------------------------------
-    # HELPERS DE GRID (puras excepto por acceso a estado)
+    # INPUT (buffer de giro edge-triggered)
     # ----------------------------------------------------------
-    def current_cell(self):
-        return int(self.x // TILE_SIZE), int(self.y // TILE_SIZE)
+    def request_turn(self, dx, dy, name, stamp=None):
+        """
+        Guarda la última dirección pedida; se aplica en update() en cuanto
+        Pac-Man esté centrado y el giro sea legal. stamp (input_clock) permite
+        medir la latencia entrada -> movimiento.
+        """
+        self.next_dir_x, self.next_dir_y = dx, dy
+        self.direction = name
+        self.turn_stamp = stamp
 
-    def tile_center(self, col, row):
-        return (
-            col * TILE_SIZE + TILE_SIZE / 2,
-            row * TILE_SIZE + TILE_SIZE / 2,
-        )
-
-    def is_centered(self, tolerance=1.0):
-        col, row = self.current_cell()
-        cx, cy = self.tile_center(col, row)
-        return abs(self.x - cx) <= tolerance and abs(self.y - cy) <= tolerance
-
-    def snap_center_soft(self):
-        col, row = self.current_cell()
-        cx, cy = self.tile_center(col, row)
-        self.x += (cx - self.x) * 0.35
-        self.y += (cy - self.y) * 0.35
-
-    # ----------------------------------------------------------
-    # INPUT (lambdas)
-    # ----------------------------------------------------------
-    def handle_input(self, keys):
-        direction_map = {
-            pygame.K_LEFT:  (-1, 0, "left"),
-            pygame.K_RIGHT: (1, 0, "right"),
-            pygame.K_UP:    (0, -1, "up"),
-            pygame.K_DOWN:  (0, 1, "down"),
-        }
-
-        for key, (dx, dy, name) in direction_map.items():
-            if keys[key]:
-                self.next_dir_x, self.next_dir_y = dx, dy
-                self.direction = name
+    def apply_buffered_turn(self):
+        self.dir_x = self.next_dir_x
+        self.dir_y = self.next_dir_y
+        if self.turn_stamp is not None:
+            self.input_latency.record(input_clock() - self.turn_stamp)
+            self.turn_stamp = None
 
     # ----------------------------------------------------------
     # COLISIONES FUNCIONALES
@@ -113,56 +145,18 @@ class Pacman(Entity):
         return not self.level.is_wall(tcol, trow)
 
     # ----------------------------------------------------------
-    # UPDATE PRINCIPAL (sin cambios de lógica)
+    # UPDATE PRINCIPAL
     # ----------------------------------------------------------
     def update(self, dt):
-
-        # Intentar girar si está centrado
-        if self.is_centered():
-            self.snap_center_soft()
-
-            if self.can_move(self.next_dir_x, self.next_dir_y):
-                self.dir_x = self.next_dir_x
-                self.dir_y = self.next_dir_y
-
-            if not self.can_move(self.dir_x, self.dir_y):
-                self.finish_update(dt)
-                return
-
-        move_step = self.speed * self.speed_multiplier * dt
-
-        col, row = self.current_cell()
-        cx, cy = self.tile_center(col, row)
-
-        dist_x = cx - self.x
-        dist_y = cy - self.y
-
-        limit = abs(dist_x) if self.dir_x != 0 else abs(dist_y)
-
-        if move_step > limit and limit > 0.1:
-            # No pasar centro
-            self.x += self.dir_x * limit
-            self.y += self.dir_y * limit
-
-            self.snap_center_soft()
-
-            if self.can_move(self.dir_x, self.dir_y):
-                leftover = move_step - limit
-                self.x += self.dir_x * leftover
-                self.y += self.dir_y * leftover
-
-            self.finish_update(dt)
-            return
-
-        # Movimiento normal
-        self.x += self.dir_x * move_step
-        self.y += self.dir_y * move_step
-
-        if self.is_centered():
-            self.snap_center_soft()
-
+        # Punto fijo: avance entero por paso; los giros se deciden solo al
+        # llegar exacto al centro de un tile
+        self.move_fixed(step_units(self.speed * self.speed_multiplier, dt), self.on_center)
         self.finish_update(dt)
 
+    def on_center(self):
+        if self.can_move(self.next_dir_x, self.next_dir_y):
+            self.apply_buffered_turn()
+
     # ----------------------------------------------------------
     # FINAL UPDATE
     # ----------------------------------------------------------
@@ -178,48 +172,55 @@ class Pacman(Entity):
         # Items
         self.eat_items()
 
-        # Power-ups
-        self.update_effects(dt)
-
     # ----------------------------------------------------------
     # ITEMS / POWERUPS
     # ----------------------------------------------------------
     def eat_items(self):
         col, row = self.current_cell()
 
-        if (col, row) in self.level.pellets:
-            self.level.pellets.remove((col, row))
-            self.level.game.hud.add_score(10 * self.score_multiplier)
+        if self.level.eat_pellet(col, row):
+            self.level.game.award_points(self, 10 * self.score_multiplier)
+            TELEMETRY.emit("pellet", col, row)
 
-        if (col, row) in self.level.powerups:
-            self.level.powerups.remove((col, row))
+        if self.level.eat_powerup(col, row):
             self.level.game.activate_powerup(self, col, row)
 
     # ----------------------------------------------------------
-    # EFECTOS (PATRÓN DE CLOSURES)
+    # EFECTOS (expiración registrada en el Scheduler)
     # ----------------------------------------------------------
     def add_effect(self, effect):
-        effect.remaining_time = getattr(effect, "duration", 0)
         effect.apply(self)
         self.effects.append(effect)
+        effect.timer = self.scheduler.schedule(
+            getattr(effect, "duration", 0), self.expire_effect, effect
+        )
 
-    def update_effects(self, dt):
-        expired = []
-
-        for e in self.effects:
-            e.remaining_time -= dt
-            if e.remaining_time <= 0:
-                expired.append(e)
+    def expire_effect(self, effect):
+        self.effects.remove(effect)
+        # Efectos apilados del mismo tipo: solo el último en vencer revierte
+        # (un SpeedBoost viejo no debe cortar uno más nuevo aún activo)
+        if not any(type(e) is type(effect) for e in self.effects):
+            effect.remove(self)
 
-        for e in expired:
-            e.remove(self)
-            self.effects.remove(e)
+    def clear_effects(self):
+        """Vence ya todos los efectos activos (partida nueva)."""
+        while self.effects:
+            effect = self.effects[-1]
+            self.scheduler.cancel(effect.timer)
+            self.expire_effect(effect)
 
     # ----------------------------------------------------------
     # COLISIONES PACMAN/GHOST
     # ----------------------------------------------------------
     def collides_with(self, ghost):
-        return math.dist((self.x, self.y), (ghost.x, ghost.y)) < (TILE_SIZE * 0.6)
+        # Barrido: ambos se movieron en el mismo sub-paso; se mide la distancia
+        # mínima durante el movimiento y no solo en los extremos (a velocidad
+        # alta podían cruzarse sin tocarse en ningún extremo)
+        distance = swept_min_distance(
+            (self.prev_x, self.prev_y), (self.x, self.y),
+            (ghost.prev_x, ghost.prev_y), (ghost.x, ghost.y),
+        )
+        return distance < (TILE_SIZE * 0.6)
 
     # ----------------------------------------------------------
     # DRAW
@@ -227,8 +228,12 @@ class Pacman(Entity):
     def draw(self, renderer):
         frames = self.anim.get(self.direction, [])
         if frames:
-            frame = frames[self.anim_frame % len(frames)]
-            renderer.screen.blit(
-                frame,
-                (self.x - TILE_SIZE // 2, self.y - TILE_SIZE // 2)
-            )
+            # Calidad mínima: primer frame fijo (boca abierta)
+            frame = frames[self.anim_frame % len(frames)] if renderer.animate else frames[0]
+            renderer.draw_sprite(frame, self.x - TILE_SIZE // 2, self.y - TILE_SIZE // 2, GLYPHS[self.direction])
+
+    def draw_dying(self, renderer, progress):
+        """Animación de muerte (progress 0..1), dibujada sin sprites."""
+        points = death_wedge(self.x, self.y, TILE_SIZE // 2 - 2, progress, FACING[self.direction])
+        if points:
+            renderer.draw_polygon(points, YELLOW)
@@ -0,0 +1,164 @@
+# entities/store.py
+# Almacén struct-of-arrays de entidades: posiciones, direcciones, velocidades,
+# timers de animación y estados viven en arrays tipados contiguos (array.array). Pacman y
+# Ghost son vistas finas (__slots__) que solo guardan su índice en el store.
+# Las posiciones son enteros en sub-píxeles (core.fixed_point).
+from array import array
+from enum import IntEnum
+
+from core.fixed_point import SUBPIXEL
+
+
+class GhostState(IntEnum):
+    NORMAL = 0
+    FRIGHT = 1
+    BLINK = 2
+    EYES = 3
+    HOUSE = 4
+
+
+# Conjuntos inmutables para comparaciones sin asignar listas en el hot path
+FRIGHTENED_STATES = frozenset((GhostState.FRIGHT, GhostState.BLINK))
+
+# Índice -> miembro del enum (más barato que GhostState(valor))
+_STATES = tuple(GhostState)
+
+# Tipo de entidad por slot
+KIND_FREE = 0
+KIND_PACMAN = 1
+KIND_GHOST = 2
+
+
+class EntityStore:
+    """
+    Cada campo es un array tipado; una entidad es un índice (slot).
+    Los slots liberados se reutilizan, así respawnear no hace crecer los arrays.
+    """
+
+    # campo -> (typecode, valor inicial)
+    FIELDS = {
+        "kind": ("B", KIND_FREE),
+        "x": ("q", 0),
+        "y": ("q", 0),
+        # Posición al inicio del sub-paso (colisión por barrido)
+        "prev_x": ("q", 0),
+        "prev_y": ("q", 0),
+        "speed": ("d", 0.0),
+        "speed_multiplier": ("d", 1.0),
+        "dir_x": ("b", 0),
+        "dir_y": ("b", 0),
+        "next_dir_x": ("b", 0),
+        "next_dir_y": ("b", 0),
+        "state": ("B", GhostState.NORMAL),
+        "anim_timer": ("d", 0.0),
+        "anim_frame": ("q", 0),
+    }
+
+    def __init__(self, capacity=8):
+        for name, (code, initial) in self.FIELDS.items():
+            setattr(self, name, array(code, [initial]) * capacity)
+        self._free = list(range(capacity - 1, -1, -1))
+
+    def __len__(self):
+        return len(self.kind)
+
+    # ----------------------------------------------------------
+    # SLOTS
+    # ----------------------------------------------------------
+    def allocate(self, kind):
+        if not self._free:
+            self._grow(max(8, len(self)))
+        slot = self._free.pop()
+        for name, (_, initial) in self.FIELDS.items():
+            getattr(self, name)[slot] = initial
+        self.kind[slot] = kind
+        return slot
+
+    def release(self, slot):
+        if self.kind[slot] != KIND_FREE:
+            self.kind[slot] = KIND_FREE
+            self._free.append(slot)
+
+    def live_count(self, kind=None):
+        if kind is None:
+            return len(self) - len(self._free)
+        return self.kind.count(kind)
+
+    def _grow(self, extra):
+        start = len(self)
+        for name, (code, initial) in self.FIELDS.items():
+            getattr(self, name).extend(array(code, [initial]) * extra)
+        # Orden inverso para que pop() entregue los índices bajos primero
+        self._free.extend(range(start + extra - 1, start - 1, -1))
+
+    # ----------------------------------------------------------
+    # OPERACIONES EN BLOQUE
+    # ----------------------------------------------------------
+    def slots(self, kind):
+        return [i for i, k in enumerate(self.kind) if k == kind]
+
+    def any_state(self, kind, states):
+        """¿Alguna entidad viva de ese tipo está en alguno de los estados?"""
+        kinds, values = self.kind, self.state
+        return any(kinds[i] == kind and values[i] in states for i in range(len(kinds)))
+
+    def count_state(self, kind, states):
+        kinds, values = self.kind, self.state
+        return sum(1 for i in range(len(kinds)) if kinds[i] == kind and values[i] in states)
+
+    def add_to(self, field, delta, kind):
+        """Suma delta a un campo de todas las entidades vivas de un tipo."""
+        values, kinds = getattr(self, field), self.kind
+        for i in range(len(kinds)):
+            if kinds[i] == kind:
+                values[i] += delta
+
+
+# ==========================================================
+# VISTAS: descriptores que leen/escriben el array del store
+# ==========================================================
+
+class StoreField:
+    """Atributo de una vista __slots__ respaldado por EntityStore.<name>[slot]."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        return getattr(obj._store, self.name)[obj._slot]
+
+    def __set__(self, obj, value):
+        getattr(obj._store, self.name)[obj._slot] = value
+
+
+class FixedField(StoreField):
+    """Coordenada en píxeles (float) sobre un array entero de sub-píxeles."""
+
+    __slots__ = ()
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        return getattr(obj._store, self.name)[obj._slot] / SUBPIXEL
+
+    def __set__(self, obj, value):
+        getattr(obj._store, self.name)[obj._slot] = int(round(value * SUBPIXEL))
+
+
+class StateField(StoreField):
+    """Como StoreField pero devuelve el miembro de GhostState."""
+
+    __slots__ = ()
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        return _STATES[obj._store.state[obj._slot]]
+
+
+# Store por defecto para entidades creadas sin Game (herramientas / tests)
+DEFAULT_STORE = EntityStore()
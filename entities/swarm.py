@@ -0,0 +1,401 @@
+# entities/swarm.py
+# Modo enjambre (--swarm N): cientos de fantasmas sin objetos Ghost. Cada
+# fantasma es un índice en arrays (celda, dirección, avance dentro del tile,
+# estado, timer) y un kernel los mueve a todos juntos en cada tick. Se guían
+# por un flow field compartido (dirección hacia Pac-Man por celda, BFS del
+# MazeGraph) que solo se recalcula cuando Pac-Man cambia de tile.
+#
+# El kernel usa NumPy si está instalado; si no, la misma lógica corre en
+# Python puro. Las decisiones "al azar" salen de un hash entero (mix32) del
+# índice y el tick, no de un RNG: los dos kernels dan exactamente el mismo
+# resultado y un replay no depende de tener NumPy.
+from core.fixed_point import SUBPIXEL, TILE, step_units
+from core.renderer import TILE_SIZE
+from entities.store import GhostState
+from levels.maze_graph import DIRS, MazeGraph
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él el kernel corre en Python puro
+    np = None
+
+FRIGHT_DURATION = 6.0
+BLINK_THRESHOLD = 2.0
+# Un fantasma comido reaparece lejos de Pac-Man después de esta espera
+RESPAWN_DELAY = 3.0
+# Al empezar el nivel los fantasmas entran de a uno cada RELEASE_INTERVAL s
+RELEASE_INTERVAL = 0.02
+# Distancia mínima (en tiles, por el laberinto) a Pac-Man al aparecer
+SAFE_DISTANCE = 8
+# 1/8 de las decisiones en un cruce son al azar: el enjambre se reparte
+WANDER_THRESHOLD = 0x2000
+FRIGHT_SPEED_FACTOR = 0.7
+HIT_RADIUS = TILE * 0.6
+
+MASK32 = 0xFFFFFFFF
+UNREACHABLE = 1 << 20
+OPPOSITE = (1, 0, 3, 2)                    # índice de DIRS -> el contrario
+DIR_NAMES = ("right", "left", "down", "up")  # mismo orden que DIRS
+COLORS = ("red", "pink", "blue", "orange")
+
+NORMAL, FRIGHT, BLINK, HOUSE = GhostState.NORMAL, GhostState.FRIGHT, GhostState.BLINK, GhostState.HOUSE
+
+
+# ----------------------------------------------------------
+# FUNCIONES PURAS
+# ----------------------------------------------------------
+def mix32(value):
+    """Hash entero de 32 bits (mismo resultado que la versión NumPy del kernel)."""
+    value &= MASK32
+    value ^= value >> 16
+    value = (value * 0x7FEB352D) & MASK32
+    value ^= value >> 15
+    value = (value * 0x846CA68B) & MASK32
+    value ^= value >> 16
+    return value
+
+
+def decision_hash(index, tick):
+    return mix32(index * 0x9E3779B1 + tick * 0x85EBCA77)
+
+
+def cell_tables(tiles):
+    """
+    Tablas planas por celda (índice = fila * ancho + columna): vecino por
+    dirección de DIRS (-1 = bloqueado) y primera salida (-1 = celda cerrada).
+    """
+    graph = MazeGraph.for_tiles(tiles)
+    width = max(len(row) for row in tiles)
+    count = width * len(tiles)
+    neighbors = [-1] * (count * 4)
+    first_exit = [-1] * count
+    for (c, r), exits in graph.neighbors.items():
+        cell = r * width + c
+        for dx, dy, (nc, nr) in exits:
+            d = DIRS.index((dx, dy))
+            neighbors[cell * 4 + d] = nr * width + nc
+        if exits:
+            first_exit[cell] = DIRS.index(exits[0][:2])
+    return graph, width, neighbors, first_exit
+
+
+def flow_directions(neighbors, distance):
+    """
+    Por celda: dirección que más acerca (flow) y la que más aleja (flee) según
+    `distance` (lista por celda; UNREACHABLE = fuera del BFS). -1 = ninguna.
+    """
+    count = len(distance)
+    flow, flee = [-1] * count, [-1] * count
+    for cell in range(count):
+        here = distance[cell]
+        if here >= UNREACHABLE:
+            continue
+        best, worst = here, -1
+        for d in range(4):
+            n = neighbors[cell * 4 + d]
+            if n < 0 or distance[n] >= UNREACHABLE:
+                continue
+            if distance[n] < best:
+                best, flow[cell] = distance[n], d
+            if distance[n] > worst:
+                worst, flee[cell] = distance[n], d
+    return flow, flee
+
+
+# ----------------------------------------------------------
+# ENJAMBRE
+# ----------------------------------------------------------
+class Swarm:
+    def __init__(self, level, count, speed, use_numpy=True):
+        self.count = count
+        self.use_numpy = use_numpy and np is not None
+        self.kernel = "numpy" if self.use_numpy else "python"
+        self.frozen = False
+        self.tick = 0
+        self.flow_updates = 0
+        self._tiles = None
+        self._anims = None
+        self.reset(level, speed)
+
+    # ----------------------------------------------------------
+    # NIVEL / RESPAWN (en el lugar: mismos arrays)
+    # ----------------------------------------------------------
+    def reset(self, level, speed):
+        """Todos a la casita, saliendo de a uno; los arrays se reutilizan."""
+        if level.tiles != self._tiles:
+            self._tiles = level.tiles
+            self.graph, self.width, neighbors, first_exit = cell_tables(level.tiles)
+            self.cells = len(first_exit)
+            if self.use_numpy:
+                self.neighbors = np.array(neighbors, dtype=np.int32).reshape(-1, 4)
+                # -1 -> celda centinela (distancia UNREACHABLE) para indexar sin máscaras
+                self.neighbors_safe = np.where(self.neighbors < 0, self.cells, self.neighbors)
+                self.first_exit = np.array(first_exit, dtype=np.int8)
+            else:
+                self.neighbors, self.first_exit = neighbors, first_exit
+
+        self.speed = speed
+        self.frozen = False
+        self.target = None
+        self.update_flow(level.pacman_spawn)
+
+        n = self.count
+        if self.use_numpy:
+            self.cell = np.zeros(n, dtype=np.int32)
+            self.dir = np.zeros(n, dtype=np.int8)
+            self.prog = np.zeros(n, dtype=np.int32)
+            self.state = np.full(n, HOUSE, dtype=np.uint8)
+            self.timer = np.arange(1, n + 1, dtype=np.float64) * RELEASE_INTERVAL
+        else:
+            self.cell, self.dir, self.prog = [0] * n, [0] * n, [0] * n
+            self.state = [HOUSE] * n
+            self.timer = [(i + 1) * RELEASE_INTERVAL for i in range(n)]
+
+    def update_flow(self, pacman_cell):
+        """Flow field hacia `pacman_cell`; solo se recalcula si cambió de tile."""
+        if pacman_cell == self.target or not self.graph.walkable(pacman_cell):
+            return
+        self.target = pacman_cell
+        self.flow_updates += 1
+        width = self.width
+        bfs = self.graph.distances_from(pacman_cell)
+
+        if self.use_numpy:
+            distance = np.full(self.cells + 1, UNREACHABLE, dtype=np.int32)
+            distance[[r * width + c for c, r in bfs]] = list(bfs.values())
+            around = distance[self.neighbors_safe]
+            here = distance[:-1]
+            flow = np.argmin(around, axis=1).astype(np.int8)
+            flow[(around.min(axis=1) >= here) | (here >= UNREACHABLE)] = -1
+            away = np.where(around < UNREACHABLE, around, -1)
+            flee = np.argmax(away, axis=1).astype(np.int8)
+            flee[(away.max(axis=1) < 0) | (here >= UNREACHABLE)] = -1
+            self.flow, self.flee = flow, flee
+            self.far_cells = np.flatnonzero((here >= SAFE_DISTANCE) & (here < UNREACHABLE)).astype(np.int32)
+        else:
+            distance = [UNREACHABLE] * self.cells
+            for (c, r), d in bfs.items():
+                distance[r * width + c] = d
+            self.flow, self.flee = flow_directions(self.neighbors, distance)
+            self.far_cells = [i for i, d in enumerate(distance) if SAFE_DISTANCE <= d < UNREACHABLE]
+
+        if len(self.far_cells) == 0:
+            # Mapa chico: cualquier celda alcanzable sirve
+            reachable = [r * width + c for c, r in bfs]
+            self.far_cells = np.array(reachable, dtype=np.int32) if self.use_numpy else reachable
+
+    # ----------------------------------------------------------
+    # TICK
+    # ----------------------------------------------------------
+    def step(self, dt, pacman_cell):
+        self.tick += 1
+        if self.frozen:
+            return
+        self.update_flow(pacman_cell)
+        step = min(step_units(self.speed, dt), TILE - 1)
+        fright_step = min(step_units(self.speed * FRIGHT_SPEED_FACTOR, dt), TILE - 1)
+        if self.use_numpy:
+            self._step_numpy(dt, step, fright_step)
+        else:
+            self._step_python(dt, step, fright_step)
+
+    def _step_numpy(self, dt, step, fright_step):
+        state, timer = self.state, self.timer
+
+        # Timers de estado
+        timed = state != NORMAL
+        timer[timed] -= dt
+        state[(state == FRIGHT) & (timer <= BLINK_THRESHOLD)] = BLINK
+        state[(state == BLINK) & (timer <= 0)] = NORMAL
+        released = np.flatnonzero((state == HOUSE) & (timer <= 0))
+        if released.size:
+            self._appear_numpy(released)
+
+        # Avance: como el paso es menor a un tile, cada uno cruza a lo sumo un centro
+        frightened = (state == FRIGHT) | (state == BLINK)
+        self.prog += np.where(state == HOUSE, 0, np.where(frightened, fright_step, step)).astype(np.int32)
+        arrived = np.flatnonzero(self.prog >= TILE)
+        if arrived.size:
+            cells = self.neighbors[self.cell[arrived], self.dir[arrived]]
+            self.cell[arrived] = cells
+            self.prog[arrived] -= TILE
+            self.dir[arrived] = self._choose_numpy(arrived, cells, frightened[arrived])
+
+    def _choose_numpy(self, ids, cells, frightened):
+        choice = np.where(frightened, self.flee[cells], self.flow[cells])
+        h = ids.astype(np.uint32) * np.uint32(0x9E3779B1) + np.uint32((self.tick * 0x85EBCA77) & MASK32)
+        h ^= h >> np.uint32(16)
+        h *= np.uint32(0x7FEB352D)
+        h ^= h >> np.uint32(15)
+        h *= np.uint32(0x846CA68B)
+        h ^= h >> np.uint32(16)
+        wander = (h & np.uint32(0xFFFF)) < WANDER_THRESHOLD
+        random_dir = ((h >> np.uint32(16)) & np.uint32(3)).astype(np.int8)
+        legal = self.neighbors[cells, random_dir] >= 0
+        choice = np.where(wander & legal, random_dir, choice)
+        blocked = choice < 0
+        choice[blocked] = self.first_exit[cells[blocked]]
+        return choice
+
+    def _appear_numpy(self, ids):
+        far = self.far_cells
+        picks = np.array([decision_hash(int(i), self.tick) % len(far) for i in ids], dtype=np.int64)
+        cells = far[picks]
+        self.cell[ids] = cells
+        self.prog[ids] = 0
+        self.state[ids] = NORMAL
+        self.timer[ids] = 0.0
+        self.dir[ids] = self._choose_numpy(ids, cells, np.zeros(len(ids), dtype=bool))
+
+    def _step_python(self, dt, step, fright_step):
+        state, timer, prog = self.state, self.timer, self.prog
+        cell, direction, neighbors = self.cell, self.dir, self.neighbors
+        for i in range(self.count):
+            s = state[i]
+            if s != NORMAL:
+                timer[i] -= dt
+                if s == HOUSE:
+                    if timer[i] > 0:
+                        continue
+                    self._appear_python(i)
+                    s = NORMAL
+                elif s == FRIGHT and timer[i] <= BLINK_THRESHOLD:
+                    state[i] = s = BLINK
+                if s == BLINK and timer[i] <= 0:
+                    state[i] = s = NORMAL
+
+            frightened = s == FRIGHT or s == BLINK
+            prog[i] += fright_step if frightened else step
+            if prog[i] >= TILE:
+                prog[i] -= TILE
+                cell[i] = c = neighbors[cell[i] * 4 + direction[i]]
+                direction[i] = self._choose_python(i, c, frightened)
+
+    def _choose_python(self, index, cell, frightened):
+        choice = (self.flee if frightened else self.flow)[cell]
+        h = decision_hash(index, self.tick)
+        random_dir = (h >> 16) & 3
+        if (h & 0xFFFF) < WANDER_THRESHOLD and self.neighbors[cell * 4 + random_dir] >= 0:
+            choice = random_dir
+        return choice if choice >= 0 else self.first_exit[cell]
+
+    def _appear_python(self, index):
+        far = self.far_cells
+        self.cell[index] = c = far[decision_hash(index, self.tick) % len(far)]
+        self.prog[index] = 0
+        self.state[index] = NORMAL
+        self.timer[index] = 0.0
+        self.dir[index] = self._choose_python(index, c, False)
+
+    # ----------------------------------------------------------
+    # EVENTOS
+    # ----------------------------------------------------------
+    def frighten(self):
+        """Todos los visibles se asustan y se dan vuelta (a mitad de tile, hacia atrás)."""
+        if self.use_numpy:
+            ids = np.flatnonzero(self.state != HOUSE)
+            moving = ids[self.prog[ids] > 0]
+            self.cell[moving] = self.neighbors[self.cell[moving], self.dir[moving]]
+            self.prog[moving] = TILE - self.prog[moving]
+            self.dir[moving] = np.array(OPPOSITE, dtype=np.int8)[self.dir[moving]]
+            self.state[ids] = FRIGHT
+            self.timer[ids] = FRIGHT_DURATION
+            return
+        for i in range(self.count):
+            if self.state[i] == HOUSE:
+                continue
+            if self.prog[i] > 0:
+                self.cell[i] = self.neighbors[self.cell[i] * 4 + self.dir[i]]
+                self.prog[i] = TILE - self.prog[i]
+                self.dir[i] = OPPOSITE[self.dir[i]]
+            self.state[i] = FRIGHT
+            self.timer[i] = FRIGHT_DURATION
+
+    def eat(self, index):
+        """Fantasma comido: desaparece y vuelve a entrar después de RESPAWN_DELAY."""
+        self.state[index] = HOUSE
+        self.timer[index] = RESPAWN_DELAY
+
+    def any_frightened(self):
+        if self.use_numpy:
+            return bool(((self.state == FRIGHT) | (self.state == BLINK)).any())
+        return any(s == FRIGHT or s == BLINK for s in self.state)
+
+    def collide(self, x, y):
+        """
+        Choques con Pac-Man en (x, y) sub-píxeles: (True si lo toca alguno
+        normal, índices de los asustados que toca).
+        """
+        xs, ys = self.positions()
+        limit = HIT_RADIUS * HIT_RADIUS
+        if self.use_numpy:
+            near = (xs - x) ** 2 + (ys - y) ** 2 < limit
+            near &= self.state != HOUSE
+            hit = bool((near & (self.state == NORMAL)).any())
+            eaten = np.flatnonzero(near & ((self.state == FRIGHT) | (self.state == BLINK))).tolist()
+            return hit, eaten
+        hit, eaten = False, []
+        for i, s in enumerate(self.state):
+            if s == HOUSE or (xs[i] - x) ** 2 + (ys[i] - y) ** 2 >= limit:
+                continue
+            if s == NORMAL:
+                hit = True
+            else:
+                eaten.append(i)
+        return hit, eaten
+
+    # ----------------------------------------------------------
+    # POSICIONES / DIBUJO
+    # ----------------------------------------------------------
+    def positions(self):
+        """Centros en sub-píxeles (arrays o listas según el kernel)."""
+        width, half = self.width, TILE // 2
+        if self.use_numpy:
+            dx = np.array([d[0] for d in DIRS], dtype=np.int32)[self.dir]
+            dy = np.array([d[1] for d in DIRS], dtype=np.int32)[self.dir]
+            xs = (self.cell % width) * TILE + half + dx * self.prog
+            ys = (self.cell // width) * TILE + half + dy * self.prog
+            return xs, ys
+        xs, ys = [], []
+        for c, d, p in zip(self.cell, self.dir, self.prog):
+            xs.append((c % width) * TILE + half + DIRS[d][0] * p)
+            ys.append((c // width) * TILE + half + DIRS[d][1] * p)
+        return xs, ys
+
+    def visible_count(self):
+        if self.use_numpy:
+            return int((self.state != HOUSE).sum())
+        return sum(1 for s in self.state if s != HOUSE)
+
+    def groups(self):
+        """{(color, estado, dirección): [(x, y) esquina en píxeles]} de los visibles."""
+        xs, ys = self.positions()
+        if self.use_numpy:
+            xs, ys = xs.tolist(), ys.tolist()
+            states, dirs = self.state.tolist(), self.dir.tolist()
+        else:
+            states, dirs = self.state, self.dir
+        half = TILE_SIZE // 2
+        groups = {}
+        for i, s in enumerate(states):
+            if s == HOUSE:
+                continue
+            key = (i % len(COLORS), s, dirs[i])
+            groups.setdefault(key, []).append((xs[i] // SUBPIXEL - half, ys[i] // SUBPIXEL - half))
+        return groups
+
+    def draw(self, renderer, frame_index=0):
+        if self._anims is None:
+            from entities.ghost import load_anims
+
+            # Sprites compartidos con los Ghost normales (cache por color)
+            self._anims = [load_anims(color) for color in COLORS]
+        for (color, state, d), points in self.groups().items():
+            normal, fright, blink, _ = self._anims[color]
+            anim = blink if state == BLINK else fright if state == FRIGHT else normal
+            frames = anim[DIR_NAMES[d]]
+            if not frames:
+                continue
+            frame = frames[frame_index % len(frames)] if renderer.animate else frames[0]
+            glyph = "f" if state in (FRIGHT, BLINK) else COLORS[color][0].upper()
+            renderer.draw_sprites(frame, points, glyph)
@@ -0,0 +1,93 @@
+# levels/hot_reload.py
+# Recarga en vivo de mapas (modo --dev). Un hilo vigila levels/maps por mtime y
+# avisa qué archivos cambiaron; el hilo principal re-parsea el archivo y el
+# nivel aplica solo las filas que difieren (ver Level.reload).
+import os
+import queue
+import threading
+
+LEVEL_EXTENSIONS = (".json", ".txt")
+
+
+# ----------------------------------------------------------
+# FUNCIONES PURAS
+# ----------------------------------------------------------
+def changed_rows(old_tiles, new_tiles):
+    """Índices de filas distintas, o None si cambió el tamaño del mapa."""
+    if len(old_tiles) != len(new_tiles):
+        return None
+    if any(len(a) != len(b) for a, b in zip(old_tiles, new_tiles)):
+        return None
+    return [r for r, (a, b) in enumerate(zip(old_tiles, new_tiles)) if a != b]
+
+
+def row_spans(rows, height):
+    """
+    Franjas contiguas (primera, última) a redibujar: cada fila cambiada más sus
+    vecinas (las líneas de neón de un tile dependen de los tiles de arriba/abajo).
+    """
+    spans = []
+    for r in sorted(rows):
+        first, last = max(r - 1, 0), min(r + 1, height - 1)
+        if spans and first <= spans[-1][1] + 1:
+            spans[-1] = (spans[-1][0], max(spans[-1][1], last))
+        else:
+            spans.append((first, last))
+    return spans
+
+
+def scan(directory):
+    """{ruta: (mtime_ns, tamaño)} de los mapas del directorio."""
+    found = {}
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.name.endswith(LEVEL_EXTENSIONS):
+                st = entry.stat()
+                found[entry.path] = (st.st_mtime_ns, st.st_size)
+    return found
+
+
+# ----------------------------------------------------------
+# WATCHER (hilo de fondo, solo stat: nunca toca pygame ni el nivel)
+# ----------------------------------------------------------
+class LevelWatcher:
+    def __init__(self, directory, interval=0.25):
+        self.directory = directory
+        self.interval = interval
+        self._changes = queue.Queue()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="level-watcher", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def poll(self):
+        """Rutas cambiadas desde el último poll (sin repetir)."""
+        changed = []
+        while True:
+            try:
+                path = self._changes.get_nowait()
+            except queue.Empty:
+                return changed
+            if path not in changed:
+                changed.append(path)
+
+    def _run(self):
+        known = scan(self.directory)
+        while not self._stop.wait(self.interval):
+            try:
+                current = scan(self.directory)
+            except OSError:
+                continue
+            for path, stamp in current.items():
+                if known.get(path) != stamp:
+                    self._changes.put(path)
+            known = current
@@ -1,35 +1,140 @@
 # levels/level.py
+from itertools import count
+
 import pygame
 from core.renderer import TILE_SIZE
 from config import BLUE, WHITE, YELLOW, DARK_BLUE
 from levels.level_loader import load_level_file
+from levels.hot_reload import changed_rows, row_spans
+from levels.maze_graph import MazeGraph
 
 
 INNER_BLUE = (80, 80, 255)  # línea interna de neón
 
+# Revisiones de items únicas entre TODOS los niveles: un número nunca se repite,
+# aunque un Level nuevo reciba el id() de uno ya liberado
+_ITEM_REVISIONS = count(1)
+
+
+def draw_item_on(layer, tile_size, col, row, radius, color):
+    """Pellet/power-up en una capa de tiles de `tile_size` px (radio pensado para TILE_SIZE)."""
+    t = tile_size
+    pygame.draw.circle(layer, color, (col * t + t // 2, row * t + t // 2), max(1, radius * t // TILE_SIZE))
+
 
 class Level:
-    def __init__(self, map_file, game):
+    def __init__(self, map_file, game, data=None):
         self.game = game
         self.map_file = map_file
 
-        data = load_level_file(map_file)
+        # data puede venir ya parseada por el AssetLoader (sin I/O aquí)
+        if data is None:
+            data = load_level_file(map_file)
 
         self.tiles = data["tiles"]
         self.pacman_spawn = tuple(data["pacman_spawn"])
         self.ghost_spawns = [tuple(pos) for pos in data["ghost_spawns"]]
 
-        self.pellets = [tuple(p) for p in data["pellets"]]
-        self.powerups = [tuple(p) for p in data["powerups"]]
-        
+        # Sets: comer es O(1) y el orden no importa (se dibujan en la capa)
+        self.pellets = {tuple(p) for p in data["pellets"]}
+        self.powerups = {tuple(p) for p in data["powerups"]}
+        # Orden fijo de los items del mapa (máscaras de bits: red, save-states)
+        self.item_cells = tuple(sorted(self.pellets | self.powerups))
+        self.powerup_cells = frozenset(self.powerups)
+        # Cambia con cada item comido o repuesto (version de caches como
+        # MazeGraph.nearest): la cantidad sola no dice QUÉ items quedan
+        self.item_revision = next(_ITEM_REVISIONS)
+
         # ------------------------------
         # Casita (desde JSON)
         # ------------------------------
         self.ghost_house_area = {tuple(p) for p in data.get("ghost_house_area", [])}
         self.ghost_house_door = tuple(data.get("ghost_house_door", ()))
 
+        # Capa cacheada de pellets/power-ups: se dibuja una vez y al comer
+        # solo se limpia ese tile (un blit por frame sin importar cuántos queden).
+        # Se crea al primer draw: con un renderer que no dibuja nunca existe.
+        # Una por tamaño de tile (TILE_SIZE o el de --pixel-tile)
+        self._item_layers = {}
+        # Capas de paredes por (estilo de neón doble/simple, tamaño de tile),
+        # creadas al primer draw
+        self._wall_layers = {}
+
 
     
+    # ----------------------------------------------------------
+    # CAPA DE PELLETS
+    # ----------------------------------------------------------
+    def item_layer(self, tile_size=TILE_SIZE):
+        layer = self._item_layers.get(tile_size)
+        if layer is None:
+            layer = self._item_layers[tile_size] = self.build_item_layer(tile_size)
+        return layer
+
+    def build_item_layer(self, tile_size=TILE_SIZE):
+        width = max(len(row) for row in self.tiles) * tile_size
+        height = len(self.tiles) * tile_size
+        layer = pygame.Surface((width, height), pygame.SRCALPHA)
+        layer.fill((0, 0, 0, 0))
+
+        for col, row in self.pellets:
+            draw_item_on(layer, tile_size, col, row, 3, WHITE)
+        for col, row in self.powerups:
+            draw_item_on(layer, tile_size, col, row, 8, YELLOW)
+        return layer
+
+    def draw_item(self, col, row, radius, color):
+        for tile_size, layer in self._item_layers.items():
+            draw_item_on(layer, tile_size, col, row, radius, color)
+
+    def clear_tile(self, col, row):
+        for t, layer in self._item_layers.items():
+            layer.fill((0, 0, 0, 0), (col * t, row * t, t, t))
+
+    def eat_pellet(self, col, row):
+        """True si había pellet en (col, row); lo quita del set y de la capa."""
+        if (col, row) not in self.pellets:
+            return False
+        self.pellets.discard((col, row))
+        self.clear_tile(col, row)
+        self.item_revision = next(_ITEM_REVISIONS)
+        return True
+
+    def eat_powerup(self, col, row):
+        if (col, row) not in self.powerups:
+            return False
+        self.powerups.discard((col, row))
+        self.clear_tile(col, row)
+        self.item_revision = next(_ITEM_REVISIONS)
+        return True
+
+    def set_items(self, remaining):
+        """
+        Deja en el nivel exactamente los items de `remaining` (celdas de
+        item_cells); solo se redibujan los tiles que cambian.
+        """
+        remaining = set(remaining)
+        current = self.pellets | self.powerups
+        for cell in current - remaining:
+            self.clear_tile(*cell)
+        for cell in remaining - current:
+            if cell in self.powerup_cells:
+                self.draw_item(cell[0], cell[1], 8, YELLOW)
+            else:
+                self.draw_item(cell[0], cell[1], 3, WHITE)
+
+        self.powerups = remaining & self.powerup_cells
+        self.pellets = remaining - self.powerup_cells
+        self.item_revision = next(_ITEM_REVISIONS)
+        # Reinicio o carga: las respuestas viejas de nearest ya no sirven
+        graph = MazeGraph.cached(self.tiles)
+        if graph is not None:
+            graph.forget_nearest()
+
+    def reset_items(self):
+        """Todos los items del mapa de nuevo (nivel o partida nueva), sin re-parsear."""
+        self.set_items(self.item_cells)
+
     def is_ghost_house(self, col, row):
         tile = self.tiles[row][col]
         return tile in ("-", " ") 
@@ -41,10 +146,41 @@ class Level:
     # DIBUJAR MAPA ESTÉTICO (Paredes Neón + Casita)
     # ----------------------------------------------------------
     def draw(self, renderer):
-        screen = renderer.screen
-        t = TILE_SIZE
+        # Paredes y casita: el mapa no cambia durante el nivel, así que el
+        # backend pygame las rasteriza una vez por estilo de neón (wall_layer)
+        # y los items en su propia capa (item_layer); acá solo se pide el mapa
+        renderer.draw_map(self)
+
+    def wall_layer(self, double=True, tile_size=TILE_SIZE):
+        layer = self._wall_layers.get((double, tile_size))
+        if layer is None:
+            layer = self._wall_layers[(double, tile_size)] = self.build_wall_layer(double, tile_size)
+        return layer
+
+    def build_wall_layer(self, double=True, tile_size=TILE_SIZE):
+        """Doble línea de neón (calidad alta) o solo la externa (calidades bajas)."""
+        t = tile_size
+        width = max(len(row) for row in self.tiles) * t
+        height = len(self.tiles) * t
+        layer = pygame.Surface((width, height))
+        self.draw_wall_rows(layer, 0, len(self.tiles) - 1, double, tile_size)
+        return layer
+
+    def draw_wall_rows(self, layer, first, last, double=True, tile_size=TILE_SIZE):
+        """(Re)dibuja la franja de filas first..last de una capa de paredes."""
+        t = tile_size
+        # Márgenes y grosores pensados para TILE_SIZE; con tiles chicos se
+        # achican sin bajar de 1 px (se dibujan nativos, no reescalados)
+        m1 = 2 * t // TILE_SIZE
+        m2 = 5 * t // TILE_SIZE
+        w = max(1, 2 * t // TILE_SIZE)
+        # Las líneas de un tile se derraman 1 px sobre el vecino: se dibujan
+        # también las filas de al lado, recortadas a la franja
+        layer.set_clip(pygame.Rect(0, first * t, layer.get_width(), (last - first + 1) * t))
+        layer.fill(DARK_BLUE)
 
-        for row_index, row in enumerate(self.tiles):
+        for row_index in range(max(first - 1, 0), min(last + 2, len(self.tiles))):
+            row = self.tiles[row_index]
             for col_index, tile in enumerate(row):
 
                 x = col_index * t
@@ -54,11 +190,11 @@ class Level:
                 # PUERTA (rosada estilo Pac-Man: línea horizontal fina)
                 # ------------------------------------------------------
                 if tile == "-":
-                    door_thickness = 6
+                    door_thickness = max(1, 6 * t // TILE_SIZE)
                     pygame.draw.rect(
-                        screen,
+                        layer,
                         (255, 150, 200),
-                        (x, y + TILE_SIZE//2 - door_thickness//2, TILE_SIZE, door_thickness)
+                        (x, y + t//2 - door_thickness//2, t, door_thickness)
                     )
                     continue
 
@@ -67,7 +203,7 @@ class Level:
                 # PAREDES estilo Pac-Man (líneas neón)
                 # ------------------------------------------------------
                 if tile == "#":
-                    pygame.draw.rect(screen, DARK_BLUE, (x, y, t, t))
+                    pygame.draw.rect(layer, DARK_BLUE, (x, y, t, t))
 
                     # Helper local
                     def is_wall(c, r):
@@ -77,53 +213,82 @@ class Level:
                             return False
                         return self.tiles[r][c] == "#"
 
-                    # Margen de líneas
-                    m1 = 2
-                    m2 = 5
-
                     # Arriba
                     if not is_wall(col_index, row_index - 1):
-                        pygame.draw.line(screen, BLUE,
-                            (x, y + m1), (x + t, y + m1), 2)
-                        pygame.draw.line(screen, INNER_BLUE,
-                            (x, y + m2), (x + t, y + m2), 2)
+                        pygame.draw.line(layer, BLUE,
+                            (x, y + m1), (x + t, y + m1), w)
+                        if double:
+                            pygame.draw.line(layer, INNER_BLUE,
+                                (x, y + m2), (x + t, y + m2), w)
 
                     # Abajo
                     if not is_wall(col_index, row_index + 1):
-                        pygame.draw.line(screen, BLUE,
-                            (x, y + t - m1 - 1), (x + t, y + t - m1 - 1), 2)
-                        pygame.draw.line(screen, INNER_BLUE,
-                            (x, y + t - m2 - 1), (x + t, y + t - m2 - 1), 2)
+                        pygame.draw.line(layer, BLUE,
+                            (x, y + t - m1 - 1), (x + t, y + t - m1 - 1), w)
+                        if double:
+                            pygame.draw.line(layer, INNER_BLUE,
+                                (x, y + t - m2 - 1), (x + t, y + t - m2 - 1), w)
 
                     # Izquierda
                     if not is_wall(col_index - 1, row_index):
-                        pygame.draw.line(screen, BLUE,
-                            (x + m1, y), (x + m1, y + t), 2)
-                        pygame.draw.line(screen, INNER_BLUE,
-                            (x + m2, y), (x + m2, y + t), 2)
+                        pygame.draw.line(layer, BLUE,
+                            (x + m1, y), (x + m1, y + t), w)
+                        if double:
+                            pygame.draw.line(layer, INNER_BLUE,
+                                (x + m2, y), (x + m2, y + t), w)
 
                     # Derecha
                     if not is_wall(col_index + 1, row_index):
-                        pygame.draw.line(screen, BLUE,
-                            (x + t - m1 - 1, y), (x + t - m1 - 1, y + t), 2)
-                        pygame.draw.line(screen, INNER_BLUE,
-                            (x + t - m2 - 1, y), (x + t - m2 - 1, y + t), 2)
-
-        # ------------------------------------------------------
-        # PELLETS
-        # ------------------------------------------------------
-        for col, row in self.pellets:
-            x = col * t + t // 2
-            y = row * t + t // 2
-            renderer.draw_circle(x, y, 3, WHITE)
+                        pygame.draw.line(layer, BLUE,
+                            (x + t - m1 - 1, y), (x + t - m1 - 1, y + t), w)
+                        if double:
+                            pygame.draw.line(layer, INNER_BLUE,
+                                (x + t - m2 - 1, y), (x + t - m2 - 1, y + t), w)
 
-        # ------------------------------------------------------
-        # POWERUPS
-        # ------------------------------------------------------
-        for col, row in self.powerups:
-            x = col * t + t // 2
-            y = row * t + t // 2
-            renderer.draw_circle(x, y, 8, YELLOW)
+        layer.set_clip(None)
+
+    # ----------------------------------------------------------
+    # RECARGA EN VIVO (modo --dev)
+    # ----------------------------------------------------------
+    def reload(self, data):
+        """
+        Aplica `data` (el mismo mapa editado) sin reconstruir el nivel: solo se
+        redibujan las filas cambiadas en las capas y se parchea el grafo del
+        laberinto. Las entidades no se tocan. Devuelve las filas cambiadas, o
+        None si cambió el tamaño del mapa (hay que crear un Level nuevo).
+        """
+        tiles = tuple(data["tiles"])
+        rows = changed_rows(self.tiles, tiles)
+        if rows is None:
+            return None
+        old_tiles = self.tiles
+        self.tiles = tiles
+        self.pacman_spawn = tuple(data["pacman_spawn"])
+        self.ghost_spawns = [tuple(pos) for pos in data["ghost_spawns"]]
+        self.ghost_house_area = {tuple(p) for p in data.get("ghost_house_area", [])}
+        self.ghost_house_door = tuple(data.get("ghost_house_door", ()))
+
+        # Items: lo ya comido sigue comido; lo nuevo aparece
+        pellets = {tuple(p) for p in data["pellets"]}
+        powerups = {tuple(p) for p in data["powerups"]}
+        eaten = set(self.item_cells) - self.pellets - self.powerups
+        for cell in (self.pellets & powerups) | (self.powerups & pellets):
+            # Cambió de tipo: se borra para que set_items lo dibuje de nuevo
+            self.pellets.discard(cell)
+            self.powerups.discard(cell)
+            self.clear_tile(*cell)
+        self.item_cells = tuple(sorted(pellets | powerups))
+        self.powerup_cells = frozenset(powerups)
+        self.set_items((pellets | powerups) - eaten)
+
+        for first, last in row_spans(rows, len(tiles)):
+            for (double, tile_size), layer in self._wall_layers.items():
+                self.draw_wall_rows(layer, first, last, double, tile_size)
+
+        graph = MazeGraph.cached(old_tiles)
+        if graph is not None and rows:
+            MazeGraph.remember(graph.patched(tiles, rows))
+        return rows
 
     # ----------------------------------------------------------
     def is_wall(self, col, row):
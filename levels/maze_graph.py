@@ -0,0 +1,149 @@
+# levels/maze_graph.py
+# Grafo del laberinto para consultas rápidas (bots, IA): vecinos precalculados
+# por celda y BFS cacheados. Es inmutable por mapa: se construye una vez por
+# tupla de tiles y se comparte entre todos los que lo consulten.
+from collections import OrderedDict, deque
+
+DIRS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+# Tiles que Pac-Man no puede pisar (pared + puerta/interior de la casita)
+BLOCKED_FOR_PACMAN = frozenset("#- ")
+
+
+def build_neighbors(tiles, blocked=BLOCKED_FOR_PACMAN, rows=None):
+    """
+    Funcion pura: {celda: ((dx, dy, celda_vecina), ...)} para celdas transitables
+    (solo de las filas `rows` si se indican).
+    """
+    height = len(tiles)
+    neighbors = {}
+    for r in range(height) if rows is None else sorted(rows):
+        row = tiles[r]
+        for c, ch in enumerate(row):
+            if ch in blocked:
+                continue
+            exits = []
+            for dx, dy in DIRS:
+                nc, nr = c + dx, r + dy
+                if 0 <= nr < height and 0 <= nc < len(tiles[nr]) and tiles[nr][nc] not in blocked:
+                    exits.append((dx, dy, (nc, nr)))
+            neighbors[(c, r)] = tuple(exits)
+    return neighbors
+
+
+# Grafos compartidos por mapa (LRU): tiles -> MazeGraph
+_GRAPHS = OrderedDict()
+GRAPH_CACHE_SIZE = 8
+
+
+class MazeGraph:
+    # Mapas de distancia cacheados (LRU) por celda origen
+    DISTANCE_CACHE_SIZE = 512
+
+    def __init__(self, tiles, blocked=BLOCKED_FOR_PACMAN, neighbors=None):
+        self.tiles = tiles
+        self.blocked = blocked
+        self.neighbors = build_neighbors(tiles, blocked) if neighbors is None else neighbors
+        self._distances = OrderedDict()
+        self._nearest = OrderedDict()
+
+    @staticmethod
+    def for_tiles(tiles):
+        """Grafo compartido por mapa (tiles es una tupla, hashable)."""
+        graph = _GRAPHS.get(tiles)
+        if graph is None:
+            graph = MazeGraph.remember(MazeGraph(tiles))
+        else:
+            _GRAPHS.move_to_end(tiles)
+        return graph
+
+    @staticmethod
+    def cached(tiles):
+        return _GRAPHS.get(tiles)
+
+    @staticmethod
+    def remember(graph):
+        _GRAPHS[graph.tiles] = graph
+        if len(_GRAPHS) > GRAPH_CACHE_SIZE:
+            _GRAPHS.popitem(last=False)
+        return graph
+
+    def patched(self, tiles, rows):
+        """
+        Grafo para `tiles` que solo difiere de este en `rows` (recarga en vivo):
+        se copian las celdas intactas y se recalculan esas filas y sus vecinas.
+        Las distancias cacheadas no se reutilizan (un cambio local altera caminos).
+        """
+        affected = {r + d for r in rows for d in (-1, 0, 1) if 0 <= r + d < len(tiles)}
+        neighbors = {cell: exits for cell, exits in self.neighbors.items() if cell[1] not in affected}
+        neighbors.update(build_neighbors(tiles, self.blocked, affected))
+        return MazeGraph(tiles, self.blocked, neighbors)
+
+    # ----------------------------------------------------------
+    # CONSULTAS
+    # ----------------------------------------------------------
+    def walkable(self, cell):
+        return cell in self.neighbors
+
+    def exits(self, cell):
+        return self.neighbors.get(cell, ())
+
+    def is_junction(self, cell):
+        return len(self.exits(cell)) > 2
+
+    def distances_from(self, cell):
+        """BFS completo desde cell (cacheado, LRU)."""
+        cached = self._distances.get(cell)
+        if cached is not None:
+            self._distances.move_to_end(cell)
+            return cached
+
+        dist = {cell: 0}
+        queue = deque((cell,))
+        while queue:
+            cur = queue.popleft()
+            d = dist[cur] + 1
+            for _, _, nxt in self.neighbors.get(cur, ()):
+                if nxt not in dist:
+                    dist[nxt] = d
+                    queue.append(nxt)
+
+        self._distances[cell] = dist
+        if len(self._distances) > self.DISTANCE_CACHE_SIZE:
+            self._distances.popitem(last=False)
+        return dist
+
+    def distance(self, a, b):
+        return self.distances_from(a).get(b)
+
+    def forget_nearest(self):
+        self._nearest.clear()
+
+    def nearest(self, cell, targets, version):
+        """
+        Primer paso (dx, dy) y distancia hacia el objetivo más cercano.
+        `version` identifica el conjunto de objetivos (p.ej. pellets restantes):
+        mientras no cambie, la respuesta por celda sale de cache.
+        """
+        key = (cell, version)
+        cached = self._nearest.get(key)
+        if cached is not None:
+            return cached
+
+        result = (None, None)
+        first = {cell: None}
+        queue = deque(((cell, 0),))
+        while queue:
+            cur, d = queue.popleft()
+            if cur in targets and cur != cell:
+                result = (first[cur], d)
+                break
+            for dx, dy, nxt in self.neighbors.get(cur, ()):
+                if nxt not in first:
+                    first[nxt] = first[cur] or (dx, dy)
+                    queue.append((nxt, d + 1))
+
+        self._nearest[key] = result
+        if len(self._nearest) > self.DISTANCE_CACHE_SIZE * 4:
+            self._nearest.popitem(last=False)
+        return result
@@ -1,8 +1,211 @@
 # main.py
-from core.game import Game
+import argparse
+import atexit
+import sys
 
-def main():
-    game = Game()
+from core.startup_profile import PROFILER
+from difficulty import DIFFICULTY_PRESETS
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Pac-Man Power-Up Edition")
+    parser.add_argument(
+        "--startup-profile",
+        action="store_true",
+        help="mide import/init por subsistema, imprime el reporte y sale",
+    )
+    parser.add_argument(
+        "--bot",
+        metavar="NAME",
+        help="Pac-Man lo maneja un bot (greedy | avoid)",
+    )
+    parser.add_argument(
+        "--headless",
+        type=float,
+        metavar="SECONDS",
+        help="sin ventana: juega SECONDS de simulación con --bot e imprime métricas",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="semilla para --headless")
+    parser.add_argument(
+        "--soak",
+        type=float,
+        metavar="HOURS",
+        help="partidas de bot sin ventana durante HOURS; falla si memoria/Surfaces/frame time crecen",
+    )
+    parser.add_argument("--soak-interval", type=float, default=60.0, metavar="SECONDS",
+                        help="intervalo de muestreo del modo soak")
+    parser.add_argument("--soak-report", metavar="PATH", help="escribe el reporte soak en JSON")
+    parser.add_argument(
+        "--serve",
+        type=int,
+        nargs="?",
+        const=47800,
+        metavar="PORT",
+        help="servidor multijugador (2-4 jugadores) en localhost:PORT",
+    )
+    parser.add_argument("--connect", metavar="HOST:PORT", help="unirse a una partida multijugador")
+    parser.add_argument(
+        "--telemetry",
+        metavar="PATH",
+        help="registra eventos de juego (JSONL rotativo) en PATH",
+    )
+    parser.add_argument(
+        "--pipelined",
+        action="store_true",
+        help="escala cada frame en un hilo aparte mientras se simula el siguiente",
+    )
+    parser.add_argument("--record", metavar="PATH", help="graba la partida (semilla + giros por tick) en PATH")
+    parser.add_argument("--export", metavar="SESSION", help="exporta una partida grabada a video/PNG")
+    parser.add_argument("--out", default="export", metavar="PATH",
+                        help="destino de --export: .mp4/.mkv/.webm/.mov/.gif (ffmpeg) o carpeta de PNG")
+    parser.add_argument("--fps", type=int, default=60, help="frames por segundo de --export")
+    parser.add_argument("--workers", type=int, help="procesos que codifican PNG en --export")
+    parser.add_argument("--level", metavar="PATH", help="mapa a jugar (.json o .txt; default level1.json)")
+    parser.add_argument(
+        "--dev",
+        action="store_true",
+        help="recarga el mapa en vivo al guardarlo (vigila su directorio)",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="profile.folded",
+        metavar="PATH",
+        help="perfila por muestreo toda la sesión y escribe collapsed stacks en PATH (F8 en juego)",
+    )
+    parser.add_argument(
+        "--renderer",
+        choices=["pygame", "null", "ascii", "recording"],
+        default="pygame",
+        help="backend de dibujo: ventana pygame, nada (servidores/headless), ASCII en la terminal o grabación",
+    )
+    parser.add_argument(
+        "--difficulty",
+        choices=list(DIFFICULTY_PRESETS),
+        default="NORMAL",
+        help="dificultad de la partida (HARD y CHAOS usan la IA de fantasmas con anticipación)",
+    )
+    parser.add_argument(
+        "--swarm",
+        type=int,
+        default=0,
+        metavar="N",
+        help="modo enjambre: N fantasmas (100-1000) guiados por un flow field compartido",
+    )
+    parser.add_argument(
+        "--pixel-tile",
+        type=int,
+        choices=[8, 16, 32],
+        default=None,
+        help="dibuja con tiles de N px y amplía a la ventana por un entero (retro y más barato; "
+             "default 32, 16 con --export)",
+    )
+    parser.add_argument(
+        "--quality",
+        choices=["auto", "ALTA", "MEDIA", "BAJA", "MINIMA"],
+        default="auto",
+        help="calidad de dibujo fija (default: auto, según el tiempo de frame)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if args.telemetry:
+        from core.telemetry import TELEMETRY
+
+        TELEMETRY.start(args.telemetry)
+        atexit.register(TELEMETRY.stop)
+
+    if args.soak is not None:
+        from core.soak import run_soak, format_report as format_soak
+
+        report = run_soak(args.soak, args.bot or "avoid", args.soak_interval,
+                          report_path=args.soak_report)
+        print(format_soak(report))
+        sys.exit(0 if report.ok else 1)
+
+    if args.serve is not None:
+        from core.net_server import run_server
+
+        run_server(args.serve)
+        return
+
+    if args.export:
+        from core.replay import load_session
+        from core.video_export import EXPORT_PIXEL_TILE, export_session, format_report as format_export
+
+        stats = export_session(load_session(args.export), args.out, args.fps, args.workers,
+                               pixel_tile=args.pixel_tile or EXPORT_PIXEL_TILE, level_file=args.level)
+        print(format_export(stats))
+        return
+
+    if args.headless is not None:
+        from core.headless import create_headless_game, run_headless, format_report
+
+        game = None
+        if args.record or args.renderer != "pygame" or args.swarm:
+            game = create_headless_game(None, renderer=args.renderer, swarm=args.swarm,
+                                        level_file=args.level, pixel_tile=args.pixel_tile)
+        if args.record:
+            from core.replay import SessionRecorder
+
+            game.session = SessionRecorder(args.record)
+        profiler = None
+        if args.profile:
+            from core.sampling_profiler import SamplingProfiler
+
+            profiler = SamplingProfiler().start()
+        print(format_report(run_headless(args.bot or "greedy", args.headless, seed=args.seed,
+                                         difficulty=args.difficulty, game=game,
+                                         level_file=args.level, pixel_tile=args.pixel_tile)))
+        if profiler is not None:
+            profiler.stop()
+            profiler.write(args.profile)
+            print(profiler.report())
+        if args.record:
+            game.session.save()
+        return
+
+    if args.renderer != "pygame":
+        # Sin ventana real: el backend elegido dibuja (o no) por su cuenta
+        from core.headless import use_dummy_drivers
+
+        use_dummy_drivers()
+    with PROFILER.measure("pygame", "import"):
+        import pygame  # noqa: F401
+    with PROFILER.measure("core", "import"):
+        from core.game import Game
+
+    bot = None
+    if args.bot:
+        from core.bots import make_bot
+
+        bot = make_bot(args.bot)
+
+    if args.connect:
+        from core.net_client import run_client
+
+        host, _, port = args.connect.rpartition(":")
+        run_client(host or "127.0.0.1", int(port), bot=bot)
+        return
+
+    from core.highscores import HighScoreStore
+
+    game = Game(startup_profile=args.startup_profile, bot=bot, pipelined=args.pipelined,
+                high_scores=HighScoreStore(), quality=args.quality, level_file=args.level,
+                profile=args.profile, renderer=args.renderer, swarm=args.swarm,
+                pixel_tile=args.pixel_tile, difficulty=args.difficulty)
+    if args.dev:
+        game.enable_hot_reload()
+    if args.record:
+        from core.replay import SessionRecorder
+
+        game.session = SessionRecorder(args.record)
+    if args.renderer != "pygame":
+        # Sin ventana no hay teclado para el menú: la partida arranca sola
+        game.start_normal_mode()
     game.run()
 
 if __name__ == "__main__":
@@ -1,14 +1,16 @@
 # powerups/fright_mode.py
+from entities.store import GhostState
+from powerups.powerup import PowerUp
 
-class FrightMode:
+
+class FrightMode(PowerUp):
     """
     Power-up: Fantasmas entran en modo FRIGHT.
     Pac-Man puede comerlos.
     Dura X segundos.
     """
     def __init__(self, duration=6):
-        self.duration = duration
-        self.remaining_time = duration
+        super().__init__(duration=duration)
 
     def apply(self, pacman):
         """Activa fright mode en TODOS los fantasmas."""
@@ -16,11 +18,13 @@ class FrightMode:
 
         for ghost in game.ghosts:
             # Si un fantasma ya está "eyes", no entra en fright
-            if ghost.state != "eyes":
+            if ghost.state != GhostState.EYES:
                 ghost.enter_fright()
+        if game.swarm is not None:
+            game.swarm.frighten()
 
     def remove(self, pacman):
         """Cuando termina el efecto, volverán solos a normal por su timer interno."""
         # No se hace nada aquí.
-        # ghost.reset_normal() ocurre automáticamente cuando su fright_timer llega a 0.
+        # Cada fantasma registró su propia salida de fright en el Scheduler.
         pass
@@ -3,7 +3,13 @@
 class PowerUp:
     def __init__(self, duration):
         self.duration = duration
-        self.remaining_time = duration
+        # Handle del Scheduler central (lo asigna Pacman.add_effect)
+        self.timer = None
+
+    @property
+    def remaining_time(self):
+        """Tiempo restante según el reloj de simulación (duración completa si aún no empezó)."""
+        return self.timer.remaining if self.timer is not None else self.duration
 
     def apply(self, pacman):
         pass
@@ -0,0 +1,46 @@
+import unittest
+
+from core.asset_loader import AssetLoader, LoadJob, validate_jobs
+
+
+class ValidateJobsTest(unittest.TestCase):
+    def test_rejects_unknown_dependency(self):
+        with self.assertRaises(ValueError):
+            validate_jobs([LoadJob("a", deps=("missing",))])
+
+    def test_rejects_cycles(self):
+        with self.assertRaises(ValueError):
+            validate_jobs([LoadJob("a", deps=("b",)), LoadJob("b", deps=("a",))])
+
+
+class AssetLoaderTest(unittest.TestCase):
+    def test_dependencies_finish_before_dependents(self):
+        order = []
+        jobs = [
+            LoadJob("base", work=lambda: order.append("base") or 1, group="menu"),
+            LoadJob("child", work=lambda: order.append("child") or 2, deps=("base",)),
+            LoadJob("main_only", finalize=lambda _: "ok", deps=("child",)),
+        ]
+        loader = AssetLoader(jobs, max_workers=2)
+        loader.wait(timeout=5)
+
+        self.assertEqual(order, ["base", "child"])
+        self.assertEqual(loader.result("main_only"), "ok")
+        self.assertTrue(loader.group_ready("menu"))
+        self.assertEqual(loader.progress(), 1.0)
+
+    def test_failed_job_is_reported_and_does_not_block(self):
+        def boom():
+            raise IOError("disk")
+
+        loader = AssetLoader([LoadJob("bad", work=boom), LoadJob("after", work=lambda: 3, deps=("bad",))])
+        loader.wait(timeout=5)
+
+        self.assertTrue(loader.is_done())
+        self.assertEqual(loader.result("after"), 3)
+        with self.assertRaises(IOError):
+            loader.result("bad")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from core.bots import BotController, make_bot
+from core.game import Game
+from levels.maze_graph import MazeGraph
+
+
+class BotTargetsTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.game = Game()
+        cls.game.wait_until_loaded()
+
+    def test_restart_with_same_item_count_finds_remaining_pellets(self):
+        game = self.game
+        game.start_game_with_difficulty("NORMAL")
+        level = game.level
+        bot = make_bot("greedy")
+        bot.graph = MazeGraph.for_tiles(level.tiles)
+        cell = level.pacman_spawn
+        by_distance = sorted((bot.graph.distance(cell, p), p) for p in level.pellets
+                             if bot.graph.distance(cell, p))
+        near, middle, far = by_distance[0][1], by_distance[len(by_distance) // 2][1], by_distance[-1][1]
+
+        # Dos items: la respuesta hacia `near` queda cacheada
+        level.set_items({near, far})
+        before = bot.nearest_item(game, cell)
+
+        # Reinicio y otra vez dos items, pero `near` ya no está
+        game.restart_level()
+        self.assertIs(game.level, level)
+        level.set_items({middle, far})
+        expected = MazeGraph(level.tiles).nearest(cell, frozenset({middle, far}), None)
+        self.assertEqual(bot.nearest_item(game, cell), expected)
+        self.assertNotEqual(before, expected)
+
+    def test_bot_without_decide_fails_at_construction(self):
+        class Incomplete(BotController):
+            name = "incompleto"
+
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+
+if __name__ == "__main__":
+    unittest.main()
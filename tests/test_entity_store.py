@@ -0,0 +1,39 @@
+import unittest
+
+from entities.store import (
+    EntityStore, FRIGHTENED_STATES, GhostState, KIND_GHOST, KIND_PACMAN,
+)
+
+
+class EntityStoreTest(unittest.TestCase):
+    def test_released_slots_are_reused_and_reset(self):
+        store = EntityStore(capacity=2)
+        a = store.allocate(KIND_GHOST)
+        store.x[a] = 42
+        store.release(a)
+
+        b = store.allocate(KIND_PACMAN)
+        self.assertEqual(a, b)
+        self.assertEqual(store.x[b], 0)
+        self.assertEqual(store.kind[b], KIND_PACMAN)
+
+    def test_grows_past_initial_capacity(self):
+        store = EntityStore(capacity=1)
+        slots = [store.allocate(KIND_GHOST) for _ in range(5)]
+        self.assertEqual(sorted(slots), list(range(5)))
+        self.assertEqual(store.live_count(KIND_GHOST), 5)
+
+    def test_bulk_state_queries_filter_by_kind(self):
+        store = EntityStore()
+        pac = store.allocate(KIND_PACMAN)
+        ghost = store.allocate(KIND_GHOST)
+        store.state[pac] = GhostState.FRIGHT  # no cuenta: no es fantasma
+
+        self.assertFalse(store.any_state(KIND_GHOST, FRIGHTENED_STATES))
+        store.state[ghost] = GhostState.BLINK
+        self.assertTrue(store.any_state(KIND_GHOST, FRIGHTENED_STATES))
+        self.assertEqual(store.count_state(KIND_GHOST, FRIGHTENED_STATES), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
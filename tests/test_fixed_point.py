@@ -0,0 +1,25 @@
+import unittest
+
+from core.fixed_point import SUBPIXEL, TILE, approach, center_of, next_center, step_units
+
+
+class FixedPointTest(unittest.TestCase):
+    def test_next_center_never_skips_a_tile(self):
+        center = center_of(3)
+        self.assertEqual(next_center(center - 1, 1), center)
+        self.assertEqual(next_center(center, 1), center + TILE)
+        self.assertEqual(next_center(center + 1, -1), center)
+        self.assertEqual(next_center(center, -1), center - TILE)
+
+    def test_step_units_are_integers_per_tick(self):
+        self.assertEqual(step_units(120, 1 / 60), 2 * SUBPIXEL)
+        self.assertIsInstance(step_units(140, 1 / 60), int)
+
+    def test_approach_arrives_exactly(self):
+        self.assertEqual(approach(0, 10, 4), 4)
+        self.assertEqual(approach(8, 10, 4), 10)
+        self.assertEqual(approach(10, 0, 40), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,12 @@
 import unittest
 
-from core.functional_core import ghost_speed_for_level, resolve_difficulty
-from ui.menu import cycle_option, reduce_menu_selection
+from core.functional_core import (
+    ghost_speed_for_level,
+    resolve_difficulty,
+    substep_count,
+    swept_min_distance,
+)
+from ui.menu import cycle_option, next_difficulty, reduce_menu_selection
 
 
 class MenuReducerTest(unittest.TestCase):
@@ -9,6 +14,12 @@ class MenuReducerTest(unittest.TestCase):
         self.assertEqual(cycle_option(0, -1, 4), 3)
         self.assertEqual(cycle_option(3, 1, 4), 0)
 
+    def test_next_difficulty_cycles_presets(self):
+        names = ["EASY", "NORMAL", "HARD", "CHAOS"]
+        self.assertEqual(next_difficulty("NORMAL", names), "HARD")
+        self.assertEqual(next_difficulty("CHAOS", names), "EASY")
+        self.assertEqual(next_difficulty("???", names), "EASY")
+
     def test_reduce_menu_selection_keeps_purity(self):
         options = ["EASY", "NORMAL", "HARD"]
         self.assertEqual(reduce_menu_selection(0, "DOWN", options), 1)
@@ -30,5 +41,21 @@ class DifficultyHelpersTest(unittest.TestCase):
         self.assertAlmostEqual(ghost_speed_for_level(preset, 0), 100)
 
 
+class SweptCollisionTest(unittest.TestCase):
+    def test_head_on_crossing_is_detected(self):
+        # Los extremos están a 30px, pero se cruzan a mitad del paso
+        distance = swept_min_distance((0, 0), (30, 0), (30, 0), (0, 0))
+        self.assertAlmostEqual(distance, 0.0)
+
+    def test_parallel_movement_keeps_distance(self):
+        distance = swept_min_distance((0, 0), (10, 0), (0, 40), (10, 40))
+        self.assertAlmostEqual(distance, 40.0)
+
+    def test_substep_count_bounds_step_length(self):
+        self.assertEqual(substep_count(5.0, 8.0), 1)
+        self.assertEqual(substep_count(20.0, 8.0), 3)
+        self.assertEqual(substep_count(1000.0, 8.0), 16)
+
+
 if __name__ == "__main__":
     unittest.main()
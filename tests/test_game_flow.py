@@ -0,0 +1,99 @@
+import os
+import unittest
+from unittest import mock
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from core.fixed_point import TICK_DT
+from core.game import Game
+
+
+class DyingTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.game = Game()
+        cls.game.wait_until_loaded()
+
+    def hit(self, lives):
+        """Partida con `lives` vidas; Pac-Man sobre un fantasma y un tick."""
+        game = self.game
+        game.start_game_with_difficulty("NORMAL", seed=1)
+        game.hud.lives = lives
+        ghost = game.ghosts[0]
+        game.pacman.x, game.pacman.y = ghost.x, ghost.y
+        game.update(TICK_DT)
+        self.assertEqual(game.state, "DYING")
+        self.assertEqual(game.hud.lives, lives - 1)
+
+    def run_dying(self, ticks):
+        # Un frame completo del loop: eventos, simulación y dibujo
+        for _ in range(ticks):
+            self.game.handle_events()
+            self.game.update(TICK_DT)
+            self.game.render()
+
+    def test_hit_plays_death_then_respawns(self):
+        game = self.game
+        self.hit(lives=3)
+        where = (game.pacman.x, game.pacman.y)
+
+        self.run_dying(game.DEATH_TICKS - 1)
+        self.assertEqual(game.state, "DYING")
+        self.assertEqual((game.pacman.x, game.pacman.y), where)
+
+        self.run_dying(1)
+        self.assertEqual(game.state, "GAME")
+        self.assertEqual(game.hud.lives, 2)
+        spawn = tuple(v * 32 + 16 for v in game.level.pacman_spawn)
+        self.assertEqual((game.pacman.x, game.pacman.y), spawn)
+
+    def test_last_life_ends_in_game_over(self):
+        game = self.game
+        self.hit(lives=1)
+        self.run_dying(game.DEATH_TICKS)
+        self.assertEqual(game.state, "GAME_OVER")
+
+    def test_game_over_stops_remaining_ticks_of_frame(self):
+        game = self.game
+        self.hit(lives=1)
+        submitted = []
+        with mock.patch.object(game, "submit_score", lambda: submitted.append(game.hud.score)):
+            self.run_dying(game.DEATH_TICKS - 1)
+            # Un frame de 3 ticks: el fin de DYING cae en el primero
+            game.update(3 * TICK_DT)
+            game.update(3 * TICK_DT)
+        self.assertEqual(game.state, "GAME_OVER")
+        self.assertEqual(game.hud.lives, 0)
+        self.assertEqual(len(submitted), 1)
+
+
+class RestartTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.game = Game()
+        cls.game.wait_until_loaded()
+
+    def test_restart_reuses_entities_and_level(self):
+        game = self.game
+        game.start_game_with_difficulty("NORMAL", seed=1)
+        level, pacman, ghosts = game.level, game.pacman, list(game.ghosts)
+        initial = set(level.item_cells)
+        for _ in range(120):
+            game.update(TICK_DT)
+        self.assertNotEqual(level.pellets | level.powerups, initial)
+
+        # Reiniciar no vuelve a leer el mapa de disco
+        with mock.patch("levels.level.load_level_file", side_effect=AssertionError("mapa releído")), \
+                mock.patch("builtins.open", side_effect=AssertionError("archivo abierto")):
+            game.start_game_with_difficulty("NORMAL", seed=2)
+
+        self.assertIs(game.level, level)
+        self.assertIs(game.pacman, pacman)
+        self.assertEqual([id(g) for g in game.ghosts], [id(g) for g in ghosts])
+        self.assertEqual(level.pellets | level.powerups, initial)
+        self.assertEqual(level.powerups, set(level.powerup_cells))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+from types import SimpleNamespace
+
+from entities.ghost_ai import LookaheadGhostAI, predict_path, walk_corridor
+from entities.store import GhostState
+from levels.maze_graph import MazeGraph
+
+TILES = (
+    "#########",
+    "#.......#",
+    "#.##.##.#",
+    "#.......#",
+    "#########",
+)
+
+
+def actor(col, row, **extra):
+    return SimpleNamespace(x=col * 32 + 16, y=row * 32 + 16, **extra)
+
+
+class GhostAITest(unittest.TestCase):
+    def setUp(self):
+        self.graph = MazeGraph(TILES)
+
+    def test_walk_corridor_stops_at_junction(self):
+        cells, arrive = walk_corridor(self.graph, (1, 1), (1, 0), 20)
+        self.assertEqual(cells, ((2, 1), (3, 1), (4, 1)))
+        self.assertEqual(arrive, (1, 0))
+
+    def test_predicted_path_follows_corridor(self):
+        path = predict_path(self.graph, (5, 3), (1, 0), 5)
+        self.assertEqual(path, ((5, 3), (6, 3), (7, 3), (7, 2), (7, 1)))
+
+    def test_chases_and_flees(self):
+        pacman = actor(7, 3, dir_x=0, dir_y=0)
+        ai = LookaheadGhostAI(SimpleNamespace(pacmans=lambda: (pacman,)))
+        ghost = actor(4, 1, color="red", state=GhostState.NORMAL,
+                      level=SimpleNamespace(tiles=TILES), current_cell=lambda: (4, 1))
+        options = [(1, 0), (-1, 0), (0, 1)]
+
+        self.assertEqual(ai.choose(ghost, options), (1, 0))
+        ghost.state = GhostState.FRIGHT
+        self.assertEqual(ai.choose(ghost, options), (-1, 0))
+        self.assertLessEqual(len(ai.table), ai.TABLE_SIZE)
+
+
+class MenuDifficultyTest(unittest.TestCase):
+    def test_hard_from_menu_uses_lookahead_ai(self):
+        import os
+
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        from core.game import Game
+
+        game = Game()
+        game.wait_until_loaded()
+        actions = [item.action for item in game.menu.items]
+        game.menu.selected = actions.index("difficulty")
+        game.start_menu_selection()
+        game.menu.selected = actions.index("start")
+        game.start_menu_selection()
+        self.assertEqual(game.difficulty_name, "HARD")
+        self.assertTrue(all(isinstance(g.ai, LookaheadGhostAI) for g in game.ghosts))
+
+
+if __name__ == "__main__":
+    unittest.main()
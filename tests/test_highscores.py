@@ -0,0 +1,34 @@
+import os
+import tempfile
+import unittest
+
+from core.highscores import HighScoreStore, insert_top
+
+
+class HighScoreStoreTest(unittest.TestCase):
+    def test_insert_top_keeps_order_and_limit(self):
+        entries = [(900, 3), (500, 2), (100, 1)]
+        self.assertEqual(insert_top(entries, 600, 2, 3), [(900, 3), (600, 2), (500, 2)])
+        self.assertEqual(insert_top(entries, 50, 1, 3), entries)
+
+    def test_submissions_persist_across_stores(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "scores.db")
+            store = HighScoreStore(path, top_n=2).load()
+            store.submit("NORMAL", 300, 1)
+            store.submit("NORMAL", 1200, 2)
+            store.submit("NORMAL", 700, 2)
+            store.submit("HARD", 50, 1)
+            # El cache se actualiza sin esperar al escritor
+            self.assertEqual(store.top("NORMAL"), [(1200, 2), (700, 2)])
+            store.close()
+
+            reloaded = HighScoreStore(path, top_n=2).load()
+            self.assertEqual(reloaded.top("NORMAL"), [(1200, 2), (700, 2)])
+            self.assertEqual(reloaded.best("HARD"), 50)
+            self.assertEqual(reloaded.level_best("NORMAL", 2), 1200)
+            self.assertEqual(reloaded.best("EASY"), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+
+from levels.hot_reload import changed_rows, row_spans
+from levels.maze_graph import MazeGraph
+
+
+TILES = (
+    "#####",
+    "#...#",
+    "#.#.#",
+    "#...#",
+    "#####",
+)
+
+
+class HotReloadTest(unittest.TestCase):
+    def test_changed_rows_detects_resize(self):
+        edited = TILES[:2] + ("#...#",) + TILES[3:]
+        self.assertEqual(changed_rows(TILES, edited), [2])
+        self.assertIsNone(changed_rows(TILES, TILES[:-1]))
+        self.assertIsNone(changed_rows(TILES, TILES[:-1] + ("######",)))
+
+    def test_row_spans_include_neighbours_and_merge(self):
+        self.assertEqual(row_spans([0], 5), [(0, 1)])
+        self.assertEqual(row_spans([1, 3], 5), [(0, 4)])
+        self.assertEqual(row_spans([1, 8], 10), [(0, 2), (7, 9)])
+
+    def test_patched_graph_matches_full_rebuild(self):
+        edited = TILES[:2] + ("#...#",) + TILES[3:]
+        patched = MazeGraph(TILES).patched(edited, [2])
+        self.assertEqual(patched.neighbors, MazeGraph(edited).neighbors)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+
+import pygame
+
+from levels.level import Level
+
+T = 32
+DATA = {
+    "tiles": (
+        "#######",
+        "#.....#",
+        "#######",
+    ),
+    "pacman_spawn": (3, 1),
+    "ghost_spawns": [],
+    "pellets": [(1, 1), (2, 1), (4, 1), (5, 1)],
+    "powerups": [(3, 1)],
+}
+
+
+def tile_pixels(layer, col, row):
+    return pygame.image.tobytes(layer.subsurface((col * T, row * T, T, T)), "RGBA")
+
+
+class ItemLayerTest(unittest.TestCase):
+    def setUp(self):
+        self.level = Level("test.json", game=None, data=DATA)
+
+    def test_eating_clears_only_that_tile(self):
+        layer = self.level.item_layer()
+        before = {cell: tile_pixels(layer, *cell) for cell in self.level.item_cells}
+        self.assertTrue(self.level.eat_pellet(2, 1))
+
+        self.assertIs(self.level.item_layer(), layer)
+        self.assertEqual(tile_pixels(layer, 2, 1), bytes(T * T * 4))
+        for cell, pixels in before.items():
+            if cell != (2, 1):
+                self.assertEqual(tile_pixels(layer, *cell), pixels)
+
+    def test_set_items_and_restart_redraw_the_layer(self):
+        level = self.level
+        layer = level.item_layer()
+        level.eat_pellet(1, 1)
+        level.eat_powerup(3, 1)
+
+        # Solo dos pellets: la capa incremental queda igual a una dibujada de cero
+        level.set_items({(1, 1), (5, 1)})
+        expected = Level("test.json", game=None, data=dict(DATA, pellets=[(1, 1), (5, 1)], powerups=[]))
+        self.assertEqual(pygame.image.tobytes(layer, "RGBA"),
+                         pygame.image.tobytes(expected.build_item_layer(), "RGBA"))
+
+        level.reset_items()
+        self.assertIs(level.item_layer(), layer)
+        fresh = level.build_item_layer()
+        self.assertEqual(pygame.image.tobytes(layer, "RGBA"), pygame.image.tobytes(fresh, "RGBA"))
+
+
+if __name__ == "__main__":
+    unittest.main()
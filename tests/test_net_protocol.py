@@ -0,0 +1,44 @@
+import unittest
+
+from core.net_protocol import (
+    Snapshot, apply_entities, cells_from_mask, decode_input, decode_snapshot, diff_entities,
+    encode_input, encode_snapshot, entity_state, item_mask,
+)
+
+
+class NetProtocolTest(unittest.TestCase):
+    def test_full_snapshot_round_trip(self):
+        cells = tuple((c, r) for r in range(3) for c in range(7))
+        remaining = set(cells[::3])
+        snap = Snapshot(
+            tick=10, base_tick=0, ack_seq=7, level=2,
+            entities={0: entity_state(1, -1, 0, 48.25, 80.0), 16: entity_state(0, 0, 1, 16.0, 16.5)},
+            players={0: (1200, 3), 1: (40, 1)},
+            item_mask=item_mask(cells, remaining), substeps=3,
+        )
+        decoded = decode_snapshot(encode_snapshot(snap))
+        self.assertEqual(decoded, snap)
+        self.assertEqual(cells_from_mask(cells, decoded.item_mask), remaining)
+
+    def test_delta_only_carries_changes(self):
+        base = {0: (0, 1, 100, 100), 1: (0, 2, 200, 200), 17: (0, 3, 50, 50)}
+        current = {0: (0, 1, 96, 100), 1: (0, 2, 200, 200)}
+        changed, removed = diff_entities(base, current)
+        self.assertEqual(changed, {0: (0, 1, 96, 100)})
+        self.assertEqual(removed, (17,))
+
+        snap = Snapshot(11, 10, 8, 1, changed, removed, eaten=((3, 4), (5, 6)))
+        data = encode_snapshot(snap)
+        decoded = decode_snapshot(data)
+        self.assertEqual(decoded, snap)
+        self.assertEqual(apply_entities(base, decoded.entities, decoded.removed), current)
+        self.assertLess(len(data), 40)
+
+    def test_input_carries_redundant_history(self):
+        player, ack, inputs = decode_input(encode_input(2, 99, 5, [1, 1, 3, 0]))
+        self.assertEqual((player, ack), (2, 99))
+        self.assertEqual(inputs, [(5, 1), (6, 1), (7, 3), (8, 0)])
+
+
+if __name__ == "__main__":
+    unittest.main()
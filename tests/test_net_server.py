@@ -0,0 +1,113 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from core.net_client import NetClientGame
+from core.net_protocol import decode_snapshot, encode_hello, encode_input
+from core.net_server import MatchGame, MatchServer
+from powerups.score_multiplier import ScoreMultiplier
+from powerups.speed_boost import SpeedBoost
+
+
+class FakeTransport:
+    def __init__(self):
+        self.sent = []
+
+    def sendto(self, data, addr):
+        self.sent.append((data, addr))
+
+
+class NetServerTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.game = MatchGame()
+
+    def setUp(self):
+        self.game.restart_match()
+        self.server = MatchServer(self.game)
+        self.server.transport = FakeTransport()
+        self.addr = ("127.0.0.1", 50000)
+        self.server.handle_datagram(encode_hello(), self.addr)
+        self.pid = self.server.clients[self.addr].pid
+
+    def test_multiplied_points_stay_integer_in_snapshots(self):
+        pacman = self.game.players[self.pid]
+        pacman.add_effect(ScoreMultiplier())
+        self.game.award_points(pacman, 10 * pacman.score_multiplier)
+        self.server.run_tick()
+        data, _ = self.server.transport.sent[-1]
+        score = self.game.stats[self.pid].score
+        self.assertIsInstance(score, int)
+        self.assertGreaterEqual(score, 20)
+        self.assertEqual(decode_snapshot(data).players[self.pid][0], score)
+
+    def test_unknown_direction_codes_are_ignored(self):
+        pacman = self.game.players[self.pid]
+        self.server.handle_datagram(encode_input(self.pid, 0, 1, [9, 255]), self.addr)
+        self.server.run_tick()
+        self.server.run_tick()
+        client = self.server.clients[self.addr]
+        self.assertEqual(client.applied_seq, 2)
+        self.assertEqual((pacman.next_dir_x, pacman.next_dir_y), (0, 0))
+
+    def sync_client(self, client, ticks):
+        """Ticks del servidor; el cliente recibe cada snapshot y lo confirma."""
+        for _ in range(ticks):
+            self.server.run_tick()
+            data, _ = self.server.transport.sent[-1]
+            client.inbox.append(data)
+            client.receive_snapshots()
+            self.server.handle_datagram(encode_input(self.pid, client.last_tick, client.seq, [0]), self.addr)
+
+    def test_client_items_follow_restart_and_level_up(self):
+        client = NetClientGame()
+        client.wait_until_loaded()
+        client.start_game_with_difficulty("NORMAL")
+        client.player_id = self.pid
+        level = self.game.level
+
+        def items(game):
+            return game.level.pellets | game.level.powerups
+
+        self.sync_client(client, 3)
+        eaten = sorted(level.pellets)[:10]
+        for cell in eaten:
+            level.eat_pellet(*cell)
+        self.sync_client(client, 3)
+        self.assertEqual(items(client), items(self.game))
+        self.assertTrue(items(client).isdisjoint(eaten))
+
+        self.game.restart_match()
+        self.sync_client(client, 1)
+        self.assertEqual(items(client), items(self.game))
+        self.assertTrue(set(eaten) <= items(client))
+
+        for cell in sorted(level.pellets)[:5]:
+            level.eat_pellet(*cell)
+        self.sync_client(client, 2)
+        self.game.current_level += 1
+        self.game.load_next_level()
+        self.sync_client(client, 1)
+        self.assertEqual(client.server_level, self.game.current_level)
+        self.assertEqual(items(client), items(self.game))
+
+    def test_client_predicts_with_server_effects_and_substeps(self):
+        # Un segundo jugador con SpeedBoost sube los sub-pasos de todos
+        other = ("127.0.0.1", 50001)
+        self.server.handle_datagram(encode_hello(), other)
+        self.game.players[self.server.clients[other].pid].add_effect(SpeedBoost())
+        self.game.players[self.pid].add_effect(SpeedBoost())
+        self.server.run_tick()
+        data = next(d for d, addr in reversed(self.server.transport.sent) if addr == self.addr)
+        self.assertEqual(decode_snapshot(data).substeps, self.game.substeps(self.server.dt))
+
+        client = NetClientGame()
+        client.wait_until_loaded()
+        client.start_game_with_difficulty("NORMAL")
+        client.player_id = self.pid
+        client.inbox.append(data)
+        client.receive_snapshots()
+        self.assertEqual(client.pacman.speed_multiplier, 1.8)
+        self.assertEqual(client.server_substeps, self.game.substeps(self.server.dt))
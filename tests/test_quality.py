@@ -0,0 +1,38 @@
+import contextlib
+import io
+import unittest
+
+from core.quality import QualityGovernor, TIERS
+
+
+class QualityGovernorTest(unittest.TestCase):
+    def run_frames(self, governor, frame_ms, count):
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(count):
+                governor.record(frame_ms)
+
+    def test_degrades_fast_and_restores_slowly(self):
+        governor = QualityGovernor(budget_ms=16.0, window=10, degrade_after=10, restore_after=50)
+        self.run_frames(governor, 25.0, 10)
+        self.assertEqual(governor.tier, TIERS[1])
+
+        # Holgura pero no suficiente (entre restore y degrade): se queda
+        self.run_frames(governor, 12.0, 200)
+        self.assertEqual(governor.tier, TIERS[1])
+
+        # Holgura clara: sube recién tras una racha de restore_after frames
+        self.run_frames(governor, 5.0, 40)
+        self.assertEqual(governor.tier, TIERS[1])
+        self.run_frames(governor, 5.0, 20)
+        self.assertEqual(governor.tier, TIERS[0])
+        self.assertEqual(governor.changes, 2)
+
+    def test_stays_within_tiers(self):
+        governor = QualityGovernor(budget_ms=16.0, window=5, degrade_after=5)
+        self.run_frames(governor, 100.0, 100)
+        self.assertEqual(governor.tier, TIERS[-1])
+        self.assertEqual(governor.changes, len(TIERS) - 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import io
+import unittest
+from types import SimpleNamespace
+
+import pygame
+
+from core.render_backends import AsciiRenderer, RecordingRenderer, make_renderer
+from core.renderer import TILE_SIZE, NullRenderer, PixelRenderer
+from ui.hud import HUD
+
+
+def fake_level():
+    return SimpleNamespace(
+        map_file="test", tiles=("#####", "#..-#", "#####"),
+        pellets={(1, 1)}, powerups={(2, 1)},
+    )
+
+
+class RenderBackendsTest(unittest.TestCase):
+    def setUp(self):
+        self.surface = pygame.Surface((5 * TILE_SIZE, 3 * TILE_SIZE))
+
+    def test_make_renderer_by_name(self):
+        self.assertIsInstance(make_renderer("null", self.surface), NullRenderer)
+        self.assertFalse(make_renderer("null", self.surface).DRAWS)
+        with self.assertRaises(ValueError):
+            make_renderer("opengl", self.surface)
+
+    def test_recording_captures_draw_calls_per_frame(self):
+        renderer = RecordingRenderer(self.surface)
+        hud = HUD()
+        hud.score = 120
+        renderer.clear((0, 0, 0))
+        hud.draw(renderer)
+        self.assertIn(("text", "Score: 120", 10, 10), renderer.find("text"))
+        renderer.present()
+        self.assertEqual(len(renderer.frames), 1)
+        self.assertEqual(renderer.commands, [])
+
+    def test_ascii_draws_map_sprites_and_text(self):
+        out = io.StringIO()
+        renderer = AsciiRenderer(self.surface, stream=out, max_fps=0)
+        renderer.clear((0, 0, 0))
+        renderer.draw_map(fake_level())
+        renderer.draw_sprite(None, 3 * TILE_SIZE, 1 * TILE_SIZE, "R")
+        self.assertEqual(renderer.text(), "#####\n#.oR#\n#####")
+        renderer.draw_text("Hi", 0, 2 * TILE_SIZE + 5)
+        renderer.present()
+        self.assertIn("Hi###", out.getvalue())
+
+    def test_pixel_renderer_draws_logical_coordinates_at_low_res(self):
+        small = pygame.Surface((5 * 8, 3 * 8))
+        renderer = make_renderer("pygame", small, tile=8)
+        self.assertIsInstance(renderer, PixelRenderer)
+        self.assertEqual(renderer.size, self.surface.get_size())
+        sprite = pygame.Surface((TILE_SIZE, TILE_SIZE))
+        sprite.fill((255, 0, 0))
+        renderer.draw_sprites(sprite, [(TILE_SIZE, 0), (2 * TILE_SIZE, TILE_SIZE)])
+        self.assertEqual(renderer.sprite(sprite).get_size(), (8, 8))
+        self.assertEqual(tuple(small.get_at((8, 0)))[:3], (255, 0, 0))
+        self.assertEqual(tuple(small.get_at((16 + 7, 8 + 7)))[:3], (255, 0, 0))
+        self.assertEqual(tuple(small.get_at((0, 0)))[:3], (0, 0, 0))
+
+    def test_pixel_tile_only_for_pygame_and_divisors(self):
+        with self.assertRaises(ValueError):
+            make_renderer("ascii", self.surface, tile=16)
+        with self.assertRaises(ValueError):
+            PixelRenderer(self.surface, tile=12)
+
+
+if __name__ == "__main__":
+    unittest.main()
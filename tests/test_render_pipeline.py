@@ -0,0 +1,48 @@
+import threading
+import unittest
+
+from core.render_pipeline import FramePresenter
+
+
+class FramePresenterTest(unittest.TestCase):
+    def test_submit_returns_previous_frame_scaled_off_main_thread(self):
+        threads = []
+
+        def scale(frame):
+            threads.append(threading.current_thread())
+            return ("escalado", frame)
+
+        presenter = FramePresenter(scale)
+        try:
+            self.assertIsNone(presenter.submit(1))
+            self.assertEqual(presenter.submit(2), ("escalado", 1))
+            presenter.wait_idle()
+            self.assertEqual(presenter.submit(3), ("escalado", 2))
+        finally:
+            presenter.stop()
+        self.assertEqual(len(threads), 3)
+        self.assertNotIn(threading.main_thread(), threads)
+
+    def test_stop_drains_pending_frame_and_joins(self):
+        scaled = []
+        presenter = FramePresenter(scaled.append)
+        presenter.submit("frame")
+        presenter.stop()
+        self.assertEqual(scaled, ["frame"])
+        self.assertFalse(presenter._thread.is_alive())
+
+    def test_worker_error_is_raised_on_next_submit(self):
+        def scale(frame):
+            raise ValueError(frame)
+
+        presenter = FramePresenter(scale)
+        try:
+            presenter.submit("roto")
+            with self.assertRaises(ValueError):
+                presenter.submit("otro")
+        finally:
+            presenter.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
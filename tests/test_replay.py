@@ -0,0 +1,93 @@
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+import pygame
+
+from core.replay import Session, SessionPlayer, SessionRecorder
+from core.video_export import PngSequenceWriter, export_session, frame_path, png_bytes
+
+
+class FakePacman:
+    def __init__(self):
+        self.next_dir_x = self.next_dir_y = 0
+        self.turns = []
+
+    def request_turn(self, dx, dy, name, stamp=None):
+        self.next_dir_x, self.next_dir_y = dx, dy
+        self.turns.append(name)
+
+
+def fake_game():
+    return SimpleNamespace(pacman=FakePacman(), session_seed=7, difficulty_name="NORMAL",
+                           level_file="levels/maps/level1.txt")
+
+
+class ReplayTest(unittest.TestCase):
+    def test_session_round_trip(self):
+        session = Session(7, "NORMAL", "levels/maps/level1.txt", ticks=90, inputs=[(0, 1), (40, 3)])
+        self.assertEqual(Session.from_dict(session.to_dict()), session)
+        with self.assertRaises(ValueError):
+            Session.from_dict(dict(session.to_dict(), version=0))
+
+    def test_recorder_keeps_only_changes_and_player_replays_them(self):
+        game = fake_game()
+        recorder = SessionRecorder()
+        recorder.begin(game)
+        for tick, turn in enumerate([(-1, 0), (-1, 0), (0, -1), (0, -1), (1, 0)]):
+            game.pacman.next_dir_x, game.pacman.next_dir_y = turn
+            recorder.on_tick(game, tick)
+        self.assertEqual(recorder.session.inputs, [(0, 1), (2, 3), (4, 2)])
+        self.assertEqual(recorder.session.ticks, 5)
+
+        replay = fake_game()
+        player = SessionPlayer(recorder.session)
+        player.begin(replay)
+        for tick in range(5):
+            player.on_tick(replay, tick)
+        self.assertEqual(replay.pacman.turns, ["left", "up", "right"])
+
+    def test_png_bytes_decodes_to_same_pixels(self):
+        surface = pygame.Surface((5, 3))
+        surface.fill((10, 20, 30))
+        surface.set_at((4, 2), (255, 0, 128))
+        data = pygame.image.tobytes(surface, "RGB")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "frame.png")
+            with open(path, "wb") as f:
+                f.write(png_bytes(data, (5, 3)))
+            loaded = pygame.image.load(path)
+            self.assertEqual(pygame.image.tobytes(loaded, "RGB"), data)
+
+    def test_single_worker_png_writer_encodes_inline(self):
+        surface = pygame.Surface((4, 2))
+        surface.fill((200, 100, 0))
+        data = pygame.image.tobytes(surface, PngSequenceWriter.PIXEL_FORMAT)
+        with tempfile.TemporaryDirectory() as tmp:
+            writer = PngSequenceWriter(tmp, workers=1)
+            self.assertIsNone(writer.pool)
+            writer.write(data, (4, 2))
+            writer.write(data, (4, 2))
+            writer.close()
+            self.assertEqual(writer.frames, 2)
+            loaded = pygame.image.load(frame_path(tmp, 1))
+            self.assertEqual(pygame.image.tobytes(loaded, "RGB"), data)
+
+    def test_export_uses_requested_pixel_tile_and_level(self):
+        from core.headless import use_dummy_drivers
+        from levels.level_loader import load_level_file
+
+        use_dummy_drivers()
+        level_file = "levels/maps/level2.json"
+        tiles = load_level_file(level_file)["tiles"]
+        session = Session(7, "NORMAL", "levels/maps/level1.json", ticks=3)
+        with tempfile.TemporaryDirectory() as tmp:
+            stats = export_session(session, tmp, workers=1, pixel_tile=8, level_file=level_file)
+            self.assertEqual(stats["size"], (len(tiles[0]) * 8, len(tiles) * 8))
+            loaded = pygame.image.load(frame_path(tmp, 0))
+            self.assertEqual(loaded.get_size(), stats["size"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import time
+import unittest
+
+from core.sampling_profiler import SamplingProfiler, collapse, subsystem_totals
+
+
+def busy_loop(seconds):
+    end = time.process_time() + seconds
+    total = 0
+    while time.process_time() < end:
+        total += 1
+    return total
+
+
+class SamplingProfilerTest(unittest.TestCase):
+    def test_collapse_orders_by_count(self):
+        stacks = {("run (main.py)", "draw (a.py)"): 2, ("run (main.py)",): 5}
+        self.assertEqual(collapse(stacks), ["run (main.py) 5", "run (main.py);draw (a.py) 2"])
+
+    def test_subsystem_totals_are_inclusive(self):
+        stacks = {
+            ("Game.run (core/game.py)", "Game.render (core/game.py)", "Level.draw (levels/level.py)"): 3,
+            ("Game.run (core/game.py)", "Game.render (core/game.py)"): 1,
+            ("Game.run (core/game.py)", "Ghost.update (entities/ghost.py)"): 2,
+        }
+        totals = subsystem_totals(stacks, ("Game.render", "Level.draw", "Ghost.update"))
+        self.assertEqual(totals, {"Game.render": 4, "Level.draw": 3, "Ghost.update": 2})
+
+    def test_samples_attribute_to_running_function(self):
+        profiler = SamplingProfiler(interval=0.002).start()
+        try:
+            busy_loop(0.15)
+        finally:
+            profiler.stop()
+        self.assertFalse(profiler.running)
+        self.assertGreater(profiler.samples, 0)
+        hits = sum(n for stack, n in profiler.stacks().items()
+                   if any(label.startswith("busy_loop ") for label in stack))
+        self.assertGreater(hits, profiler.samples // 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
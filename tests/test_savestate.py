@@ -0,0 +1,70 @@
+import os
+import random
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from core.game import Game
+from core.savestate import restore, snapshot
+
+
+def trace(game, ticks):
+    out = []
+    for _ in range(ticks):
+        game.update(1 / 60)
+        out.append((
+            round(game.pacman.x, 6), round(game.pacman.y, 6), game.hud.score,
+            tuple((round(g.x, 6), round(g.y, 6), int(g.state)) for g in game.ghosts),
+            len(game.level.pellets),
+        ))
+    return out
+
+
+class SaveStateTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.game = Game()
+        cls.game.wait_until_loaded()
+
+    def test_restore_replays_identically(self):
+        game = self.game
+        random.seed(3)
+        game.start_game_with_difficulty("NORMAL")
+        game.pacman.request_turn(-1, 0, "left")
+        trace(game, 120)
+
+        save = snapshot(game)
+        tiles = game.level.tiles
+        first = trace(game, 240)
+        self.assertNotEqual(first[0], first[-1])
+
+        restore(game, save)
+        self.assertIs(game.level.tiles, tiles)
+        self.assertEqual(trace(game, 240), first)
+
+    def test_multiplied_score_and_dying_state_round_trip(self):
+        from powerups.score_multiplier import ScoreMultiplier
+
+        game = self.game
+        game.start_game_with_difficulty("NORMAL")
+        game.pacman.add_effect(ScoreMultiplier())
+        game.award_points(game.pacman, 10 * game.pacman.score_multiplier)
+        game.state, game.dying_ticks = "DYING", 5
+        save = snapshot(game)
+
+        game.state, game.dying_ticks = "GAME", 0
+        game.hud.score = 0
+        restore(game, save)
+        self.assertEqual((game.state, game.dying_ticks, game.hud.score), ("DYING", 5, 20))
+
+    def test_snapshot_is_compact_and_shares_tiles(self):
+        game = self.game
+        game.start_game_with_difficulty("NORMAL")
+        save = snapshot(game, include_rng=False)
+        self.assertIs(save.tiles, game.level.tiles)
+        self.assertLess(len(save), 1024)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from core.scheduler import Scheduler
+from entities.ghost import Ghost
+from entities.pacman import Pacman
+from entities.store import GhostState
+from powerups.speed_boost import SpeedBoost
+
+
+class SchedulerTest(unittest.TestCase):
+    def test_fires_in_deadline_order_only_when_due(self):
+        sched = Scheduler()
+        fired = []
+        sched.schedule(2.0, fired.append, "b")
+        sched.schedule(1.0, fired.append, "a")
+        sched.schedule(1.0, fired.append, "a2")
+
+        self.assertEqual(sched.advance(0.5), 0)
+        self.assertEqual(sched.advance(0.5), 2)
+        self.assertEqual(fired, ["a", "a2"])
+        sched.advance(1.0)
+        self.assertEqual(fired, ["a", "a2", "b"])
+        self.assertEqual(len(sched), 0)
+
+    def test_cancelled_timers_never_fire(self):
+        sched = Scheduler()
+        fired = []
+        timer = sched.schedule(1.0, fired.append, "x")
+        timer.cancel()
+        sched.advance(5.0)
+        self.assertEqual(fired, [])
+        self.assertEqual(timer.remaining, 0.0)
+
+    def test_pause_keeps_remaining_time(self):
+        sched = Scheduler()
+        fired = []
+        timer = sched.schedule(3.0, fired.append, "x")
+        sched.advance(1.0)
+        paused = sched.pause(timer)
+        sched.advance(10.0)
+        self.assertEqual(fired, [])
+        self.assertAlmostEqual(paused.remaining, 2.0)
+
+        sched.resume(paused)
+        sched.advance(1.9)
+        self.assertEqual(fired, [])
+        sched.advance(0.2)
+        self.assertEqual(fired, ["x"])
+
+
+class StackedEffectsTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.display.quit()
+
+    def test_older_speed_boost_does_not_cancel_newer_one(self):
+        sched = Scheduler()
+        pacman = Pacman(48, 48, scheduler=sched)
+
+        pacman.add_effect(SpeedBoost())
+        sched.advance(3.0)
+        pacman.add_effect(SpeedBoost())
+
+        sched.advance(3.5)  # vence el primero; el segundo sigue activo
+        self.assertEqual(pacman.speed_multiplier, 1.8)
+        self.assertEqual(len(pacman.effects), 1)
+
+        sched.advance(3.0)
+        self.assertEqual(pacman.speed_multiplier, 1.0)
+        self.assertEqual(pacman.effects, [])
+
+    def test_fright_started_while_frozen_waits_for_thaw(self):
+        sched = Scheduler()
+        ghost = Ghost(48, 48, level=None, scheduler=sched)
+        ghost.set_frozen(True)
+        ghost.enter_fright()
+
+        sched.advance(10.0)  # congelado: el fright no corre
+        self.assertEqual(ghost.state, GhostState.FRIGHT)
+
+        ghost.set_frozen(False)
+        sched.advance(ghost.fright_duration - 0.1)
+        self.assertEqual(ghost.state, GhostState.BLINK)
+        sched.advance(0.2)
+        self.assertEqual(ghost.state, GhostState.NORMAL)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+from dataclasses import replace
+
+from core.soak import SoakSample, SoakThresholds, check_growth
+
+LIMITS = SoakThresholds(rss_growth_mb=10.0, traced_growth_mb=5.0, surface_growth=20, frame_drift_pct=50.0)
+BASELINE = SoakSample(elapsed_s=60.0, rss_mb=100.0, traced_mb=20.0, surfaces=50, frame_ms=2.0, games=1)
+
+
+def later(**changes):
+    return replace(BASELINE, elapsed_s=3600.0, games=40, **changes)
+
+
+class CheckGrowthTest(unittest.TestCase):
+    def test_growth_within_limits_passes(self):
+        sample = later(rss_mb=110.0, traced_mb=25.0, surfaces=70, frame_ms=3.0)
+        self.assertEqual(check_growth(BASELINE, sample, LIMITS), [])
+
+    def test_each_threshold_fails_on_its_own(self):
+        cases = {
+            "RSS": later(rss_mb=110.5),
+            "heap": later(traced_mb=25.5),
+            "Surfaces": later(surfaces=71),
+            "frame": later(frame_ms=3.1),
+        }
+        for word, sample in cases.items():
+            with self.subTest(word):
+                failures = check_growth(BASELINE, sample, LIMITS)
+                self.assertEqual(len(failures), 1)
+                self.assertIn(word, failures[0])
+
+    def test_all_thresholds_reported_together(self):
+        sample = later(rss_mb=200.0, traced_mb=40.0, surfaces=500, frame_ms=10.0)
+        self.assertEqual(len(check_growth(BASELINE, sample, LIMITS)), 4)
+
+    def test_zero_frame_baseline_skips_drift(self):
+        baseline = replace(BASELINE, frame_ms=0.0)
+        self.assertEqual(check_growth(baseline, later(frame_ms=50.0), LIMITS), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+from types import SimpleNamespace
+
+from entities import swarm as swarm_module
+from entities.store import GhostState
+from entities.swarm import Swarm, cell_tables, flow_directions
+
+MAZE = (
+    "###########",
+    "#.........#",
+    "#.###.###.#",
+    "#.........#",
+    "#.###.###.#",
+    "#.........#",
+    "###########",
+)
+
+
+def fake_level():
+    return SimpleNamespace(tiles=MAZE, pacman_spawn=(1, 1))
+
+
+def run(swarm, ticks, target=(1, 1), fright_at=None):
+    for tick in range(ticks):
+        swarm.step(1 / 60, target)
+        if tick == fright_at:
+            swarm.frighten()
+
+
+class SwarmTest(unittest.TestCase):
+    def test_flow_points_one_step_closer(self):
+        graph, width, neighbors, _ = cell_tables(MAZE)
+        bfs = graph.distances_from((1, 1))
+        distance = [swarm_module.UNREACHABLE] * (width * len(MAZE))
+        for (c, r), d in bfs.items():
+            distance[r * width + c] = d
+        flow, flee = flow_directions(neighbors, distance)
+        self.assertEqual(flow[1 * width + 1], -1)
+        for (c, r), d in bfs.items():
+            cell = r * width + c
+            if d:
+                self.assertEqual(distance[neighbors[cell * 4 + flow[cell]]], d - 1)
+            around = [distance[n] for n in neighbors[cell * 4:cell * 4 + 4] if n >= 0]
+            self.assertEqual(distance[neighbors[cell * 4 + flee[cell]]], max(around))
+
+    def test_flow_recomputed_only_when_target_moves(self):
+        swarm = Swarm(fake_level(), 20, 4.0, use_numpy=False)
+        run(swarm, 60)
+        self.assertEqual(swarm.flow_updates, 1)
+        run(swarm, 60, target=(9, 5))
+        self.assertEqual(swarm.flow_updates, 2)
+
+    @unittest.skipIf(swarm_module.np is None, "sin NumPy")
+    def test_numpy_and_python_kernels_match(self):
+        fast = Swarm(fake_level(), 50, 6.0, use_numpy=True)
+        slow = Swarm(fake_level(), 50, 6.0, use_numpy=False)
+        for target in ((1, 1), (9, 5), (5, 3)):
+            run(fast, 200, target, fright_at=100)
+            run(slow, 200, target, fright_at=100)
+            self.assertEqual(fast.cell.tolist(), slow.cell)
+            self.assertEqual(fast.dir.tolist(), slow.dir)
+            self.assertEqual(fast.prog.tolist(), slow.prog)
+            self.assertEqual(fast.state.tolist(), [int(s) for s in slow.state])
+
+    def test_eaten_ghost_waits_and_reappears(self):
+        swarm = Swarm(fake_level(), 5, 4.0, use_numpy=False)
+        run(swarm, 30)
+        self.assertEqual(swarm.visible_count(), 5)
+        swarm.frighten()
+        self.assertTrue(swarm.any_frightened())
+        swarm.eat(0)
+        self.assertEqual(swarm.state[0], GhostState.HOUSE)
+        run(swarm, round(swarm_module.RESPAWN_DELAY * 60) + 1)
+        self.assertEqual(swarm.visible_count(), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
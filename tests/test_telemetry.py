@@ -0,0 +1,41 @@
+import json
+import os
+import tempfile
+import unittest
+
+from core.telemetry import Telemetry
+
+
+class TelemetryTest(unittest.TestCase):
+    def test_overflow_is_counted_and_reported(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "events.jsonl")
+            telemetry = Telemetry(capacity=4, flush_interval=60)
+            telemetry.start(path)
+            for i in range(10):
+                telemetry.emit("pellet", i, 1)
+            telemetry.stop()
+
+            self.assertEqual(telemetry.emitted, 4)
+            self.assertEqual(telemetry.dropped, 6)
+            with open(path, encoding="utf-8") as f:
+                events = [json.loads(line) for line in f]
+            self.assertEqual([e["col"] for e in events[:4]], [0, 1, 2, 3])
+            self.assertEqual(events[-1], {"t": events[-1]["t"], "event": "telemetry_dropped", "count": 6})
+
+    def test_rotates_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "events.jsonl")
+            telemetry = Telemetry(max_bytes=200, backups=2, flush_interval=0.01)
+            telemetry.start(path)
+            for i in range(40):
+                telemetry.emit("level", i)
+                telemetry._wake.set()
+            telemetry.stop()
+
+            self.assertTrue(os.path.exists(path + ".1"))
+            self.assertFalse(os.path.exists(path + ".3"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,6 +6,7 @@ class HUD:
         self.score = 0
         self.lives = 3
         self.ghost_combo = 0  # Combo de fantasmas comidos en invencibilidad
+        self.quality = None   # Nivel de calidad actual (lo pone Game)
 
     def add_score(self, amount):
         self.score += amount
@@ -29,3 +30,5 @@ class HUD:
     def draw(self, renderer):
         renderer.draw_text(f"Score: {self.score}", 10, 10, WHITE, 24)
         renderer.draw_text(f"Lives: {self.lives}", 690, 10, WHITE, 24)
+        if self.quality is not None:
+            renderer.draw_text(f"Q: {self.quality}", 380, 10, WHITE, 18)
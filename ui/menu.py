@@ -16,6 +16,12 @@ def cycle_option(current: int, delta: int, size: int) -> int:
     return (current + delta) % size
 
 
+def next_difficulty(current: str, names: List[str]) -> str:
+    """Funcion pura: la dificultad que sigue a `current` (vuelve a la primera)."""
+    index = names.index(current) if current in names else -1
+    return names[cycle_option(index, 1, len(names))]
+
+
 def reduce_menu_selection(selected: int, action: str, options: List[str]) -> int:
     """Reducer puro para mover la selección según la acción declarativa."""
     deltas = {"UP": -1, "DOWN": 1}
@@ -32,7 +38,7 @@ class MenuHint:
 @dataclass(frozen=True)
 class MenuItem:
     label: str
-    action: str  # start | help | credits | config | exit
+    action: str  # start | difficulty | help | credits | config | exit
 
 
 class Menu:
@@ -40,12 +46,17 @@ class Menu:
         self.title = "PAC-MAN"
         self.items = [
             MenuItem("Iniciar Juego", "start"),
+            MenuItem("Dificultad", "difficulty"),
             MenuItem("Ayuda", "help"),
             MenuItem("Creditos", "credits"),
             MenuItem("Configuracion", "config"),
             MenuItem("Salir", "exit"),
         ]
         self.selected = 0
+        # Récords: cache en memoria de core.highscores (lo asigna Game)
+        self.high_scores = None
+        self.difficulty = "NORMAL"
+        self.last_score = 0
         self.hints = [
             MenuHint("UP / DOWN / W / S", "Mover"),
             MenuHint("ENTER", "Seleccionar"),
@@ -63,23 +74,31 @@ class Menu:
     def get_selected_action(self):
         return self.items[self.selected].action
 
+    def cycle_difficulty(self, names):
+        self.difficulty = next_difficulty(self.difficulty, list(names))
+
+    def item_label(self, item):
+        if item.action == "difficulty":
+            return f"{item.label}: {self.difficulty}"
+        return item.label
+
+    def best_score(self):
+        return self.high_scores.best(self.difficulty) if self.high_scores is not None else 0
+
     def draw(self, renderer):
-        screen = renderer.screen
-        width, _ = screen.get_size()
+        width, _ = renderer.size
         center_x = width // 2
 
         def draw_center(text, y, color, size):
-            font = pygame.font.SysFont(None, size, bold=True)
-            surf = font.render(text, True, color)
-            rect = surf.get_rect(center=(center_x, y))
-            screen.blit(surf, rect)
+            renderer.draw_text_centered(text, center_x, y, color, size, bold=True)
 
         # Top score bar
-        draw_center("1UP   00      HI-SCORE  10000      2UP   00", 50, WHITE, 24)
+        best = self.best_score()
+        draw_center(f"1UP   {int(self.last_score):02d}      HI-SCORE  {int(best)}      2UP   00", 50, WHITE, 24)
 
         # Logo panel
         logo_rect = pygame.Rect(center_x - 200, 90, 400, 100)
-        pygame.draw.rect(screen, (255, 170, 200), logo_rect, border_radius=8)
+        renderer.fill_rect(logo_rect, (255, 170, 200), border_radius=8)
         draw_center(self.title, logo_rect.centery + 4, YELLOW, 52)
 
         # Menu options estilo lista principal
@@ -87,10 +106,10 @@ class Menu:
         for i, item in enumerate(self.items):
             color = YELLOW if i == self.selected else WHITE
             prefix = ">" if i == self.selected else " "
-            draw_center(f"{prefix} {item.label}", base_y + i * 40, color, 32)
+            draw_center(f"{prefix} {self.item_label(item)}", base_y + i * 40, color, 32)
 
         # Marca / puntuación
-        draw_center("HI-SCORE 5270", 430, WHITE, 20)
+        draw_center(f"HI-SCORE {int(best)} ({self.difficulty})", 480, WHITE, 20)
 
         # Hints
         for index, hint in enumerate(self.hints):